@@ -6,9 +6,11 @@ import functools
 import logging
 import random
 import secrets
+import sys
+import time
 import typing  # this can go away when Python 3.8 support is dropped
 from argparse import Namespace
-from collections import Counter, deque
+from collections import deque
 from collections.abc import Collection, MutableSequence
 from enum import IntEnum, IntFlag
 from typing import (AbstractSet, Any, Callable, ClassVar, Dict, Iterable, Iterator, List, Mapping, NamedTuple,
@@ -50,6 +52,112 @@ class ThreadBarrierProxy:
                                "Please use multiworld.per_slot_randoms[player] or randomize ahead of output.")
 
 
+@functools.lru_cache(maxsize=None)
+def _get_memory_reader() -> Optional[Callable[[], int]]:
+    try:
+        import psutil
+    except ImportError:
+        pass
+    else:
+        # a new Process every time, as a cached one would keep reporting the parent after a fork
+        return lambda: psutil.Process().memory_info().rss
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    # ru_maxrss is in kilobytes, except on macOS where it is in bytes
+    scale = 1 if sys.platform == "darwin" else 1024
+    return lambda: resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def get_memory_use() -> Optional[int]:
+    """Bytes of memory used by this process. Without psutil this is the peak use so far, read from resource, and None
+    on platforms without that module."""
+    reader = _get_memory_reader()
+    return reader() if reader else None
+
+
+class GenerationTimings:
+    """Time spent per generation stage, and per world within the stages run through AutoWorld's call functions.
+    Memory use at the end of each stage and the growth of memory use during each world call are recorded as well,
+    see get_memory_use for where it is read from."""
+    stages: Dict[str, float]
+    """stage name -> seconds"""
+    worlds: Dict[str, Dict[str, float]]
+    """world method name -> world label -> seconds"""
+    memory: Dict[str, int]
+    """stage name -> bytes in use when the stage ended"""
+    world_memory: Dict[str, Dict[str, int]]
+    """world method name -> world label -> bytes memory use grew by"""
+    current_stage: Optional[str]
+    on_stage_done: Optional[Callable[["GenerationTimings"], None]]
+    """called after every finished stage, for example to store intermediate results"""
+
+    def __init__(self, on_stage_done: Optional[Callable[["GenerationTimings"], None]] = None) -> None:
+        self.stages = {}
+        self.worlds = collections.defaultdict(dict)
+        self.memory = {}
+        self.world_memory = collections.defaultdict(dict)
+        self.current_stage = None
+        self.on_stage_done = on_stage_done
+        self._stage_start = 0.0
+
+    def start_stage(self, name: str) -> None:
+        """Ends the current stage, if any, and starts timing the next one."""
+        self.finish()
+        self.current_stage = name
+        self._stage_start = time.perf_counter()
+
+    def finish(self) -> None:
+        """Ends the current stage."""
+        if self.current_stage is None:
+            return
+        self.stages[self.current_stage] = time.perf_counter() - self._stage_start
+        memory = get_memory_use()
+        if memory is not None:
+            self.memory[self.current_stage] = memory
+        self.current_stage = None
+        if self.on_stage_done:
+            try:
+                self.on_stage_done(self)
+            except Exception:
+                # timings are informational, they should never fail an otherwise good generation
+                logging.exception("Error handling finished generation stage timings.")
+
+    def add_world_time(self, method_name: str, label: str, taken: float, memory_growth: Optional[int] = None) -> None:
+        self.worlds[method_name][label] = self.worlds[method_name].get(label, 0.0) + taken
+        if memory_growth is not None:
+            self.world_memory[method_name][label] = self.world_memory[method_name].get(label, 0) + memory_growth
+
+    def slowest_worlds(self, count: int = 5) -> List[Tuple[str, str, float]]:
+        """Returns the slowest (method name, world label, seconds) entries."""
+        entries = [(method_name, label, taken) for method_name, labels in list(self.worlds.items())
+                   for label, taken in list(labels.items())]
+        return sorted(entries, key=lambda entry: entry[2], reverse=True)[:count]
+
+    def largest_world_memory(self, count: int = 5) -> List[Tuple[str, str, int]]:
+        """Returns the (method name, world label, bytes) entries that grew memory use the most."""
+        entries = [(method_name, label, growth) for method_name, labels in list(self.world_memory.items())
+                   for label, growth in list(labels.items()) if growth]
+        return sorted(entries, key=lambda entry: entry[2], reverse=True)[:count]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON compatible report. A stage that is still running is included with its time so far."""
+        stages = dict(self.stages)
+        current_stage = self.current_stage
+        if current_stage is not None:
+            stages[current_stage] = time.perf_counter() - self._stage_start
+        return {
+            "stages": stages,
+            "current_stage": current_stage,
+            "memory": dict(self.memory),
+            "worlds": {method_name: dict(labels) for method_name, labels in list(self.worlds.items())},
+            "slowest_worlds": self.slowest_worlds(),
+            "world_memory": {method_name: dict(labels) for method_name, labels in list(self.world_memory.items())},
+            "largest_world_memory": self.largest_world_memory(),
+        }
+
+
 class HasNameAndPlayer(Protocol):
     name: str
     player: int
@@ -77,6 +185,10 @@ class MultiWorld():
     progression_balancing: Dict[int, Options.ProgressionBalancing]
     completion_condition: Dict[int, Callable[[CollectionState], bool]]
     indirect_connections: Dict[Region, Set[Entrance]]
+    item_indices: Dict[int, ItemIndex]
+    region_indices: Dict[int, StateIndex]
+    entrance_indices: Dict[int, StateIndex]
+    location_index: StateIndex
     exclude_locations: Dict[int, Options.ExcludeLocations]
     priority_locations: Dict[int, Options.PriorityLocations]
     start_inventory: Dict[int, Options.StartInventory]
@@ -160,7 +272,12 @@ class MultiWorld():
         self.early_items = {player: {} for player in self.player_ids}
         self.local_early_items = {player: {} for player in self.player_ids}
         self.indirect_connections = {}
+        self.item_indices = {}
+        self.region_indices = collections.defaultdict(StateIndex)
+        self.entrance_indices = collections.defaultdict(StateIndex)
+        self.location_index = StateIndex()
         self.start_inventory_from_pool: Dict[int, Options.StartInventoryPool] = {}
+        self.timings = GenerationTimings()
 
         for player in range(1, players + 1):
             def set_player_attr(attr: str, val) -> None:
@@ -178,6 +295,13 @@ class MultiWorld():
     def get_all_ids(self) -> Tuple[int, ...]:
         return self.player_ids + tuple(self.groups)
 
+    def get_item_index(self, player: int) -> ItemIndex:
+        """Returns the table interning the item names of player, used by the index methods of CollectionState."""
+        item_index = self.item_indices.get(player)
+        if item_index is None:
+            item_index = self.item_indices[player] = ItemIndex()
+        return item_index
+
     def add_group(self, name: str, game: str, players: AbstractSet[int] = frozenset()) -> Tuple[int, Group]:
         """Create a group with name and return the assigned player ID and group.
         If a group of this name already exists, the set of players is extended instead of creating a new one."""
@@ -665,26 +789,277 @@ class MultiWorld():
 PathValue = Tuple[str, Optional["PathValue"]]
 
 
+class ItemIndex(Dict[str, int]):
+    """Interns the item names of one player to small integers, which index into that player's ItemCounts.
+    Names are only added once they are counted or an index is requested for them, so the indices stay dense.
+    Index 0 is never assigned, it is used for names that were not interned and always has a count of 0."""
+    names: List[str]
+    group_indices: Dict[str, Tuple[int, ...]]
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.names = [""]
+        self.group_indices = {}
+
+    def intern(self, name: str) -> int:
+        index = self.get(name)
+        if index is None:
+            index = self[name] = len(self.names)
+            self.names.append(name)
+        return index
+
+    def intern_all(self, names: Iterable[str]) -> Tuple[int, ...]:
+        return tuple(self.intern(name) for name in names)
+
+
+class ItemCounts(typing.MutableMapping[str, int]):
+    """Item counts of one player in a CollectionState, stored in a list indexed by the player's ItemIndex.
+    Behaves like the Counter it replaces: item names that were not counted have a count of 0.
+    The list can be shorter than the ItemIndex, as other states may have interned names since it was created."""
+    __slots__ = ("item_index", "counts")
+    item_index: ItemIndex
+    counts: List[int]
+
+    def __init__(self, item_index: ItemIndex, counts: Optional[List[int]] = None) -> None:
+        self.item_index = item_index
+        self.counts = [0] if counts is None else counts
+
+    def __getitem__(self, name: str) -> int:
+        try:
+            return self.counts[self.item_index.get(name, 0)]
+        except IndexError:
+            return 0
+
+    def __setitem__(self, name: str, count: int) -> None:
+        self.set_index(self.item_index.intern(name), count)
+
+    def __delitem__(self, name: str) -> None:
+        # like Counter, deleting a name that was not counted is not an error
+        index = self.item_index.get(name, 0)
+        if index and index < len(self.counts):
+            self.counts[index] = 0
+
+    def __contains__(self, name: object) -> bool:
+        return bool(self[name]) if isinstance(name, str) else False
+
+    def __iter__(self) -> Iterator[str]:
+        names = self.item_index.names
+        return (names[index] for index, count in enumerate(self.counts) if count)
+
+    def __len__(self) -> int:
+        return len(self.counts) - self.counts.count(0)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self.items())})"
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self[name] or default
+
+    def copy(self) -> ItemCounts:
+        return ItemCounts(self.item_index, self.counts.copy())
+
+    def add(self, name: str, count: int = 1) -> None:
+        self.add_index(self.item_index.intern(name), count)
+
+    def update(self, other: Any = (), /, **kwargs: int) -> None:
+        """Adds the counts of other like Counter.update, instead of replacing them."""
+        if isinstance(other, Mapping):
+            other = other.items()
+        else:
+            other = ((name, 1) for name in other)
+        for name, count in itertools.chain(other, kwargs.items()):
+            self.add(name, count)
+
+    def total(self) -> int:
+        return sum(self.counts)
+
+    def count_index(self, index: int) -> int:
+        """Returns the count of an index of the ItemIndex, which may be past the end of counts."""
+        counts = self.counts
+        return counts[index] if 0 <= index < len(counts) else 0
+
+    def set_index(self, index: int, count: int) -> None:
+        counts = self.counts
+        if index >= len(counts):
+            counts.extend(itertools.repeat(0, index + 1 - len(counts)))
+        counts[index] = count
+
+    def add_index(self, index: int, count: int = 1) -> None:
+        counts = self.counts
+        if index >= len(counts):
+            counts.extend(itertools.repeat(0, index + 1 - len(counts)))
+        counts[index] += count
+
+
+class StateIndex(List[Any]):
+    """Assigns dense indices to regions, entrances or locations, which index into the flags of StateSets.
+    Objects get their index the first time they are added to a StateSet of this StateIndex.
+    Index 0 is never assigned, it stands for objects that were not added yet."""
+
+    def __init__(self) -> None:
+        super().__init__((None,))
+
+    def register(self, obj: Union[Region, Entrance, Location]) -> int:
+        index = getattr(obj, "_state_index", 0)
+        if not index:
+            index = obj._state_index = len(self)
+            self.append(obj)
+        return index
+
+
+_T_Indexed = typing.TypeVar("_T_Indexed", "Region", "Entrance", "Location")
+
+
+class StateSet(typing.MutableSet[_T_Indexed]):
+    """A set of regions, entrances or locations of a CollectionState, stored as one flag byte per index of a StateIndex.
+    Copies are a single bytearray copy, and set operations between StateSets of the same StateIndex don't hash any
+    objects. Other set operations fall back to the regular Set methods and return a set."""
+    __slots__ = ("state_index", "flags")
+    state_index: StateIndex
+    flags: bytearray
+    """1 for each index in the set, can be shorter than the StateIndex"""
+
+    def __init__(self, state_index: StateIndex, flags: Optional[bytearray] = None) -> None:
+        self.state_index = state_index
+        self.flags = bytearray() if flags is None else flags
+
+    def __contains__(self, obj: object) -> bool:
+        index = getattr(obj, "_state_index", 0)
+        try:
+            return self.flags[index] == 1 and self.state_index[index] is obj
+        except IndexError:
+            return False
+
+    def __iter__(self) -> Iterator[_T_Indexed]:
+        flags = self.flags
+        state_index = self.state_index
+        index = flags.find(1)
+        while index != -1:
+            yield state_index[index]
+            index = flags.find(1, index + 1)
+
+    def __len__(self) -> int:
+        return self.flags.count(1)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({set(self)})"
+
+    @classmethod
+    def _from_iterable(cls, objects: Iterable[_T_Indexed]) -> Set[_T_Indexed]:
+        return set(objects)
+
+    def add(self, obj: _T_Indexed) -> None:
+        index = self.state_index.register(obj)
+        flags = self.flags
+        if index >= len(flags):
+            flags.extend(bytes(index + 1 - len(flags)))
+        flags[index] = 1
+
+    def discard(self, obj: _T_Indexed) -> None:
+        if obj in self:
+            self.flags[obj._state_index] = 0
+
+    def clear(self) -> None:
+        self.flags = bytearray()
+
+    def copy(self) -> StateSet[_T_Indexed]:
+        return StateSet(self.state_index, self.flags.copy())
+
+    def update(self, *others: Iterable[_T_Indexed]) -> None:
+        for other in others:
+            if self._same_index(other):
+                self.flags = self._combine(other, int.__or__)
+            else:
+                for obj in other:
+                    self.add(obj)
+
+    def _same_index(self, other: object) -> bool:
+        return isinstance(other, StateSet) and other.state_index is self.state_index
+
+    def _combine(self, other: StateSet[_T_Indexed], operator: Callable[[int, int], int]) -> bytearray:
+        # bitwise operations on whole flag arrays keep each byte at 0 or 1
+        size = max(len(self.flags), len(other.flags))
+        flags = operator(int.from_bytes(self.flags, "little"), int.from_bytes(other.flags, "little"))
+        return bytearray(flags.to_bytes(size, "little"))
+
+    def __or__(self, other: AbstractSet[Any]) -> AbstractSet[Any]:
+        if self._same_index(other):
+            return StateSet(self.state_index, self._combine(other, int.__or__))
+        return super().__or__(other)
+
+    def __and__(self, other: AbstractSet[Any]) -> AbstractSet[Any]:
+        if self._same_index(other):
+            return StateSet(self.state_index, self._combine(other, int.__and__))
+        return super().__and__(other)
+
+    def __sub__(self, other: AbstractSet[Any]) -> AbstractSet[Any]:
+        if self._same_index(other):
+            return StateSet(self.state_index, self._combine(other, lambda flags, other_flags: flags & ~other_flags))
+        return super().__sub__(other)
+
+    def __le__(self, other: AbstractSet[Any]) -> bool:
+        if self._same_index(other):
+            return not self._combine(other, lambda flags, other_flags: flags & ~other_flags).count(1)
+        return super().__le__(other)
+
+    def __ge__(self, other: AbstractSet[Any]) -> bool:
+        if self._same_index(other):
+            return other <= self
+        return super().__ge__(other)
+
+    def __eq__(self, other: object) -> bool:
+        if self._same_index(other):
+            return self.flags.rstrip(b"\0") == other.flags.rstrip(b"\0")
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def union(self, *others: Iterable[_T_Indexed]) -> AbstractSet[_T_Indexed]:
+        result: AbstractSet[_T_Indexed] = self.copy()
+        for other in others:
+            result = result | (other if isinstance(other, AbstractSet) else set(other))
+        return result
+
+    def intersection(self, *others: Iterable[_T_Indexed]) -> AbstractSet[_T_Indexed]:
+        result: AbstractSet[_T_Indexed] = self.copy()
+        for other in others:
+            result = result & (other if isinstance(other, AbstractSet) else set(other))
+        return result
+
+    def difference(self, *others: Iterable[_T_Indexed]) -> AbstractSet[_T_Indexed]:
+        result: AbstractSet[_T_Indexed] = self.copy()
+        for other in others:
+            result = result - (other if isinstance(other, AbstractSet) else set(other))
+        return result
+
+    def issubset(self, other: Iterable[Any]) -> bool:
+        return self <= (other if isinstance(other, AbstractSet) else set(other))
+
+    def issuperset(self, other: Iterable[Any]) -> bool:
+        return self >= (other if isinstance(other, AbstractSet) else set(other))
+
+
 class CollectionState():
-    prog_items: Dict[int, Counter[str]]
+    prog_items: Dict[int, ItemCounts]
     multiworld: MultiWorld
-    reachable_regions: Dict[int, Set[Region]]
-    blocked_connections: Dict[int, Set[Entrance]]
-    advancements: Set[Location]
+    reachable_regions: Dict[int, StateSet[Region]]
+    blocked_connections: Dict[int, StateSet[Entrance]]
+    advancements: StateSet[Location]
     path: Dict[Union[Region, Entrance], PathValue]
-    locations_checked: Set[Location]
+    locations_checked: StateSet[Location]
     stale: Dict[int, bool]
     additional_init_functions: List[Callable[[CollectionState, MultiWorld], None]] = []
     additional_copy_functions: List[Callable[[CollectionState, CollectionState], CollectionState]] = []
 
     def __init__(self, parent: MultiWorld):
-        self.prog_items = {player: Counter() for player in parent.get_all_ids()}
+        self.prog_items = {player: ItemCounts(parent.get_item_index(player)) for player in parent.get_all_ids()}
         self.multiworld = parent
-        self.reachable_regions = {player: set() for player in parent.get_all_ids()}
-        self.blocked_connections = {player: set() for player in parent.get_all_ids()}
-        self.advancements = set()
+        self.reachable_regions = {player: StateSet(parent.region_indices[player]) for player in parent.get_all_ids()}
+        self.blocked_connections = {player: StateSet(parent.entrance_indices[player])
+                                    for player in parent.get_all_ids()}
+        self.advancements = StateSet(parent.location_index)
         self.path = {}
-        self.locations_checked = set()
+        self.locations_checked = StateSet(parent.location_index)
         self.stale = {player: True for player in parent.get_all_ids()}
         for function in self.additional_init_functions:
             function(self, parent)
@@ -814,35 +1189,74 @@ class CollectionState():
                 assert isinstance(advancement.item, Item), "tried to collect Event with no Item"
                 self.collect(advancement.item, True, advancement)
 
+    def get_item_counts(self, player: int) -> ItemCounts:
+        """Returns the ItemCounts of player. Another mapping of item name to count assigned to prog_items[player], like
+        the Counter it used to hold, is copied into a new ItemCounts first."""
+        item_counts = self.prog_items[player]
+        if not isinstance(item_counts, ItemCounts):
+            if not isinstance(item_counts, Mapping):
+                raise TypeError(f"prog_items[{player}] has to be an ItemCounts or a mapping of item name to count, "
+                                f"not {type(item_counts).__name__}.")
+            converted = ItemCounts(self.multiworld.get_item_index(player))
+            converted.update(item_counts)
+            self.prog_items[player] = item_counts = converted
+        return item_counts
+
     # item name related
     def has(self, item: str, player: int, count: int = 1) -> bool:
-        return self.prog_items[player][item] >= count
+        item_counts = self.prog_items[player]
+        if type(item_counts) is not ItemCounts:
+            item_counts = self.get_item_counts(player)  # assigned as another mapping and not converted yet
+        try:
+            return item_counts.counts[item_counts.item_index.get(item, 0)] >= count
+        except IndexError:
+            return 0 >= count
 
     def has_all(self, items: Iterable[str], player: int) -> bool:
         """Returns True if each item name of items is in state at least once."""
-        return all(self.prog_items[player][item] for item in items)
+        item_counts = self.get_item_counts(player)
+        count_index = item_counts.count_index
+        item_index = item_counts.item_index
+        return all(count_index(item_index.get(item, 0)) for item in items)
 
     def has_any(self, items: Iterable[str], player: int) -> bool:
         """Returns True if at least one item name of items is in state at least once."""
-        return any(self.prog_items[player][item] for item in items)
+        item_counts = self.get_item_counts(player)
+        count_index = item_counts.count_index
+        item_index = item_counts.item_index
+        return any(count_index(item_index.get(item, 0)) for item in items)
 
     def has_all_counts(self, item_counts: Mapping[str, int], player: int) -> bool:
         """Returns True if each item name is in the state at least as many times as specified."""
-        return all(self.prog_items[player][item] >= count for item, count in item_counts.items())
+        player_item_counts = self.get_item_counts(player)
+        count_index = player_item_counts.count_index
+        item_index = player_item_counts.item_index
+        return all(count_index(item_index.get(item, 0)) >= count for item, count in item_counts.items())
 
     def has_any_count(self, item_counts: Mapping[str, int], player: int) -> bool:
         """Returns True if at least one item name is in the state at least as many times as specified."""
-        return any(self.prog_items[player][item] >= count for item, count in item_counts.items())
+        player_item_counts = self.get_item_counts(player)
+        count_index = player_item_counts.count_index
+        item_index = player_item_counts.item_index
+        return any(count_index(item_index.get(item, 0)) >= count for item, count in item_counts.items())
 
     def count(self, item: str, player: int) -> int:
-        return self.prog_items[player][item]
+        item_counts = self.prog_items[player]
+        if type(item_counts) is not ItemCounts:
+            item_counts = self.get_item_counts(player)
+        try:
+            return item_counts.counts[item_counts.item_index.get(item, 0)]
+        except IndexError:
+            return 0
 
     def has_from_list(self, items: Iterable[str], player: int, count: int) -> bool:
         """Returns True if the state contains at least `count` items matching any of the item names from a list."""
         found: int = 0
-        player_prog_items = self.prog_items[player]
+        item_counts = self.get_item_counts(player)
+        count_index = item_counts.count_index
+        item_index = item_counts.item_index
         for item_name in items:
-            found += player_prog_items[item_name]
+            found += count_index(item_index.get(item_name, 0))
             if found >= count:
                 return True
         return False
@@ -851,60 +1265,118 @@ class CollectionState():
         """Returns True if the state contains at least `count` items matching any of the item names from a list.
         Ignores duplicates of the same item."""
         found: int = 0
-        player_prog_items = self.prog_items[player]
+        item_counts = self.get_item_counts(player)
+        count_index = item_counts.count_index
+        item_index = item_counts.item_index
         for item_name in items:
-            found += player_prog_items[item_name] > 0
+            found += count_index(item_index.get(item_name, 0)) > 0
             if found >= count:
                 return True
         return False
 
     def count_from_list(self, items: Iterable[str], player: int) -> int:
         """Returns the cumulative count of items from a list present in state."""
-        return sum(self.prog_items[player][item_name] for item_name in items)
+        item_counts = self.get_item_counts(player)
+        count_index = item_counts.count_index
+        item_index = item_counts.item_index
+        return sum(count_index(item_index.get(item_name, 0)) for item_name in items)
 
     def count_from_list_unique(self, items: Iterable[str], player: int) -> int:
         """Returns the cumulative count of items from a list present in state. Ignores duplicates of the same item."""
-        return sum(self.prog_items[player][item_name] > 0 for item_name in items)
+        item_counts = self.get_item_counts(player)
+        count_index = item_counts.count_index
+        item_index = item_counts.item_index
+        return sum(count_index(item_index.get(item_name, 0)) > 0 for item_name in items)
 
     # item name group related
     def has_group(self, item_name_group: str, player: int, count: int = 1) -> bool:
         """Returns True if the state contains at least `count` items present in a specified item group."""
-        found: int = 0
-        player_prog_items = self.prog_items[player]
-        for item_name in self.multiworld.worlds[player].item_name_groups[item_name_group]:
-            found += player_prog_items[item_name]
-            if found >= count:
-                return True
-        return False
+        return self.has_from_indices(self._get_group_indices(item_name_group, player), player, count)
 
     def has_group_unique(self, item_name_group: str, player: int, count: int = 1) -> bool:
         """Returns True if the state contains at least `count` items present in a specified item group.
         Ignores duplicates of the same item.
         """
-        found: int = 0
-        player_prog_items = self.prog_items[player]
-        for item_name in self.multiworld.worlds[player].item_name_groups[item_name_group]:
-            found += player_prog_items[item_name] > 0
-            if found >= count:
-                return True
-        return False
+        return self.has_from_indices_unique(self._get_group_indices(item_name_group, player), player, count)
 
     def count_group(self, item_name_group: str, player: int) -> int:
         """Returns the cumulative count of items from an item group present in state."""
-        player_prog_items = self.prog_items[player]
-        return sum(
-            player_prog_items[item_name]
-            for item_name in self.multiworld.worlds[player].item_name_groups[item_name_group]
-        )
+        return self.count_indices(self._get_group_indices(item_name_group, player), player)
 
     def count_group_unique(self, item_name_group: str, player: int) -> int:
         """Returns the cumulative count of items from an item group present in state.
         Ignores duplicates of the same item."""
-        player_prog_items = self.prog_items[player]
-        return sum(
-            player_prog_items[item_name] > 0
-            for item_name in self.multiworld.worlds[player].item_name_groups[item_name_group]
-        )
+        return self.count_indices_unique(self._get_group_indices(item_name_group, player), player)
+
+    def _get_group_indices(self, item_name_group: str, player: int) -> Tuple[int, ...]:
+        # item name groups are fixed once rules run, so their indices are interned once per group
+        item_index = self.get_item_counts(player).item_index
+        group_indices = item_index.group_indices.get(item_name_group)
+        if group_indices is None:
+            group_indices = item_index.group_indices[item_name_group] = item_index.intern_all(
+                self.multiworld.worlds[player].item_name_groups[item_name_group])
+        return group_indices
+
+    # item index related, for indices from MultiWorld.get_item_index
+    def has_index(self, index: int, player: int, count: int = 1) -> bool:
+        item_counts = self.prog_items[player]
+        if type(item_counts) is not ItemCounts:
+            item_counts = self.get_item_counts(player)
+        try:
+            return item_counts.counts[index] >= count
+        except IndexError:
+            return 0 >= count
+
+    def has_all_indices(self, indices: Iterable[int], player: int) -> bool:
+        """Returns True if each item index of indices is in state at least once."""
+        count_index = self.get_item_counts(player).count_index
+        return all(count_index(index) for index in indices)
+
+    def has_any_indices(self, indices: Iterable[int], player: int) -> bool:
+        """Returns True if at least one item index of indices is in state at least once."""
+        count_index = self.get_item_counts(player).count_index
+        return any(count_index(index) for index in indices)
+
+    def count_index(self, index: int, player: int) -> int:
+        item_counts = self.prog_items[player]
+        if type(item_counts) is not ItemCounts:
+            item_counts = self.get_item_counts(player)
+        try:
+            return item_counts.counts[index]
+        except IndexError:
+            return 0
+
+    def has_from_indices(self, indices: Iterable[int], player: int, count: int) -> bool:
+        """Returns True if the state contains at least `count` items matching any of the item indices."""
+        found: int = 0
+        count_index = self.get_item_counts(player).count_index
+        for index in indices:
+            found += count_index(index)
+            if found >= count:
+                return True
+        return False
+
+    def has_from_indices_unique(self, indices: Iterable[int], player: int, count: int) -> bool:
+        """Returns True if the state contains at least `count` items matching any of the item indices.
+        Ignores duplicates of the same item."""
+        found: int = 0
+        count_index = self.get_item_counts(player).count_index
+        for index in indices:
+            found += count_index(index) > 0
+            if found >= count:
+                return True
+        return False
+
+    def count_indices(self, indices: Iterable[int], player: int) -> int:
+        """Returns the cumulative count of items from the item indices present in state."""
+        count_index = self.get_item_counts(player).count_index
+        return sum(count_index(index) for index in indices)
+
+    def count_indices_unique(self, indices: Iterable[int], player: int) -> int:
+        """Returns the cumulative count of items from the item indices present in state.
+        Ignores duplicates of the same item."""
+        count_index = self.get_item_counts(player).count_index
+        return sum(count_index(index) > 0 for index in indices)
 
     # Item related
     def collect(self, item: Item, prevent_sweep: bool = False, location: Optional[Location] = None) -> bool:
@@ -924,26 +1396,57 @@ class CollectionState():
         changed = self.multiworld.worlds[item.player].remove(self, item)
         if changed:
             # invalidate caches, nothing can be trusted anymore now
-            self.reachable_regions[item.player] = set()
-            self.blocked_connections[item.player] = set()
+            self.reachable_regions[item.player].clear()
+            self.blocked_connections[item.player].clear()
             self.stale[item.player] = True
 
 
+def _get_slot_defaults(cls: type, base: type) -> Tuple[Tuple[str, Any], ...]:
+    """Returns the slot defaults of base that cls does not override with a class attribute of its own."""
+    return tuple((name, default) for name, default in base._slot_defaults if getattr(cls, name) is getattr(base, name))
+
+
+def default_access_rule(state: CollectionState) -> bool:
+    """The access rule of Locations and Entrances that were not given one, which always allows access.
+    Compare `access_rule` against this to check whether a rule was set."""
+    return True
+
+
 class Entrance:
-    access_rule: Callable[[CollectionState], bool] = staticmethod(lambda state: True)
-    hide_path: bool = False
+    # subclasses without __slots__ of their own get a __dict__ for their attributes, see "docs/world api.md"
+    __slots__ = ("access_rule", "hide_path", "player", "name", "parent_region", "connected_region", "addresses",
+                 "target", "_state_index")
+    access_rule: Callable[[CollectionState], bool]
+    hide_path: bool
     player: int
     name: str
     parent_region: Optional[Region]
-    connected_region: Optional[Region] = None
+    connected_region: Optional[Region]
     # LttP specific, TODO: should make a LttPEntrance
-    addresses = None
-    target = None
+    addresses: Any
+    target: Any
+    _state_index: int
+    """index in the player's StateIndex of entrances, 0 until it is first added to a StateSet"""
+    _slot_defaults: ClassVar[Tuple[Tuple[str, Any], ...]] = (
+        ("access_rule", default_access_rule),
+        ("hide_path", False),
+        ("connected_region", None),
+        ("addresses", None),
+        ("target", None),
+    )
+    """defaults for slots, which can't have class attributes of the same name"""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._slot_defaults = _get_slot_defaults(cls, Entrance)
 
     def __init__(self, player: int, name: str = "", parent: Optional[Region] = None) -> None:
+        for attribute, default in self._slot_defaults:
+            setattr(self, attribute, default)
         self.name = name
         self.parent_region = parent
         self.player = player
+        self._state_index = 0
 
     def can_reach(self, state: CollectionState) -> bool:
         if self.parent_region.can_reach(state) and self.access_rule(state):
@@ -965,6 +1468,8 @@ class Entrance:
 
 
 class Region:
+    # subclasses without __slots__ of their own get a __dict__ for their attributes, see "docs/world api.md"
+    __slots__ = ("name", "_hint_text", "player", "multiworld", "entrances", "_exits", "_locations", "_state_index")
     name: str
     _hint_text: str
     player: int
@@ -972,6 +1477,8 @@ class Region:
     entrances: List[Entrance]
     exits: List[Entrance]
     locations: List[Location]
+    _state_index: int
+    """index in the player's StateIndex of regions, 0 until it is first added to a StateSet"""
     entrance_type: ClassVar[Type[Entrance]] = Entrance
 
     class Register(MutableSequence):
@@ -1032,6 +1539,7 @@ class Region:
         self.multiworld = multiworld
         self._hint_text = hint
         self.player = player
+        self._state_index = 0
 
     def get_locations(self):
         return self._locations
@@ -1058,7 +1566,11 @@ class Region:
     def can_reach(self, state: CollectionState) -> bool:
         if state.stale[self.player]:
             state.update_reachable_regions(self.player)
-        return self in state.reachable_regions[self.player]
+        # inlined StateSet.__contains__, as the region belongs to the player's StateIndex
+        try:
+            return state.reachable_regions[self.player].flags[self._state_index] == 1
+        except IndexError:
+            return False
 
     @property
     def hint_text(self) -> str:
@@ -1135,24 +1647,46 @@ class LocationProgressType(IntEnum):
 
 
 class Location:
+    # subclasses without __slots__ of their own get a __dict__ for their attributes, see "docs/world api.md"
+    __slots__ = ("player", "name", "address", "parent_region", "locked", "show_in_spoiler", "progress_type",
+                 "always_allow", "access_rule", "item_rule", "item", "_state_index")
     game: str = "Generic"
     player: int
     name: str
     address: Optional[int]
     parent_region: Optional[Region]
-    locked: bool = False
-    show_in_spoiler: bool = True
-    progress_type: LocationProgressType = LocationProgressType.DEFAULT
-    always_allow: Callable[[CollectionState, Item], bool] = staticmethod(lambda state, item: False)
-    access_rule: Callable[[CollectionState], bool] = staticmethod(lambda state: True)
-    item_rule: Callable[[Item], bool] = staticmethod(lambda item: True)
-    item: Optional[Item] = None
+    locked: bool
+    show_in_spoiler: bool
+    progress_type: LocationProgressType
+    always_allow: Callable[[CollectionState, Item], bool]
+    access_rule: Callable[[CollectionState], bool]
+    item_rule: Callable[[Item], bool]
+    item: Optional[Item]
+    _state_index: int
+    """index in the multiworld's StateIndex of locations, 0 until it is first added to a StateSet"""
+    _slot_defaults: ClassVar[Tuple[Tuple[str, Any], ...]] = (
+        ("locked", False),
+        ("show_in_spoiler", True),
+        ("progress_type", LocationProgressType.DEFAULT),
+        ("always_allow", lambda state, item: False),
+        ("access_rule", default_access_rule),
+        ("item_rule", lambda item: True),
+        ("item", None),
+    )
+    """defaults for slots, which can't have class attributes of the same name"""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._slot_defaults = _get_slot_defaults(cls, Location)
 
     def __init__(self, player: int, name: str = '', address: Optional[int] = None, parent: Optional[Region] = None):
+        for attribute, default in self._slot_defaults:
+            setattr(self, attribute, default)
         self.player = player
         self.name = name
         self.address = address
         self.parent_region = parent
+        self._state_index = 0
 
     def can_fill(self, state: CollectionState, item: Item, check_access: bool = True) -> bool:
         return ((
@@ -1286,6 +1820,22 @@ class Item:
         return f"{self.name} (Player {self.player})"
 
 
+_python_state_methods: Dict[str, Callable[..., Any]] = {}
+"""The pure python CollectionState methods that were replaced by native ones from _speedups, by name."""
+
+if not typing.TYPE_CHECKING:  # type-check with pure python implementation
+    try:
+        # NetUtils already set up pyximport if _speedups isn't prebuilt
+        from _speedups import collection_state_methods
+    except ImportError:
+        pass  # NetUtils already warned about missing _speedups
+    else:
+        for _name, _method in collection_state_methods(Region, Entrance, Location, Item, ItemCounts).items():
+            _python_state_methods[_name] = getattr(CollectionState, _name)
+            setattr(CollectionState, _name, _method)
+        del _name, _method
+
+
 class EntranceInfo(TypedDict, total=False):
     player: int
     entrance: str
@@ -163,12 +163,102 @@ class ClientCommandProcessor(CommandProcessor):
             self.output("Unreadied.")
         async_start(self.ctx.send_msgs([{"cmd": "StatusUpdate", "status": state}]), name="send StatusUpdate")
 
+    def _cmd_filter(self, message_type: str = "") -> bool:
+        """Hide or show a type of server message in the log, like ItemSend, Hint or Chat.
+        Lists the types that can be filtered if not given one."""
+        if not self.ctx.ui:
+            self.output("Message filters are only available in the GUI.")
+            return False
+        types = {filterable.lower(): filterable for filterable in self.ctx.ui.filterable_message_types}
+        if message_type.lower() not in types:
+            hidden = self.ctx.ui.hidden_message_types
+            self.output("Message types: " + ", ".join(f"{filterable} ({'hidden' if filterable in hidden else 'shown'})"
+                                                      for filterable in self.ctx.ui.filterable_message_types))
+            return not message_type
+        message_type = types[message_type.lower()]
+        if self.ctx.ui.toggle_hidden_message_type(message_type):
+            self.output(f"Hiding {message_type} messages.")
+        else:
+            self.output(f"Showing {message_type} messages.")
+        return True
+
     def default(self, raw: str):
         raw = self.ctx.on_user_say(raw)
         if raw:
             async_start(self.ctx.send_msgs([{"cmd": "Say", "text": raw}]), name="send Say")
 
 
+class WatcherScheduler:
+    """Paces the game watcher loop of emulator clients.
+    Each poll reports a snapshot of the memory it read. While the snapshots stay the same, the wait between polls grows
+    from min_interval towards max_interval. A changed snapshot or a wakeup through the watcher event, like for incoming
+    items, resets it to min_interval, and so does activity() during a poll, like writing to the game."""
+    min_interval: float
+    max_interval: float
+    backoff: float
+    interval: float
+    """current wait between polls"""
+    polls: int
+    wakeups: int
+    history: typing.Deque[typing.Tuple[float, float]]
+    """(time since last poll, duration) of the recent polls"""
+
+    def __init__(self, min_interval: float, max_interval: float, backoff: float = 1.5) -> None:
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.interval = min_interval
+        self.polls = 0
+        self.wakeups = 0
+        self.history = collections.deque(maxlen=100)
+        self._snapshot: typing.Optional[typing.Hashable] = None
+        self._last_poll_start: typing.Optional[float] = None
+        self._poll_start = 0.
+        self._activity = False
+
+    async def wait(self, event: asyncio.Event) -> None:
+        """Waits for the next poll, which is either after the current interval or when event is set."""
+        try:
+            await asyncio.wait_for(event.wait(), self.interval)
+        except asyncio.TimeoutError:
+            pass
+        else:
+            self.wakeups += 1
+            self.activity()
+        event.clear()
+        self._poll_start = time.perf_counter()
+
+    def activity(self) -> None:
+        """Polls at min_interval again, for example after writing to the game.
+        Also keeps the next report() from backing off, even if the memory it read is unchanged."""
+        self.interval = self.min_interval
+        self._activity = True
+
+    def report(self, snapshot: typing.Optional[typing.Hashable]) -> None:
+        """Records a finished poll and adjusts the interval. A snapshot of None counts as a change."""
+        now = time.perf_counter()
+        self.polls += 1
+        since_last = now - self._last_poll_start if self._last_poll_start is not None else 0.
+        self.history.append((since_last, now - self._poll_start))
+        self._last_poll_start = self._poll_start
+        if snapshot is None or snapshot != self._snapshot or self._activity:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(max(self.interval, self.min_interval) * self.backoff,
+                                max(self.max_interval, self.min_interval))
+        self._snapshot = snapshot
+        self._activity = False
+
+    def get_stats(self) -> str:
+        intervals = [since_last for since_last, _ in self.history if since_last]
+        durations = [duration for _, duration in self.history]
+        poll_rate = len(intervals) / sum(intervals) if intervals else 0.
+        latency = sum(durations) / len(durations) if durations else 0.
+        return (f"{self.polls} polls, {self.wakeups} wakeups. Currently polling every {self.interval * 1000:.0f} ms "
+                f"({self.min_interval * 1000:.0f} to {self.max_interval * 1000:.0f} ms). "
+                f"Recently {poll_rate:.1f} polls per second, taking {latency * 1000:.1f} ms each.")
+
+
 class CommonContext:
     # Should be adjusted as needed in subclasses
     tags: typing.Set[str] = {"AP"}
@@ -183,7 +273,8 @@ class CommonContext:
             self.lookup_type: typing.Literal["item", "location"] = lookup_type
             self._unknown_item: typing.Callable[[int], str] = lambda key: f"Unknown {lookup_type} (ID: {key})"
             self._archipelago_lookup: typing.Dict[int, str] = {}
-            self._flat_store: typing.Dict[int, str] = Utils.KeyedDefaultDict(self._unknown_item)
+            self._indexes: typing.Dict[str, typing.Mapping[int, str]] = {}
+            self._flat_store: typing.Dict[int, str] = Utils.KeyedDefaultDict(self._flat_missing)
             self._game_store: typing.Dict[str, typing.ChainMap[int, str]] = collections.defaultdict(
                 lambda: collections.ChainMap(self._archipelago_lookup, Utils.KeyedDefaultDict(self._unknown_item)))
             self.warned: bool = False
@@ -236,8 +327,34 @@ class CommonContext:
 
             return self.lookup_in_game(code, self.ctx.slot_info[slot].game)
 
+        def _flat_missing(self, code: int) -> str:
+            for index in reversed(self._indexes.values()):
+                if code in index:
+                    return index[code]
+            return self._unknown_item(code)
+
+        def update_game_index(self, game: str, id_to_name_lookup_table: typing.Mapping[int, str]) -> None:
+            """Overrides existing lookup tables for a particular game with a read only id -> name lookup, like the
+            tables of a Utils.DataPackageIndex, which is used as is instead of being copied."""
+            if game == "Archipelago":
+                self.update_game(game, {name: code for code, name in id_to_name_lookup_table.items()})
+                return
+            self._game_store[game] = collections.ChainMap(self._archipelago_lookup, id_to_name_lookup_table,
+                                                          Utils.KeyedDefaultDict(self._unknown_item))
+            # names looked up from the replaced table, or cached before this one existed, are outdated
+            self._forget_flat(self._indexes.pop(game, None), id_to_name_lookup_table)
+            self._indexes[game] = id_to_name_lookup_table  # Only needed for legacy lookup method.
+
+        def _forget_flat(self, *tables: typing.Optional[typing.Mapping[int, str]]) -> None:
+            """Drops the ids of the tables from the legacy lookup, so they are looked up in the current tables again."""
+            outdated = [code for code in self._flat_store if any(table is not None and code in table
+                                                                 for table in tables)]
+            for code in outdated:
+                del self._flat_store[code]
+
         def update_game(self, game: str, name_to_id_lookup_table: typing.Dict[str, int]) -> None:
             """Overrides existing lookup tables for a particular game."""
+            self._forget_flat(self._indexes.pop(game, None))
             id_to_name_lookup_table = Utils.KeyedDefaultDict(self._unknown_item)
             id_to_name_lookup_table.update({code: name for name, code in name_to_id_lookup_table.items()})
             self._game_store[game] = collections.ChainMap(self._archipelago_lookup, id_to_name_lookup_table)
@@ -482,7 +599,7 @@ class CommonContext:
     def on_print_json(self, args: dict):
         if self.ui:
             # send copy to UI
-            self.ui.print_json(copy.deepcopy(args["data"]))
+            self.ui.print_json(copy.deepcopy(args["data"]), args.get("type", ""))
 
         logging.getLogger("FileLog").info(self.rawjsontotextparser(copy.deepcopy(args["data"])),
                                           extra={"NoStream": True})
@@ -557,6 +674,11 @@ class CommonContext:
             # no action required if local version is new enough
             if (not remote_checksum and (remote_version > local_version or remote_version == 0)) \
                     or remote_checksum != local_checksum:
+                # the binary index only has what is needed for id -> name lookups, but loads without parsing
+                cached_index = Utils.load_data_package_index(game, remote_checksum)
+                if cached_index:
+                    self.update_game_index(cached_index, game)
+                    continue
                 cached_game = Utils.load_data_package_for_checksum(game, remote_checksum)
                 cache_version: int = cached_game.get("version", 0)
                 cache_checksum: typing.Optional[str] = cached_game.get("checksum")
@@ -573,6 +695,10 @@ class CommonContext:
         self.item_names.update_game(game, game_package["item_name_to_id"])
         self.location_names.update_game(game, game_package["location_name_to_id"])
 
+    def update_game_index(self, game_index: Utils.DataPackageIndex, game: str):
+        self.item_names.update_game_index(game, game_index.item_id_to_name)
+        self.location_names.update_game_index(game, game_index.location_id_to_name)
+
     def update_data_package(self, data_package: dict):
         for game, game_data in data_package["games"].items():
             self.update_game(game_data, game)
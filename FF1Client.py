@@ -78,7 +78,7 @@ class FF1Context(CommonContext):
 
     def on_print_json(self, args: dict):
         if self.ui:
-            self.ui.print_json(copy.deepcopy(args["data"]))
+            self.ui.print_json(copy.deepcopy(args["data"]), args.get("type", ""))
         else:
             text = self.jsontotextparser(copy.deepcopy(args["data"]))
             logger.info(text)
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
 import copy
+import io
 import logging
 import os
+import pickle
 import random
 import string
 import sys
 import urllib.parse
 import urllib.request
 from collections import Counter
-from typing import Any, Dict, Tuple, Union
+from typing import Any, Dict, Optional, Tuple, Union
 from itertools import chain
 
 import ModuleUpdate
@@ -20,7 +23,7 @@ ModuleUpdate.update()
 import Utils
 import Options
 from BaseClasses import seeddigits, get_seed, PlandoOptions
-from Utils import parse_yamls, version_tuple, __version__, tuplize_version
+from Utils import parse_yamls, parse_yamls_cached, version_tuple, __version__, tuplize_version
 
 
 def mystery_argparse():
@@ -52,6 +55,14 @@ def mystery_argparse():
     parser.add_argument("--skip_output", action="store_true",
                         help="Skips generation assertion and output stages and skips multidata and spoiler output. "
                              "Intended for debugging and testing purposes.")
+    parser.add_argument("--yaml_cache", action="store_true", default=defaults.yaml_cache,
+                        help="Cache parsed player files, so unchanged files don't have to be parsed again.")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of processes to read player files and roll their options with. "
+                             "More than one rolls different options for the same seed than a single process, "
+                             "but the same ones for any number of workers.")
+    parser.add_argument("--output_processes", type=int, default=defaults.output_processes,
+                        help="Number of processes to generate output files in, for worlds that support it.")
     args = parser.parse_args()
     if not os.path.isabs(args.weights_file_path):
         args.weights_file_path = os.path.join(args.player_files_path, args.weights_file_path)
@@ -83,10 +94,79 @@ def main(args=None) -> Tuple[argparse.Namespace, int]:
         logging.info("Race mode enabled. Using non-deterministic random source.")
         random.seed()  # reset to time-based random source
 
+    workers = getattr(args, "workers", 1)
+    executor: Optional[concurrent.futures.Executor] = None
+    roll_seed: Optional[int] = None
+    if workers > 1:
+        import settings
+        executor = concurrent.futures.ProcessPoolExecutor(workers, initializer=_init_roll_worker,
+                                                          initargs=(settings.lazy_world_loading,))
+        # worker rolls are seeded from this and an offset per roll, so results don't depend on their order or process.
+        # a single process keeps rolling from the random module in order, as it always did
+        roll_seed = random.getrandbits(64)
+    try:
+        return _main(args, seed, seed_name, roll_seed, executor)
+    finally:
+        if executor:
+            executor.shutdown()
+
+
+def _init_roll_worker(lazy_world_loading: bool) -> None:
+    import settings
+    settings.lazy_world_loading = lazy_world_loading
+
+
+def _submit(executor: Optional[concurrent.futures.Executor], function, *args) -> concurrent.futures.Future:
+    """Runs function in executor, or right away if there is none."""
+    if executor:
+        return executor.submit(function, *args)
+    future = concurrent.futures.Future()
+    try:
+        future.set_result(function(*args))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+def roll_file(yamls: Tuple[Any, ...], plando_options: PlandoOptions) -> Tuple[argparse.Namespace, ...]:
+    """Rolls the options of all yamls in a weights file."""
+    return tuple(roll_settings(yaml, plando_options) for yaml in yamls)
+
+
+class _OptionTypePickler(pickle.Pickler):
+    """Pickles option types by game and option key, as some worlds create them where pickle can't find them."""
+    def __init__(self, file: io.BytesIO, option_types: Dict[type, Tuple[str, str]]) -> None:
+        super().__init__(file)
+        self.option_types = option_types
+
+    def reducer_override(self, obj: Any) -> Any:
+        if isinstance(obj, type) and obj in self.option_types:
+            return Options.get_option_type, self.option_types[obj]
+        return NotImplemented
+
+
+def _roll_file_pickled(yamls: Tuple[Any, ...], plando_options: PlandoOptions, roll_seed: int) -> bytes:
+    """roll_file for worker processes, seeded from roll_seed. The result has to be loaded with pickle.loads."""
+    from worlds import AutoWorldRegister
+
+    random.seed(roll_seed)  # only ever reseeds the random module of the worker process
+    rolled = roll_file(yamls, plando_options)
+    option_types = {option_type: (settings.game, option_key)
+                    for settings in rolled
+                    for option_key, option_type in
+                    AutoWorldRegister.world_types[settings.game].options_dataclass.type_hints.items()}
+    file = io.BytesIO()
+    _OptionTypePickler(file, option_types).dump(rolled)
+    return file.getvalue()
+
+
+def _main(args, seed: int, seed_name: str, roll_seed: Optional[int],
+          executor: Optional[concurrent.futures.Executor]) -> Tuple[argparse.Namespace, int]:
+    yaml_cache = getattr(args, "yaml_cache", False)
     weights_cache: Dict[str, Tuple[Any, ...]] = {}
     if args.weights_file_path and os.path.exists(args.weights_file_path):
         try:
-            weights_cache[args.weights_file_path] = read_weights_yamls(args.weights_file_path)
+            weights_cache[args.weights_file_path] = read_weights_yamls(args.weights_file_path, yaml_cache)
         except Exception as e:
             raise ValueError(f"File {args.weights_file_path} is invalid. Please fix your yaml.") from e
         logging.info(f"Weights: {args.weights_file_path} >> "
@@ -94,7 +174,7 @@ def main(args=None) -> Tuple[argparse.Namespace, int]:
 
     if args.meta_file_path and os.path.exists(args.meta_file_path):
         try:
-            meta_weights = read_weights_yamls(args.meta_file_path)[-1]
+            meta_weights = read_weights_yamls(args.meta_file_path, yaml_cache)[-1]
         except Exception as e:
             raise ValueError(f"File {args.meta_file_path} is invalid. Please fix your yaml.") from e
         logging.info(f"Meta: {args.meta_file_path} >> {get_choice('meta_description', meta_weights)}")
@@ -108,15 +188,18 @@ def main(args=None) -> Tuple[argparse.Namespace, int]:
         meta_weights = None
     player_id = 1
     player_files = {}
+    read_files: Dict[str, concurrent.futures.Future] = {}
     for file in os.scandir(args.player_files_path):
         fname = file.name
         if file.is_file() and not fname.startswith(".") and \
                 os.path.join(args.player_files_path, fname) not in {args.meta_file_path, args.weights_file_path}:
             path = os.path.join(args.player_files_path, fname)
-            try:
-                weights_cache[fname] = read_weights_yamls(path)
-            except Exception as e:
-                raise ValueError(f"File {fname} is invalid. Please fix your yaml.") from e
+            read_files[fname] = _submit(executor, read_weights_yamls, path, yaml_cache)
+    for fname, read_file in sorted(read_files.items(), key=lambda k: k[0].casefold()):
+        try:
+            weights_cache[fname] = read_file.result()
+        except Exception as e:
+            raise ValueError(f"File {fname} is invalid. Please fix your yaml.") from e
 
     # sort dict for consistent results across platforms:
     weights_cache = {key: value for key, value in sorted(weights_cache.items(), key=lambda k: k[0].casefold())}
@@ -155,13 +238,10 @@ def main(args=None) -> Tuple[argparse.Namespace, int]:
     erargs.outputpath = args.outputpath
     erargs.skip_prog_balancing = args.skip_prog_balancing
     erargs.skip_output = args.skip_output
+    erargs.output_processes = getattr(args, "output_processes", 0)
     erargs.name = {}
     erargs.csv_output = args.csv_output
 
-    settings_cache: Dict[str, Tuple[argparse.Namespace, ...]] = \
-        {fname: (tuple(roll_settings(yaml, args.plando) for yaml in yamls) if args.sameoptions else None)
-         for fname, yamls in weights_cache.items()}
-
     if meta_weights:
         for category_name, category_dict in meta_weights.items():
             for key in category_dict:
@@ -185,13 +265,33 @@ def main(args=None) -> Tuple[argparse.Namespace, int]:
     name_counter = Counter()
     erargs.player_options = {}
 
+    def submit_roll(yamls: Tuple[Any, ...], offset: int) -> concurrent.futures.Future:
+        if executor:
+            return executor.submit(_roll_file_pickled, yamls, args.plando, roll_seed + offset)
+        return _submit(None, roll_file, yamls, args.plando)
+
+    # a roll covers all yamls in a file, with --sameoptions every file is rolled once, in file order
+    rolls: Dict[int, concurrent.futures.Future] = {}
+    file_rolls: Dict[str, concurrent.futures.Future] = {}
+    if args.sameoptions:
+        for file_number, (path, yamls) in enumerate(weights_cache.items(), 1):
+            file_rolls[path] = submit_roll(yamls, file_number)
+    player = 1
+    while player <= args.multi:
+        path = player_path_cache[player]
+        if not path:
+            break
+        rolls[player] = file_rolls[path] if args.sameoptions else submit_roll(weights_cache[path], player)
+        player += len(weights_cache[path])
+
     player = 1
     while player <= args.multi:
         path = player_path_cache[player]
         if path:
             try:
-                settings: Tuple[argparse.Namespace, ...] = settings_cache[path] if settings_cache[path] else \
-                    tuple(roll_settings(yaml, args.plando) for yaml in weights_cache[path])
+                settings: Tuple[argparse.Namespace, ...] = rolls[player].result()
+                if executor:
+                    settings = pickle.loads(settings)
                 for settingsObject in settings:
                     for k, v in vars(settingsObject).items():
                         if v is not None:
@@ -220,7 +320,7 @@ def main(args=None) -> Tuple[argparse.Namespace, int]:
     return erargs, seed
 
 
-def read_weights_yamls(path) -> Tuple[Any, ...]:
+def read_weights_yamls(path, cache: bool = False) -> Tuple[Any, ...]:
     try:
         if urllib.parse.urlparse(path).scheme in ('https', 'file'):
             yaml = str(urllib.request.urlopen(path).read(), "utf-8-sig")
@@ -230,6 +330,8 @@ def read_weights_yamls(path) -> Tuple[Any, ...]:
     except Exception as e:
         raise Exception(f"Failed to read weights ({path})") from e
 
+    if cache:
+        return parse_yamls_cached(yaml)
     return tuple(parse_yamls(yaml))
 
 
@@ -525,7 +627,9 @@ def roll_alttp_settings(ret: argparse.Namespace, weights):
 
 if __name__ == '__main__':
     import atexit
+    import settings
     confirmation = atexit.register(input, "Press enter to close.")
+    settings.lazy_world_loading = True  # only import the worlds that are rolled
     erargs, seed = main()
     from Main import main as ERmain
     multiworld = ERmain(erargs, seed)
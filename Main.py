@@ -1,16 +1,21 @@
 import collections
 import concurrent.futures
+import contextlib
+import functools
 import logging
+import multiprocessing
 import os
 import pickle
+import shutil
 import tempfile
+import threading
 import time
 import zipfile
 import zlib
-from typing import Dict, List, Optional, Set, Tuple, Union
+from typing import Dict, Iterator, List, Mapping, Optional, Set, Tuple, Union
 
 import worlds
-from BaseClasses import CollectionState, Item, Location, LocationProgressType, MultiWorld, Region
+from BaseClasses import CollectionState, GenerationTimings, Item, Location, LocationProgressType, MultiWorld, Region
 from Fill import FillError, balance_multiworld_progression, distribute_items_restrictive, distribute_planned, \
     flood_items
 from Options import StartInventoryPool
@@ -22,7 +27,8 @@ from worlds.generic.Rules import exclusion_rules, locality_rules
 __all__ = ["main"]
 
 
-def main(args, seed=None, baked_server_options: Optional[Dict[str, object]] = None):
+def main(args, seed=None, baked_server_options: Optional[Dict[str, object]] = None,
+         timings: Optional[GenerationTimings] = None):
     if not baked_server_options:
         baked_server_options = get_settings().server_options.as_dict()
     assert isinstance(baked_server_options, dict)
@@ -33,6 +39,9 @@ def main(args, seed=None, baked_server_options: Optional[Dict[str, object]] = No
     start = time.perf_counter()
     # initialize the multiworld
     multiworld = MultiWorld(args.multi)
+    if timings is not None:
+        multiworld.timings = timings
+    multiworld.timings.start_stage("setup")
 
     logger = logging.getLogger()
     multiworld.set_seed(seed, args.race, str(args.outputname) if args.outputname else None)
@@ -54,22 +63,24 @@ def main(args, seed=None, baked_server_options: Optional[Dict[str, object]] = No
     logger.info('Archipelago Version %s  -  Seed: %s\n', __version__, multiworld.seed)
 
     logger.info(f"Found {len(AutoWorld.AutoWorldRegister.world_types)} World Types:")
-    longest_name = max(len(text) for text in AutoWorld.AutoWorldRegister.world_types)
+    # only list the worlds that are imported, which with lazy world loading are the ones in use
+    loaded_world_types = AutoWorld.AutoWorldRegister.world_types.loaded
+    longest_name = max(len(text) for text in loaded_world_types)
 
     max_item = 0
     max_location = 0
-    for cls in AutoWorld.AutoWorldRegister.world_types.values():
+    for cls in loaded_world_types.values():
         if cls.item_id_to_name:
             max_item = max(max_item, max(cls.item_id_to_name))
             max_location = max(max_location, max(cls.location_id_to_name))
 
     item_digits = len(str(max_item))
     location_digits = len(str(max_location))
-    item_count = len(str(max(len(cls.item_names) for cls in AutoWorld.AutoWorldRegister.world_types.values())))
-    location_count = len(str(max(len(cls.location_names) for cls in AutoWorld.AutoWorldRegister.world_types.values())))
+    item_count = len(str(max(len(cls.item_names) for cls in loaded_world_types.values())))
+    location_count = len(str(max(len(cls.location_names) for cls in loaded_world_types.values())))
     del max_item, max_location
 
-    for name, cls in AutoWorld.AutoWorldRegister.world_types.items():
+    for name, cls in loaded_world_types.items():
         if not cls.hidden and len(cls.item_names) > 0:
             logger.info(f" {name:{longest_name}}: {len(cls.item_names):{item_count}} "
                         f"Items (IDs: {min(cls.item_id_to_name):{item_digits}} - "
@@ -82,8 +93,10 @@ def main(args, seed=None, baked_server_options: Optional[Dict[str, object]] = No
 
     # This assertion method should not be necessary to run if we are not outputting any multidata.
     if not args.skip_output:
+        multiworld.timings.start_stage("assert_generate")
         AutoWorld.call_stage(multiworld, "assert_generate")
 
+    multiworld.timings.start_stage("generate_early")
     AutoWorld.call_all(multiworld, "generate_early")
 
     logger.info('')
@@ -111,12 +124,15 @@ def main(args, seed=None, baked_server_options: Optional[Dict[str, object]] = No
             del early
 
     logger.info('Creating MultiWorld.')
+    multiworld.timings.start_stage("create_regions")
     AutoWorld.call_all(multiworld, "create_regions")
 
     logger.info('Creating Items.')
+    multiworld.timings.start_stage("create_items")
     AutoWorld.call_all(multiworld, "create_items")
 
     logger.info('Calculating Access Rules.')
+    multiworld.timings.start_stage("set_rules")
 
     for player in multiworld.player_ids:
         # items can't be both local and non-local, prefer local
@@ -148,7 +164,8 @@ def main(args, seed=None, baked_server_options: Optional[Dict[str, object]] = No
     else:
         multiworld.worlds[1].options.non_local_items.value = set()
         multiworld.worlds[1].options.local_items.value = set()
-    
+
+    multiworld.timings.start_stage("generate_basic")
     AutoWorld.call_all(multiworld, "generate_basic")
 
     # remove starting inventory from pool items.
@@ -199,22 +216,27 @@ def main(args, seed=None, baked_server_options: Optional[Dict[str, object]] = No
         multiworld._all_state = None
 
     logger.info("Running Item Plando.")
+    multiworld.timings.start_stage("item_plando")
 
     distribute_planned(multiworld)
 
     logger.info('Running Pre Main Fill.')
+    multiworld.timings.start_stage("pre_fill")
 
     AutoWorld.call_all(multiworld, "pre_fill")
 
     logger.info(f'Filling the multiworld with {len(multiworld.itempool)} items.')
+    multiworld.timings.start_stage("fill")
 
     if multiworld.algorithm == 'flood':
         flood_items(multiworld)  # different algo, biased towards early game progress items
     elif multiworld.algorithm == 'balanced':
         distribute_items_restrictive(multiworld, get_settings().generator.panic_method)
 
+    multiworld.timings.start_stage("post_fill")
     AutoWorld.call_all(multiworld, 'post_fill')
 
+    multiworld.timings.start_stage("progression_balancing")
     if multiworld.players > 1 and not args.skip_prog_balancing:
         balance_multiworld_progression(multiworld)
     else:
@@ -224,24 +246,54 @@ def main(args, seed=None, baked_server_options: Optional[Dict[str, object]] = No
     multiworld.random.passthrough = False
 
     if args.skip_output:
+        multiworld.timings.finish()
         logger.info('Done. Skipped output/spoiler generation. Total Time: %s', time.perf_counter() - start)
         return multiworld
 
     logger.info(f'Beginning output...')
+    multiworld.timings.start_stage("output")
     outfilebase = 'AP_' + multiworld.seed_name
 
+    zipfilename = output_path(f"AP_{multiworld.seed_name}.zip")
     output = tempfile.TemporaryDirectory()
-    with output as temp_dir:
+    with output as temp_dir, _open_output_archive(zipfilename) as zf:
         output_players = [player for player in multiworld.player_ids if AutoWorld.World.generate_output.__code__
                           is not multiworld.worlds[player].generate_output.__code__]
-        with concurrent.futures.ThreadPoolExecutor(len(output_players) + 2) as pool:
+        # each world gets its own directory, so its files can be moved into the archive as soon as it is done
+        output_directories: Dict[int, str] = {}
+        for player in output_players:
+            output_directories[player] = os.path.join(temp_dir, f"P{player}_output")
+            os.mkdir(output_directories[player])
+        output_futures: Dict[concurrent.futures.Future, int] = {}
+        output_processes = getattr(args, "output_processes", 0)
+        process_players: List[int] = []
+        if output_processes > 0 and "fork" in multiprocessing.get_all_start_methods():
+            process_players = [player for player in output_players
+                               if multiworld.worlds[player].output_process_attributes is not None]
+            output_players = [player for player in output_players if player not in process_players]
+        with contextlib.ExitStack() as stack:
+            output_file_futures: List[concurrent.futures.Future] = []
+            if process_players:
+                # fork before any output thread is started, so the processes get the multiworld without pickling it
+                process_pool = stack.enter_context(concurrent.futures.ProcessPoolExecutor(
+                    min(output_processes, len(process_players)), mp_context=multiprocessing.get_context("fork"),
+                    initializer=_init_output_process, initargs=(multiworld,)))
+                for player in process_players:
+                    future = process_pool.submit(_generate_output_in_process, player, output_directories[player])
+                    future.add_done_callback(functools.partial(_collect_output_process, multiworld.worlds[player]))
+                    output_futures[future] = player
+                    output_file_futures.append(future)
+
+            pool = stack.enter_context(concurrent.futures.ThreadPoolExecutor(len(output_players) + 2))
             check_accessibility_task = pool.submit(multiworld.fulfills_accessibility)
 
-            output_file_futures = [pool.submit(AutoWorld.call_stage, multiworld, "generate_output", temp_dir)]
+            output_file_futures.append(pool.submit(AutoWorld.call_stage, multiworld, "generate_output", temp_dir))
             for player in output_players:
                 # skip starting a thread for methods that say "pass".
-                output_file_futures.append(
-                    pool.submit(AutoWorld.call_single, multiworld, "generate_output", player, temp_dir))
+                future = pool.submit(AutoWorld.call_single, multiworld, "generate_output", player,
+                                     output_directories[player])
+                output_futures[future] = player
+                output_file_futures.append(future)
 
             # collect ER hint info
             er_hint_data: Dict[int, Dict[int, str]] = {}
@@ -305,8 +357,9 @@ def main(args, seed=None, baked_server_options: Optional[Dict[str, object]] = No
 
                 # embedded data package
                 data_package = {
-                    game_world.game: worlds.network_data_package["games"][game_world.game]
-                    for game_world in multiworld.worlds.values()
+                    game: world_type.get_data_package_data()
+                    for game, world_type in {game_world.game: type(game_world)
+                                             for game_world in multiworld.worlds.values()}.items()
                 }
 
                 checks_in_area: Dict[int, Dict[str, Union[int, List[int]]]] = {}
@@ -341,10 +394,14 @@ def main(args, seed=None, baked_server_options: Optional[Dict[str, object]] = No
                 }
                 AutoWorld.call_all(multiworld, "modify_multidata", multidata)
 
+                # store locations and spheres as integer arrays, which are smaller and load faster
+                multidata["location_columns"] = NetUtils.encode_location_columns(multidata.pop("locations"))
+                multidata["sphere_columns"] = NetUtils.encode_sphere_columns(multidata.pop("spheres"))
+
                 multidata = zlib.compress(pickle.dumps(multidata), 9)
 
                 with open(os.path.join(temp_dir, f'{outfilebase}.archipelago'), 'wb') as f:
-                    f.write(bytes([3]))  # version of format
+                    f.write(bytes([4]))  # version of format
                     f.write(multidata)
 
             output_file_futures.append(pool.submit(write_multidata))
@@ -359,7 +416,13 @@ def main(args, seed=None, baked_server_options: Optional[Dict[str, object]] = No
                 if i % 10 == 0 or i == len(output_file_futures):
                     logger.info(f'Generating output files ({i}/{len(output_file_futures)}).')
                 future.result()
+                if future in output_futures:
+                    player = output_futures[future]
+                    _archive_output_files(zf, output_directories[player],
+                                          multiworld.worlds[player].output_compression)
+                    shutil.rmtree(output_directories[player])
 
+        multiworld.timings.start_stage("spoiler")
         if args.spoiler > 1:
             logger.info('Calculating playthrough.')
             multiworld.spoiler.create_playthrough(create_paths=args.spoiler > 2)
@@ -367,12 +430,90 @@ def main(args, seed=None, baked_server_options: Optional[Dict[str, object]] = No
         if args.spoiler:
             multiworld.spoiler.to_file(os.path.join(temp_dir, '%s_Spoiler.txt' % outfilebase))
 
-        zipfilename = output_path(f"AP_{multiworld.seed_name}.zip")
         logger.info(f"Creating final archive at {zipfilename}")
-        with zipfile.ZipFile(zipfilename, mode="w", compression=zipfile.ZIP_DEFLATED,
-                             compresslevel=9) as zf:
-            for file in os.scandir(temp_dir):
-                zf.write(file.path, arcname=file.name)
+        multiworld.timings.start_stage("archive")
+        _archive_output_files(zf, temp_dir, {})
 
+    multiworld.timings.finish()
     logger.info('Done. Enjoy. Total Time: %s', time.perf_counter() - start)
     return multiworld
+
+
+@contextlib.contextmanager
+def _open_output_archive(path: str) -> Iterator[zipfile.ZipFile]:
+    """Opens the final archive for writing, which only appears at path once it was completely written."""
+    partial_path = path + ".part"
+    zf = zipfile.ZipFile(partial_path, mode="w")
+    try:
+        yield zf
+    except BaseException:
+        zf.close()
+        os.unlink(partial_path)
+        raise
+    zf.close()
+    os.replace(partial_path, path)
+
+
+def _is_compressed(path: str) -> bool:
+    """Checks if a file is compressed already, like multidata and APContainers, so compressing it again is wasted."""
+    return path.endswith(".archipelago") or zipfile.is_zipfile(path)
+
+
+def _archive_output_files(zf: zipfile.ZipFile, directory: str, compression: Mapping[str, int]) -> None:
+    """
+    Moves the files of directory into the archive.
+    compression maps file extensions to compression levels, 9 is used for the others, 0 or compressed files are stored.
+    """
+    for file in os.scandir(directory):
+        if not file.is_file():
+            zf.write(file.path, arcname=file.name)
+            continue
+        level = compression.get(os.path.splitext(file.name)[1], 9)
+        if level == 0 or _is_compressed(file.path):
+            zf.write(file.path, arcname=file.name, compress_type=zipfile.ZIP_STORED)
+        else:
+            zf.write(file.path, arcname=file.name, compress_type=zipfile.ZIP_DEFLATED, compresslevel=level)
+        os.unlink(file.path)
+
+
+_output_multiworld: Optional[MultiWorld] = None
+"""The multiworld in an output process, inherited from the generator process when forking."""
+
+
+def _init_output_process(multiworld: MultiWorld) -> None:
+    global _output_multiworld
+    _output_multiworld = multiworld
+
+
+def _generate_output_in_process(player: int, output_directory: str
+                                ) -> Tuple[Dict[str, object], Dict[str, float], Dict[str, int]]:
+    """Runs a world's generate_output in an output process and returns its output_process_attributes, along with the
+    generate_output seconds and memory growth the process recorded for it, by world label."""
+    assert _output_multiworld is not None, "output process was not initialized"
+    timings = _output_multiworld.timings
+    # a process can run several worlds, each of them should only report its own call
+    timings.worlds.pop("generate_output", None)
+    timings.world_memory.pop("generate_output", None)
+    AutoWorld.call_single(_output_multiworld, "generate_output", player, output_directory)
+    world = _output_multiworld.worlds[player]
+    attributes = {name: getattr(world, name) for name in world.output_process_attributes
+                  if hasattr(world, name) and not isinstance(getattr(world, name), threading.Event)}
+    return (attributes, dict(timings.worlds.get("generate_output", {})),
+            dict(timings.world_memory.get("generate_output", {})))
+
+
+def _collect_output_process(world: AutoWorld.World, future: concurrent.futures.Future) -> None:
+    """Copies the attributes set in an output process back to the world, adds its generate_output timings to the
+    multiworld's and sets the world's events, even if it failed."""
+    try:
+        if not future.cancelled() and future.exception() is None:
+            attributes, times, memory_growths = future.result()
+            for name, value in attributes.items():
+                setattr(world, name, value)
+            for label, taken in times.items():
+                world.multiworld.timings.add_world_time("generate_output", label, taken, memory_growths.get(label))
+    finally:
+        for name in world.output_process_attributes:
+            event = getattr(world, name, None)
+            if isinstance(event, threading.Event):
+                event.set()
@@ -40,7 +40,7 @@ import NetUtils
 import Utils
 from Utils import version_tuple, restricted_loads, Version, async_start, get_intended_text
 from NetUtils import Endpoint, ClientStatus, NetworkItem, decode, encode, NetworkPlayer, Permission, NetworkSlot, \
-    SlotType, LocationStore
+    SlotType, LocationStore, read_location_columns, decode_sphere_columns
 
 min_client_version = Version(0, 1, 6)
 colorama.init()
@@ -275,19 +275,18 @@ class Context:
     # Data package retrieval
     def _load_game_data(self):
         import worlds
-        self.gamespackage = worlds.network_data_package["games"]
 
-        self.item_name_groups = {world_name: world.item_name_groups for world_name, world in
-                                 worlds.AutoWorldRegister.world_types.items()}
-        self.location_name_groups = {world_name: world.location_name_groups for world_name, world in
-                                     worlds.AutoWorldRegister.world_types.items()}
-        for world_name, world in worlds.AutoWorldRegister.world_types.items():
-            self.non_hintable_names[world_name] = world.hint_blacklist
+        # groups are read from the data package, so worlds that are deferred don't have to be imported
+        for world_name, game_package in worlds.network_data_package["games"].items():
+            self.item_name_groups[world_name] = {group_name: set(names) for group_name, names in
+                                                 game_package["item_name_groups"].items()}
+            self.location_name_groups[world_name] = {group_name: set(names) for group_name, names in
+                                                     game_package["location_name_groups"].items()}
+            self.non_hintable_names[world_name] = worlds.get_hint_blacklist(world_name)
 
-        for game_package in self.gamespackage.values():
             # remove groups from data sent to clients
-            del game_package["item_name_groups"]
-            del game_package["location_name_groups"]
+            self.gamespackage[world_name] = {key: value for key, value in game_package.items()
+                                             if key not in ("item_name_groups", "location_name_groups")}
 
     def _init_game_data(self):
         for game_name, game_package in self.gamespackage.items():
@@ -419,7 +418,7 @@ class Context:
     @staticmethod
     def decompress(data: bytes) -> dict:
         format_version = data[0]
-        if format_version > 3:
+        if format_version > 4:
             raise Utils.VersionException("Incompatible multidata.")
         return restricted_loads(zlib.decompress(data[1:]))
 
@@ -459,7 +458,10 @@ class Context:
         self.seed_name = decoded_obj["seed_name"]
         self.random.seed(self.seed_name)
         self.connect_names = decoded_obj['connect_names']
-        self.locations = LocationStore(decoded_obj.pop("locations"))  # pre-emptively free memory
+        if "location_columns" in decoded_obj:
+            self.locations = LocationStore.from_columns(read_location_columns(decoded_obj.pop("location_columns")))
+        else:  # format 3 and older
+            self.locations = LocationStore(decoded_obj.pop("locations"))  # pre-emptively free memory
         self.slot_data = decoded_obj['slot_data']
         for slot, data in self.slot_data.items():
             self.read_data[f"slot_data_{slot}"] = lambda data=data: data
@@ -501,7 +503,10 @@ class Context:
             self.read_data[f"location_name_groups_{game_name}"] = lambda lgame=game_name: self.location_name_groups[lgame]
 
         # sorted access spheres
-        self.spheres = decoded_obj.get("spheres", [])
+        if "sphere_columns" in decoded_obj:
+            self.spheres = decode_sphere_columns(decoded_obj["sphere_columns"])
+        else:
+            self.spheres = decoded_obj.get("spheres", [])
 
     # saving
 
@@ -2404,6 +2409,8 @@ async def main(args: argparse.Namespace):
 client_message_processor = ClientMessageProcessor
 
 if __name__ == '__main__':
+    import settings
+    settings.lazy_world_loading = True  # read the data package from cache instead of importing all worlds
     try:
         asyncio.run(main(parse_args()))
     except asyncio.exceptions.CancelledError:
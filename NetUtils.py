@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import array
+import sys
 import typing
 import enum
 import warnings
@@ -362,6 +364,13 @@ class _LocationStore(dict, typing.MutableMapping[int, typing.Dict[int, typing.Tu
         if len(self.get(0, {})):
             raise ValueError("Invalid player id 0 for location")
 
+    @classmethod
+    def from_columns(cls, columns: typing.Mapping[int, LocationColumnViews]) -> _LocationStore:
+        """Creates the store from the columns of each slot, see read_location_columns."""
+        return cls({slot: {location_id: (item_id, receiving_player, item_flags) for
+                           location_id, item_id, receiving_player, item_flags in zip(*slot_columns)}
+                    for slot, slot_columns in columns.items()})
+
     def find_item(self, slots: typing.Set[int], seeked_item_id: int
                   ) -> typing.Generator[typing.Tuple[int, int, int, int, int], None, None]:
         for finding_player, check_data in self.items():
@@ -407,6 +416,72 @@ class _LocationStore(dict, typing.MutableMapping[int, typing.Dict[int, typing.Tu
                         location_id not in checked])
 
 
+LocationColumns = typing.Tuple[bytes, bytes, bytes, bytes]
+"""Location ids, item ids, receiving players and item flags of a slot's locations, sorted by location id,
+as little endian 64, 64, 32 and 32 bit integer arrays."""
+LocationColumnViews = typing.Tuple[typing.Sequence[int], typing.Sequence[int], typing.Sequence[int],
+                                   typing.Sequence[int]]
+_location_column_types = ("q", "q", "I", "I")
+
+
+def _pack_column(typecode: str, values: typing.Iterable[int]) -> bytes:
+    column = array.array(typecode, values)
+    if sys.byteorder == "big":
+        column.byteswap()
+    return column.tobytes()
+
+
+def _read_column(typecode: str, data: bytes) -> typing.Sequence[int]:
+    if sys.byteorder == "big":
+        column = array.array(typecode, data)
+        column.byteswap()
+        return column
+    return memoryview(data).cast(typecode)
+
+
+def encode_location_columns(locations: typing.Mapping[int, typing.Mapping[int, typing.Tuple[int, int, int]]]
+                            ) -> typing.Dict[int, LocationColumns]:
+    """Encodes the locations of multidata as integer arrays per slot, which are smaller and faster to load."""
+    columns: typing.Dict[int, LocationColumns] = {}
+    for slot, slot_locations in locations.items():
+        location_ids = sorted(slot_locations)
+        values = [slot_locations[location_id] for location_id in location_ids]
+        columns[slot] = (_pack_column("q", location_ids),
+                         _pack_column("q", [value[0] for value in values]),
+                         _pack_column("I", [value[1] for value in values]),
+                         _pack_column("I", [value[2] for value in values]))
+    return columns
+
+
+def read_location_columns(columns: typing.Mapping[int, LocationColumns]
+                          ) -> typing.Dict[int, LocationColumnViews]:
+    """Gives access to the integers of encoded location columns, without copying them where possible."""
+    return {slot: typing.cast(LocationColumnViews, tuple(_read_column(typecode, data) for typecode, data in
+                                                         zip(_location_column_types, slot_columns)))
+            for slot, slot_columns in columns.items()}
+
+
+def decode_location_columns(columns: typing.Mapping[int, LocationColumns]
+                            ) -> typing.Dict[int, typing.Dict[int, typing.Tuple[int, int, int]]]:
+    """Decodes encoded location columns back into the locations of multidata."""
+    return {slot: {location_id: (item_id, receiving_player, item_flags) for
+                   location_id, item_id, receiving_player, item_flags in zip(*slot_columns)}
+            for slot, slot_columns in read_location_columns(columns).items()}
+
+
+def encode_sphere_columns(spheres: typing.Iterable[typing.Mapping[int, typing.Iterable[int]]]
+                          ) -> typing.List[typing.Dict[int, bytes]]:
+    """Encodes the spheres of multidata, as sorted integer arrays of location ids per slot."""
+    return [{slot: _pack_column("q", sorted(location_ids)) for slot, location_ids in sphere.items()}
+            for sphere in spheres]
+
+
+def decode_sphere_columns(columns: typing.Iterable[typing.Mapping[int, bytes]]
+                          ) -> typing.List[typing.Dict[int, typing.Set[int]]]:
+    """Decodes encoded spheres back into the spheres of multidata."""
+    return [{slot: set(_read_column("q", data)) for slot, data in sphere.items()} for sphere in columns]
+
+
 if typing.TYPE_CHECKING:  # type-check with pure python implementation until we have a typing stub
     LocationStore = _LocationStore
 else:
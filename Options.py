@@ -9,7 +9,7 @@ import random
 import typing
 import enum
 from collections import defaultdict
-from copy import deepcopy
+from copy import copy, deepcopy
 from dataclasses import dataclass
 
 from schema import And, Optional, Or, Schema
@@ -798,7 +798,32 @@ class VerifyKeys(metaclass=FreezeValidKeys):
                     f"Allowed keys: {self._valid_keys}."
                 )
 
+    _verified_values: typing.ClassVar[typing.Dict[typing.Tuple[typing.Any, ...], typing.Any]] = {}
+    """(option type, world type, value) -> verified value, as players sharing a yaml verify the same values"""
+    _verified_values_limit: typing.ClassVar[int] = 10000
+
+    def _verify_cache_key(self, world: typing.Type[World]) -> typing.Optional[typing.Tuple[typing.Any, ...]]:
+        value = self.value
+        try:
+            if isinstance(value, (set, frozenset)):
+                key = (type(self), world, type(value), frozenset(value))
+            elif isinstance(value, dict):
+                key = (type(self), world, dict, tuple(value.items()))
+            elif isinstance(value, list):
+                key = (type(self), world, list, tuple(value))
+            else:
+                return None
+            hash(key)
+        except TypeError:  # unhashable contents
+            return None
+        return key
+
     def verify(self, world: typing.Type[World], player_name: str, plando_options: "PlandoOptions") -> None:
+        cache_key = self._verify_cache_key(world)
+        if cache_key in VerifyKeys._verified_values:
+            self.value = copy(VerifyKeys._verified_values[cache_key])
+            return
+
         try:
             self.verify_keys()
         except OptionError as validation_error:
@@ -828,6 +853,11 @@ class VerifyKeys(metaclass=FreezeValidKeys):
                                     f"is not a valid location name from {world.game}. "
                                     f"Did you mean '{picks[0][0]}' ({picks[0][1]}% sure)")
 
+        if cache_key:
+            if len(VerifyKeys._verified_values) >= VerifyKeys._verified_values_limit:
+                VerifyKeys._verified_values.clear()
+            VerifyKeys._verified_values[cache_key] = copy(self.value)
+
 
 class OptionDict(Option[typing.Dict[str, typing.Any]], VerifyKeys, typing.Mapping[str, typing.Any]):
     default = {}
@@ -1478,6 +1508,13 @@ def get_option_groups(world: typing.Type[World], visibility_level: Visibility =
     return grouped_options
 
 
+def get_option_type(game: str, option_key: str) -> typing.Type[Option[typing.Any]]:
+    """Returns the option type of game by its key. Unlike the type's qualified name, this also finds option types that
+    were created dynamically, so it is used to pickle option types."""
+    from worlds import AutoWorldRegister
+    return AutoWorldRegister.world_types[game].options_dataclass.type_hints[option_key]
+
+
 def generate_yaml_templates(target_folder: typing.Union[str, "pathlib.Path"], generate_hidden: bool = True) -> None:
     import os
 
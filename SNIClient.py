@@ -7,6 +7,7 @@ import multiprocessing
 import os
 import subprocess
 import base64
+import bisect
 import logging
 import asyncio
 import enum
@@ -15,7 +16,8 @@ import typing
 from json import loads, dumps
 
 # CommonClient import first to trigger ModuleUpdater
-from CommonClient import CommonContext, server_loop, ClientCommandProcessor, gui_enabled, get_base_parser
+from CommonClient import CommonContext, server_loop, ClientCommandProcessor, gui_enabled, get_base_parser, \
+    WatcherScheduler
 
 import Utils
 from Utils import async_start
@@ -51,6 +53,10 @@ class SNIClientCommandProcessor(ClientCommandProcessor):
 
         self.output(f"Setting slow mode to {self.ctx.slow_mode}")
 
+    def _cmd_polling(self) -> None:
+        """Show how often the SNES is polled and how long each poll takes."""
+        self.output(self.ctx.watcher_scheduler.get_stats())
+
     @mark_raw
     def _cmd_snes(self, snes_options: str = "") -> bool:
         """Connect to a snes. Optionally include network address of a snes to connect to,
@@ -133,6 +139,9 @@ class SNIContext(CommonContext):
     killing_player_task: "typing.Optional[asyncio.Task[None]]"
     allow_collect: bool
     slow_mode: bool
+    watcher_scheduler: WatcherScheduler
+    snes_read_snapshot: typing.Optional[int]
+    """hash of the data read since the handler's game_watcher started, None if a read failed"""
 
     client_handler: typing.Optional[SNIClient]
     awaiting_rom: bool
@@ -159,6 +168,8 @@ class SNIContext(CommonContext):
         self.killing_player_task = None
         self.allow_collect = False
         self.slow_mode = False
+        self.watcher_scheduler = WatcherScheduler(0.125, 0.5)
+        self.snes_read_snapshot = None
 
         self.client_handler = None
         self.awaiting_rom = False
@@ -512,6 +523,17 @@ async def snes_recv_loop(ctx: SNIContext) -> None:
 
 
 async def snes_read(ctx: SNIContext, address: int, size: int) -> typing.Optional[bytes]:
+    data = await snes_read_batch(ctx, ((address, size),))
+    return data[0] if data is not None else None
+
+
+async def snes_read_batch(ctx: SNIContext, reads: typing.Sequence[typing.Tuple[int, int]]
+                          ) -> typing.Optional[typing.List[bytes]]:
+    """Reads multiple (address, size) ranges in a single round trip.
+    The requests are sent back to back and the replies are split up again by size.
+    Returns the data of each range in order, or None if any read failed."""
+    if not reads:
+        return []
     try:
         await ctx.snes_request_lock.acquire()
 
@@ -523,37 +545,80 @@ async def snes_read(ctx: SNIContext, address: int, size: int) -> typing.Optional
         ):
             return None
 
-        GetAddress_Request: SNESRequest = {
-            "Opcode": "GetAddress",
-            "Space": "SNES",
-            "Operands": [hex(address)[2:], hex(size)[2:]]
-        }
         try:
-            await ctx.snes_socket.send(dumps(GetAddress_Request))
+            for address, size in reads:
+                GetAddress_Request: SNESRequest = {
+                    "Opcode": "GetAddress",
+                    "Space": "SNES",
+                    "Operands": [hex(address)[2:], hex(size)[2:]]
+                }
+                await ctx.snes_socket.send(dumps(GetAddress_Request))
         except ConnectionClosed:
             return None
 
-        data: bytes = bytes()
-        while len(data) < size:
+        total_size = sum(size for _, size in reads)
+        data = bytearray()
+        while len(data) < total_size:
             try:
                 data += await asyncio.wait_for(ctx.snes_recv_queue.get(), 5)
             except asyncio.TimeoutError:
                 break
 
-        if len(data) != size:
-            snes_logger.error('Error reading %s, requested %d bytes, received %d' % (hex(address), size, len(data)))
+        if len(data) != total_size:
+            snes_logger.error('Error reading %s, requested %d bytes, received %d' %
+                              (", ".join(hex(address) for address, _ in reads), total_size, len(data)))
             if len(data):
-                snes_logger.error(str(data))
+                snes_logger.error(str(bytes(data)))
                 snes_logger.warning('Communication Failure with SNI')
             if ctx.snes_socket is not None and not ctx.snes_socket.closed:
                 await ctx.snes_socket.close()
+            ctx.snes_read_snapshot = None
             return None
 
-        return data
+        if ctx.snes_read_snapshot is not None:
+            ctx.snes_read_snapshot = hash((ctx.snes_read_snapshot, bytes(data)))
+        results: typing.List[bytes] = []
+        offset = 0
+        for _, size in reads:
+            results.append(bytes(data[offset:offset + size]))
+            offset += size
+        return results
     finally:
         ctx.snes_request_lock.release()
 
 
+def coalesce_snes_reads(reads: typing.Iterable[typing.Tuple[int, int]], max_gap: int = 0
+                        ) -> typing.List[typing.Tuple[int, int]]:
+    """Merges overlapping and adjacent (address, size) ranges, sorted by address.
+    Ranges up to max_gap bytes apart are merged as well, reading the bytes between them."""
+    merged: typing.List[typing.Tuple[int, int]] = []
+    for address, size in sorted(reads):
+        if merged:
+            merged_address, merged_size = merged[-1]
+            if address <= merged_address + merged_size + max_gap:
+                merged[-1] = (merged_address, max(merged_size, address + size - merged_address))
+                continue
+        merged.append((address, size))
+    return merged
+
+
+async def snes_read_multiple(ctx: SNIContext, reads: typing.Sequence[typing.Tuple[int, int]], max_gap: int = 0
+                             ) -> typing.Optional[typing.List[bytes]]:
+    """Reads all (address, size) ranges a handler needs for one tick, coalescing them with coalesce_snes_reads and
+    reading the result with snes_read_batch. Returns the data of each range in the order of reads, or None on failure."""
+    plan = coalesce_snes_reads(reads, max_gap)
+    data = await snes_read_batch(ctx, plan)
+    if data is None:
+        return None
+    plan_starts = [address for address, _ in plan]
+    results: typing.List[bytes] = []
+    for address, size in reads:
+        index = bisect.bisect_right(plan_starts, address) - 1
+        offset = address - plan_starts[index]
+        results.append(data[index][offset:offset + size])
+    return results
+
+
 async def snes_write(ctx: SNIContext, write_list: typing.List[typing.Tuple[int, bytes]]) -> bool:
     try:
         await ctx.snes_request_lock.acquire()
@@ -574,6 +639,7 @@ async def snes_write(ctx: SNIContext, write_list: typing.List[typing.Tuple[int,
         except ConnectionClosed:
             return False
 
+        ctx.watcher_scheduler.activity()
         return True
     finally:
         ctx.snes_request_lock.release()
@@ -599,11 +665,7 @@ async def snes_flush_writes(ctx: SNIContext) -> None:
 async def game_watcher(ctx: SNIContext) -> None:
     perf_counter = time.perf_counter()
     while not ctx.exit_event.is_set():
-        try:
-            await asyncio.wait_for(ctx.watcher_event.wait(), 0.125)
-        except asyncio.TimeoutError:
-            pass
-        ctx.watcher_event.clear()
+        await ctx.watcher_scheduler.wait(ctx.watcher_event)
 
         if not ctx.rom or not ctx.client_handler:
             ctx.finished_game = False
@@ -649,7 +711,9 @@ async def game_watcher(ctx: SNIContext) -> None:
 
         perf_counter = time.perf_counter()
 
+        ctx.snes_read_snapshot = 0
         await ctx.client_handler.game_watcher(ctx)
+        ctx.watcher_scheduler.report(ctx.snes_read_snapshot)
 
 
 async def run_game(romfile: str) -> None:
@@ -238,6 +238,86 @@ unsafe_parse_yaml = functools.partial(load, Loader=UnsafeLoader)
 
 del load, load_all  # should not be used. don't leak their names
 
+# change this when UniqueKeyLoader changes what it produces, to invalidate parsed yamls in cache
+_yaml_cache_version = 1
+_yaml_cache_max_age = 7 * 24 * 60 * 60
+"""seconds since its last use after which a parsed yaml is removed from cache"""
+_yaml_cache_max_size = 64 * 1024 * 1024
+"""bytes the parsed yamls in cache may take up, the least recently used ones are removed beyond that"""
+_yaml_cache_prune_interval = 60
+_yaml_cache_last_prune: Optional[float] = None
+
+
+def _prune_yaml_cache(folder: str) -> None:
+    """Removes cached yamls that are too old, then the least recently used ones until the cache fits its size limit."""
+    import time
+
+    now = time.time()
+    files = []
+    for entry in os.scandir(folder):
+        try:
+            stat = entry.stat()
+            if now - stat.st_mtime > _yaml_cache_max_age:
+                os.unlink(entry.path)
+            elif entry.name.endswith(".pickle"):
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError:
+            pass  # removed or replaced by another process
+    total_size = sum(size for _, size, _ in files)
+    for _, size, path in sorted(files):
+        if total_size <= _yaml_cache_max_size:
+            break
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+        total_size -= size
+
+
+def parse_yamls_cached(data: typing.Union[str, bytes]) -> typing.Tuple[Any, ...]:
+    """Like parse_yamls, but the documents are cached on disk by the content of data, so unchanged yamls are only
+    parsed once. Each call returns new objects, which may be modified.
+    Documents that restricted_loads can't load, like ones containing dates, are not cached."""
+    global _yaml_cache_last_prune
+    import hashlib
+    import time
+    import yaml
+
+    checksum = hashlib.sha1(f"{_yaml_cache_version}|{yaml.__version__}|{SafeLoader.__name__}|".encode())
+    checksum.update(data.encode("utf-8") if isinstance(data, str) else data)
+    path = cache_path("yaml", f"{checksum.hexdigest()}.pickle")
+    try:
+        with open(path, "rb") as f:
+            documents = restricted_loads(f.read())
+    except Exception:
+        pass  # not cached yet or not loadable, parse it instead
+    else:
+        try:
+            os.utime(path)  # the modification time doubles as last use for pruning
+        except OSError:
+            pass
+        return documents
+
+    documents = tuple(parse_yamls(data))
+    try:
+        pickled = pickle.dumps(documents, pickle.HIGHEST_PROTOCOL)
+        restricted_loads(pickled)
+    except Exception as e:
+        logging.debug(f"Not caching parsed yaml, as it can't be loaded back: {e}")
+        return documents
+    try:
+        folder = cache_path("yaml")
+        os.makedirs(folder, exist_ok=True)
+        with open(f"{path}.{os.getpid()}.tmp", "wb") as f:
+            f.write(pickled)
+        os.replace(f"{path}.{os.getpid()}.tmp", path)
+        if _yaml_cache_last_prune is None or time.monotonic() - _yaml_cache_last_prune > _yaml_cache_prune_interval:
+            _yaml_cache_last_prune = time.monotonic()
+            _prune_yaml_cache(folder)
+    except Exception as e:
+        logging.debug(f"Could not store parsed yaml: {e}")
+    return documents
+
 
 def get_cert_none_ssl_context():
     import ssl
@@ -364,6 +444,140 @@ def store_data_package_for_checksum(game: str, data: typing.Dict[str, Any]) -> N
                 json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
         except Exception as e:
             logging.debug(f"Could not store data package: {e}")
+        _store_data_package_index(game, data)
+
+
+class IdNameTable(typing.Mapping[int, str]):
+    """Read only id -> name lookup of a DataPackageIndex, which decodes names from the index as they are looked up."""
+    _ids: typing.Sequence[int]
+    _ends: typing.Sequence[int]
+    _names: memoryview
+
+    def __init__(self, ids: typing.Sequence[int], ends: typing.Sequence[int], names: memoryview) -> None:
+        self._ids = ids
+        self._ends = ends
+        self._names = names
+
+    def __getitem__(self, code: int) -> str:
+        import bisect
+        i = bisect.bisect_left(self._ids, code)
+        if i == len(self._ids) or self._ids[i] != code:
+            raise KeyError(code)
+        return str(self._names[self._ends[i - 1] if i else 0:self._ends[i]], "utf-8")
+
+    def __contains__(self, code: object) -> bool:
+        try:
+            self[code]  # type: ignore
+        except (KeyError, TypeError):
+            return False
+        return True
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> typing.Iterator[int]:
+        return iter(self._ids)
+
+
+class DataPackageIndex(typing.NamedTuple):
+    """Id -> name lookups of a game's data package, read from a binary, memory mapped cache file."""
+    checksum: str
+    item_id_to_name: IdNameTable
+    location_id_to_name: IdNameTable
+
+
+_data_package_index_header = "<4sIII"  # magic, format version, item count, location count
+_data_package_index_magic = b"APDI"
+_data_package_index_version = 1
+
+
+def _encode_id_name_table(name_to_id: typing.Mapping[str, int]) -> typing.Tuple[bytes, bytes, bytes]:
+    import array
+    names = sorted(name_to_id, key=name_to_id.__getitem__)
+    ids = array.array("q", (name_to_id[name] for name in names))
+    encoded_names = [name.encode("utf-8") for name in names]
+    ends = array.array("I", itertools.accumulate(map(len, encoded_names)))
+    if sys.byteorder == "big":
+        ids.byteswap()
+        ends.byteswap()
+    return ids.tobytes(), ends.tobytes(), b"".join(encoded_names)
+
+
+def encode_data_package_index(data: typing.Mapping[str, Any]) -> bytes:
+    """Encodes the id -> name lookups of a game's data package, see load_data_package_index."""
+    import struct
+    items = _encode_id_name_table(data["item_name_to_id"])
+    locations = _encode_id_name_table(data["location_name_to_id"])
+    return b"".join((struct.pack(_data_package_index_header, _data_package_index_magic, _data_package_index_version,
+                                 len(data["item_name_to_id"]), len(data["location_name_to_id"])),
+                     *(struct.pack("<I", len(items[2])), *items),
+                     *(struct.pack("<I", len(locations[2])), *locations)))
+
+
+def decode_data_package_index(checksum: str, data: typing.Union[bytes, memoryview, "mmap.mmap"]) -> DataPackageIndex:
+    """Reads the id -> name lookups of encode_data_package_index, without copying the data where possible."""
+    import array
+    import struct
+    view = memoryview(data)
+    magic, version, item_count, location_count = struct.unpack_from(_data_package_index_header, view)
+    if magic != _data_package_index_magic or version != _data_package_index_version:
+        raise ValueError("Unsupported data package index")
+    offset = struct.calcsize(_data_package_index_header)
+    tables: typing.List[IdNameTable] = []
+    for count in (item_count, location_count):
+        names_size, = struct.unpack_from("<I", view, offset)
+        offset += 4
+        ids: typing.Sequence[int] = view[offset:offset + 8 * count].cast("q")
+        offset += 8 * count
+        ends: typing.Sequence[int] = view[offset:offset + 4 * count].cast("I")
+        offset += 4 * count
+        if sys.byteorder == "big":
+            ids = array.array("q", ids)
+            ids.byteswap()
+            ends = array.array("I", ends)
+            ends.byteswap()
+        tables.append(IdNameTable(ids, ends, view[offset:offset + names_size]))
+        offset += names_size
+    if offset != len(view):
+        raise ValueError("Data package index has unexpected size")
+    return DataPackageIndex(checksum, *tables)
+
+
+def _store_data_package_index(game: str, data: typing.Mapping[str, Any]) -> None:
+    path = cache_path("datapackage", get_file_safe_name(game), f"{data['checksum']}.index")
+    if os.path.exists(path):
+        return  # data packages of a checksum don't change, and the existing index may be mapped right now
+    try:
+        with open(f"{path}.{os.getpid()}.tmp", "wb") as f:
+            f.write(encode_data_package_index(data))
+        os.replace(f"{path}.{os.getpid()}.tmp", path)
+    except Exception as e:
+        logging.debug(f"Could not store data package index: {e}")
+
+
+def load_data_package_index(game: str, checksum: typing.Optional[str]) -> Optional[DataPackageIndex]:
+    """
+    Loads the id -> name lookups of a cached data package by memory mapping its index, creating the index from the
+    cached data package first if there is none yet. Returns None if the data package is not cached.
+    """
+    if not checksum or not game:
+        return None
+    if checksum != get_file_safe_name(checksum):
+        raise ValueError(f"Bad symbols in checksum: {checksum}")
+    path = cache_path("datapackage", get_file_safe_name(game), f"{checksum}.index")
+    if not os.path.exists(path):
+        data = load_data_package_for_checksum(game, checksum)
+        if data.get("checksum") != checksum:
+            return None
+        _store_data_package_index(game, data)
+    try:
+        import mmap
+        with open(path, "rb") as f:
+            # the mapping stays open for as long as the index is used, closing the file doesn't unmap it
+            return decode_data_package_index(checksum, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+    except Exception as e:
+        logging.debug(f"Could not load data package index: {e}")
+        return None
 
 
 def get_default_adjuster_settings(game_name: str) -> Namespace:
@@ -24,8 +24,10 @@ if not os.path.exists(configpath):  # fall back to config.yaml in home
 
 
 def get_app() -> "Flask":
+    from pony.orm import db_session
     from WebHostLib import register, cache, app as raw_app
-    from WebHostLib.models import db
+    from WebHostLib.models import db, backfill_games_played
+    from WebHostLib.stats import get_cutoff
 
     app = raw_app
     if os.path.exists(configpath) and not app.config["TESTING"]:
@@ -50,6 +52,8 @@ def get_app() -> "Flask":
     cache.init_app(app)
     db.bind(**app.config["PONY"])
     db.generate_mapping(create_tables=True)
+    with db_session:
+        backfill_games_played(get_cutoff())
     return app
 
 
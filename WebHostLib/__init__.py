@@ -50,6 +50,7 @@ app.config["PONY"] = {
     'create_db': True
 }
 app.config["MAX_ROLL"] = 20
+app.config["YAML_CACHE"] = False  # cache parsed yamls on disk, so checking and generating the same files parses once
 app.config["CACHE_TYPE"] = "SimpleCache"
 app.config["HOST_ADDRESS"] = ""
 app.config["ASSET_RIGHTS"] = False
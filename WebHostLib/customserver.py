@@ -247,6 +247,10 @@ def run_server_process(name: str, ponyconfig: dict, static_server_data: dict,
     ssl_context = load_server_cert(cert_file, cert_key_file) if cert_file else None
     del cert_file, cert_key_file, ponyconfig
     gc.collect()  # free intermediate objects used during setup
+    # static server data is never modified and lives as long as this process, so move it (and everything else
+    # loaded so far) out of the collector's reach. Room startup runs a full collection, which would otherwise
+    # traverse all game tables every time and touch their memory pages.
+    gc.freeze()
 
     loop = asyncio.get_event_loop()
 
@@ -255,7 +259,9 @@ def run_server_process(name: str, ponyconfig: dict, static_server_data: dict,
             try:
                 logger = set_up_logging(room_id)
                 ctx = WebHostContext(static_server_data, logger)
-                ctx.load(room_id)
+                # decompressing and unpickling multidata can take a while for large rooms,
+                # so do it off the event loop, letting queued rooms load concurrently with running ones
+                await loop.run_in_executor(None, ctx.load, room_id)
                 ctx.init_save()
                 assert ctx.server is None
                 try:
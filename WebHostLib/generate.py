@@ -1,9 +1,12 @@
 import concurrent.futures
 import json
+import logging
 import os
 import pickle
 import random
 import tempfile
+import threading
+import time
 import zipfile
 from collections import Counter
 from typing import Any, Dict, List, Optional, Union, Set
@@ -11,7 +14,7 @@ from typing import Any, Dict, List, Optional, Union, Set
 from flask import flash, redirect, render_template, request, session, url_for
 from pony.orm import commit, db_session
 
-from BaseClasses import get_seed, seeddigits
+from BaseClasses import GenerationTimings, get_seed, seeddigits
 from Generate import PlandoOptions, handle_name
 from Main import main as ERmain
 from Utils import __version__
@@ -103,6 +106,10 @@ def start_generation(options: Dict[str, Union[dict, str]], meta: Dict[str, Any])
         return redirect(url_for("view_seed", seed=seed_id))
 
 
+timings_store_interval = 5
+"""seconds between storing the timings of a running generation"""
+
+
 def gen_game(gen_options: dict, meta: Optional[Dict[str, Any]] = None, owner=None, sid=None):
     if not meta:
         meta: Dict[str, Any] = {}
@@ -110,6 +117,33 @@ def gen_game(gen_options: dict, meta: Optional[Dict[str, Any]] = None, owner=Non
     meta.setdefault("server_options", {}).setdefault("hint_cost", 10)
     race = meta.setdefault("generator_options", {}).setdefault("race", False)
 
+    # store_timings and the error handling below both write Generation.meta, the lock keeps them from conflicting
+    meta_lock = threading.Lock()
+    generation_failed = False
+    last_timings_store = 0.0
+
+    def store_timings(generation_timings: GenerationTimings) -> None:
+        # keep the queued Generation up to date, so waiting for it shows which stage it is in.
+        # the full timings are rewritten every time, so only store them every few seconds
+        nonlocal last_timings_store
+        if time.monotonic() - last_timings_store < timings_store_interval:
+            return
+        with meta_lock:
+            if generation_failed:
+                return
+            try:
+                with db_session:
+                    gen = Generation.get(id=sid)
+                    if gen is not None and gen.state != STATE_ERROR:
+                        gen_meta = json.loads(gen.meta)
+                        gen_meta["timings"] = generation_timings.to_dict()
+                        gen.meta = json.dumps(gen_meta)
+            except Exception:
+                logging.exception(f"Could not store timings of generation {sid}.")
+            last_timings_store = time.monotonic()
+
+    timings = GenerationTimings(store_timings if sid else None)
+
     def task():
         target = tempfile.TemporaryDirectory()
         playercount = len(gen_options)
@@ -150,9 +184,9 @@ def gen_game(gen_options: dict, meta: Optional[Dict[str, Any]] = None, owner=Non
             erargs.name[player] = handle_name(erargs.name[player], player, name_counter)
         if len(set(erargs.name.values())) != len(erargs.name):
             raise Exception(f"Names have to be unique. Names: {Counter(erargs.name.values())}")
-        ERmain(erargs, seed, baked_server_options=meta["server_options"])
+        ERmain(erargs, seed, baked_server_options=meta["server_options"], timings=timings)
 
-        return upload_to_db(target.name, sid, owner, race)
+        return upload_to_db(target.name, sid, owner, race, timings.to_dict())
     thread_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
     thread = thread_pool.submit(task)
 
@@ -160,7 +194,8 @@ def gen_game(gen_options: dict, meta: Optional[Dict[str, Any]] = None, owner=Non
         return thread.result(app.config["JOB_TIME"])
     except concurrent.futures.TimeoutError as e:
         if sid:
-            with db_session:
+            with meta_lock, db_session:
+                generation_failed = True
                 gen = Generation.get(id=sid)
                 if gen is not None:
                     gen.state = STATE_ERROR
@@ -168,16 +203,19 @@ def gen_game(gen_options: dict, meta: Optional[Dict[str, Any]] = None, owner=Non
                     meta["error"] = (
                             "Allowed time for Generation exceeded, please consider generating locally instead. " +
                             e.__class__.__name__ + ": " + str(e))
+                    meta["timings"] = timings.to_dict()
                     gen.meta = json.dumps(meta)
                     commit()
     except BaseException as e:
         if sid:
-            with db_session:
+            with meta_lock, db_session:
+                generation_failed = True
                 gen = Generation.get(id=sid)
                 if gen is not None:
                     gen.state = STATE_ERROR
                     meta = json.loads(gen.meta)
                     meta["error"] = (e.__class__.__name__ + ": " + str(e))
+                    meta["timings"] = timings.to_dict()
                     gen.meta = json.dumps(meta)
                     commit()
         raise
@@ -193,18 +231,23 @@ def wait_seed(seed: UUID):
 
     if not generation:
         return "Generation not found."
-    elif generation.state == STATE_ERROR:
-        return render_template("seedError.html", seed_error=generation.meta)
-    return render_template("waitSeed.html", seed_id=seed_id)
+    meta = json.loads(generation.meta)
+    timings = meta.pop("timings", None)
+    if generation.state == STATE_ERROR:
+        return render_template("seedError.html", seed_error=json.dumps(meta), timings=timings)
+    return render_template("waitSeed.html", seed_id=seed_id, timings=timings)
 
 
-def upload_to_db(folder, sid, owner, race):
+def upload_to_db(folder, sid, owner, race, timings: Optional[Dict[str, Any]] = None):
     for file in os.listdir(folder):
         file = os.path.join(folder, file)
         if file.endswith(".zip"):
             with db_session:
                 with zipfile.ZipFile(file) as zfile:
-                    res = upload_zip_to_db(zfile, owner, {"race": race}, sid)
+                    meta = {"race": race}
+                    if timings:
+                        meta["timings"] = timings
+                    res = upload_zip_to_db(zfile, owner, meta, sid)
                 if type(res) == "str":
                     raise Exception(res)
                 elif res:
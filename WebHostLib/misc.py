@@ -8,7 +8,7 @@ from pony.orm import count, commit, db_session
 
 from worlds.AutoWorld import AutoWorldRegister
 from . import app, cache
-from .models import Seed, Room, Command, UUID, uuid4
+from .models import Seed, Room, Command, UUID, uuid4, count_games_played
 
 
 def get_world_theme(game_name: str):
@@ -93,6 +93,7 @@ def new_room(seed: UUID):
     if not seed:
         abort(404)
     room = Room(seed=seed, owner=session["_id"], tracker=uuid4())
+    count_games_played(room)
     commit()
     return redirect(url_for("host_room", room=room.id))
 
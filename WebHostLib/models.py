@@ -1,4 +1,5 @@
-from datetime import datetime
+from collections import Counter
+from datetime import date, datetime
 from uuid import UUID, uuid4
 from pony.orm import Database, PrimaryKey, Required, Set, Optional, buffer, LongStr
 
@@ -61,3 +62,32 @@ class Generation(db.Entity):
 class GameDataPackage(db.Entity):
     checksum = PrimaryKey(str)
     data = Required(bytes)
+
+
+class GamesPlayed(db.Entity):
+    """Daily aggregate of slots in newly created rooms per game, read by the stats page."""
+    day = Required(date)
+    game = Required(str)
+    played = Required(int, default=0)
+    PrimaryKey(day, game)
+
+
+def count_games_played(room: Room) -> None:
+    """Add the slots of a newly created room to the daily GamesPlayed aggregate. Has to be called in a db_session.
+    Counts are incremented by a single upsert, so rooms created at the same time can't conflict on the same row."""
+    day = room.creation_time.date()
+    for game, played in Counter(slot.game for slot in room.seed.slots).items():
+        if db.provider.dialect == "MySQL":
+            db.execute("INSERT INTO `GamesPlayed` (`day`, `game`, `played`) VALUES ($day, $game, $played) "
+                       "ON DUPLICATE KEY UPDATE `played` = `played` + $played")
+        else:
+            db.execute('INSERT INTO "GamesPlayed" ("day", "game", "played") VALUES ($day, $game, $played) '
+                       'ON CONFLICT ("day", "game") DO UPDATE SET "played" = "GamesPlayed"."played" + $played')
+
+
+def backfill_games_played(cutoff: date) -> None:
+    """Build the GamesPlayed aggregate from existing rooms, if it has not been populated yet."""
+    if GamesPlayed.select().exists():
+        return
+    for room in Room.select(lambda room: room.creation_time >= cutoff):
+        count_games_played(room)
@@ -1,25 +1,88 @@
 import collections.abc
+import functools
+import hashlib
 import json
 import os
 from textwrap import dedent
-from typing import Dict, Union
+from typing import Any, Dict, Optional, Tuple, Union
 from docutils.core import publish_parts
 
 import yaml
 from flask import redirect, render_template, request, Response
+from markupsafe import Markup
 
 import Options
-from Utils import local_path
+from Utils import local_path, __version__
+from worlds import get_source_checksum
 from worlds.AutoWorld import AutoWorldRegister
 from . import app, cache
 from .generate import get_meta
 
+options_pages: Dict[str, Tuple[str, bool]] = {
+    "playerOptions/playerOptions.html": ("playerOptions/optionGroups.html", False),
+    "weightedOptions/weightedOptions.html": ("weightedOptions/optionGroups.html", True),
+}
+"""page template -> (option groups template, is_complex) of the options pages.
+The option groups are rendered ahead of time, the page around them per request."""
+
 
 def create() -> None:
     target_folder = local_path("WebHostLib", "static", "generated")
     yaml_folder = os.path.join(target_folder, "configs")
 
     Options.generate_yaml_templates(yaml_folder)
+    create_options_pages()
+
+
+def create_options_pages() -> None:
+    """Renders the option groups of all worlds that changed since the last run, and removes outdated ones."""
+    target_folder = local_path("WebHostLib", "static", "generated", "options")
+    os.makedirs(target_folder, exist_ok=True)
+
+    current_files = set()
+    with app.test_request_context():
+        for world_name, world in AutoWorldRegister.world_types.items():
+            if world.hidden or world.web.options_page is False:
+                continue
+            for template, (option_groups_template, is_complex) in options_pages.items():
+                file_name = get_options_page_file_name(template, world_name)
+                current_files.add(file_name)
+                full_path = os.path.join(target_folder, file_name)
+                if not os.path.exists(full_path):
+                    page = render_template(option_groups_template,
+                                           **get_option_groups_context(world_name, is_complex))
+                    # write next to the target first, so a concurrently running server never reads a partial page
+                    with open(full_path + ".tmp", "w", encoding="utf-8") as f:
+                        f.write(page)
+                    os.replace(full_path + ".tmp", full_path)
+
+    for file in os.listdir(target_folder):
+        if file not in current_files:
+            os.unlink(os.path.join(target_folder, file))
+
+
+@functools.lru_cache(maxsize=None)
+def get_renderer_checksum() -> str:
+    """Changes whenever the templates or the option rendering in core change, which affects the pages of all worlds."""
+    return f"{get_source_checksum(local_path('WebHostLib', 'templates'))}|{get_source_checksum(Options.__file__)}"
+
+
+@functools.lru_cache(maxsize=None)
+def get_options_page_file_name(template: str, world_name: str) -> str:
+    """Unique per template, world, world version and renderer, so outdated renders never get served."""
+    world = AutoWorldRegister.world_types[world_name]
+    source_checksum = get_source_checksum(world.zip_path or os.path.dirname(world.__file__))
+    key = f"{__version__}|{template}|{world_name}|{source_checksum}|{get_renderer_checksum()}"
+    return hashlib.sha1(key.encode()).hexdigest() + ".html"
+
+
+def get_prerendered_option_groups(template: str, world_name: str) -> Optional[str]:
+    file_name = get_options_page_file_name(template, world_name)
+    try:
+        with open(local_path("WebHostLib", "static", "generated", "options", file_name), encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
 
 
 def get_world_theme(game_name: str) -> str:
@@ -28,25 +91,39 @@ def get_world_theme(game_name: str) -> str:
     return 'grass'
 
 
-def render_options_page(template: str, world_name: str, is_complex: bool = False) -> Union[Response, str]:
+def get_option_groups_context(world_name: str, is_complex: bool) -> Dict[str, Any]:
     world = AutoWorldRegister.world_types[world_name]
-    if world.hidden or world.web.options_page is False:
-        return redirect("games")
     visibility_flag = Options.Visibility.complex_ui if is_complex else Options.Visibility.simple_ui
 
     start_collapsed = {"Game Options": False}
     for group in world.web.option_groups:
         start_collapsed[group.name] = group.start_collapsed
 
+    return {
+        "world_name": world_name,
+        "world": world,
+        "option_groups": Options.get_option_groups(world, visibility_level=visibility_flag),
+        "start_collapsed": start_collapsed,
+        "issubclass": issubclass,
+        "Options": Options,
+    }
+
+
+def render_options_page(template: str, world_name: str, is_complex: bool = False) -> Union[Response, str]:
+    world = AutoWorldRegister.world_types[world_name]
+    if world.hidden or world.web.options_page is False:
+        return redirect("games")
+    # the page itself shows flashed messages and request specific urls, so only its option groups are reused
+    prerendered = get_prerendered_option_groups(template, world_name)
+    if prerendered is not None:
+        context = {"world_name": world_name, "world": world, "prerendered_option_groups": Markup(prerendered)}
+    else:
+        context = get_option_groups_context(world_name, is_complex)
+
     return render_template(
         template,
-        world_name=world_name,
-        world=world,
-        option_groups=Options.get_option_groups(world, visibility_level=visibility_flag),
-        start_collapsed=start_collapsed,
-        issubclass=issubclass,
-        Options=Options,
         theme=get_world_theme(world_name),
+        **context,
     )
 
 
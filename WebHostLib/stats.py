@@ -13,7 +13,7 @@ from flask import render_template
 from pony.orm import select
 
 from . import app, cache
-from .models import Room
+from .models import GamesPlayed
 
 PLOT_WIDTH = 600
 
@@ -22,16 +22,18 @@ def get_db_data(known_games: typing.Set[str]) -> typing.Tuple[typing.Counter[str
                                                               typing.DefaultDict[datetime.date, typing.Dict[str, int]]]:
     games_played = defaultdict(Counter)
     total_games = Counter()
-    cutoff = date.today() - timedelta(days=30)
-    room: Room
-    for room in select(room for room in Room if room.creation_time >= cutoff):
-        for slot in room.seed.slots:
-            if slot.game in known_games:
-                total_games[slot.game] += 1
-                games_played[room.creation_time.date()][slot.game] += 1
+    cutoff = get_cutoff()
+    for day, game, played in select((stat.day, stat.game, stat.played) for stat in GamesPlayed if stat.day >= cutoff):
+        if game in known_games:
+            total_games[game] += played
+            games_played[day][game] += played
     return total_games, games_played
 
 
+def get_cutoff() -> date:
+    return date.today() - timedelta(days=30)
+
+
 def get_color_palette(colors_needed: int) -> typing.List[RGB]:
     colors = []
     # colors_needed +1 to prevent first and last color being too close to each other
@@ -9,7 +9,8 @@ from flask import render_template, make_response, Response, request
 from werkzeug.exceptions import abort
 
 from MultiServer import Context, get_saving_second
-from NetUtils import ClientStatus, Hint, NetworkItem, NetworkSlot, SlotType
+from NetUtils import ClientStatus, Hint, NetworkItem, NetworkSlot, SlotType, decode_location_columns, \
+    decode_sphere_columns
 from Utils import restricted_loads, KeyedDefaultDict
 from . import app, cache
 from .models import GameDataPackage, Room
@@ -57,6 +58,9 @@ class TrackerData:
         """Initialize a new RoomMultidata object for the current room."""
         self.room = room
         self._multidata = Context.decompress(room.seed.multidata)
+        if "location_columns" in self._multidata:
+            self._multidata["locations"] = decode_location_columns(self._multidata.pop("location_columns"))
+            self._multidata["spheres"] = decode_sphere_columns(self._multidata.pop("sphere_columns"))
         self._multisave = restricted_loads(room.multisave) if room.multisave else {}
         self._tracker_cache = {}
 
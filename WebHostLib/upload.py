@@ -1,5 +1,7 @@
 import base64
+import concurrent.futures
 import json
+import logging
 import pickle
 import typing
 import uuid
@@ -9,7 +11,7 @@ import zlib
 from io import BytesIO
 from flask import request, flash, redirect, url_for, session, render_template, abort
 from markupsafe import Markup
-from pony.orm import commit, flush, select, rollback
+from pony.orm import commit, db_session, flush, select, rollback
 from pony.orm.core import TransactionIntegrityError
 import schema
 
@@ -48,19 +50,24 @@ def banned_file(filename: str) -> bool:
     return filename.endswith(banned_extensions)
 
 
-def process_multidata(compressed_multidata, files={}):
+def process_multidata(compressed_multidata, files={}) -> typing.Tuple[typing.Set[Slot], bytes, bool]:
+    """Stores the data packages embedded in the multidata and creates its slots.
+    The multidata is returned as uploaded, the last value tells if it still embeds data packages that should be
+    stripped by queue_strip_data_package once its Seed is committed."""
     game_data: GamesPackage
 
     decompressed_multidata = MultiServer.Context.decompress(compressed_multidata)
 
     slots: typing.Set[Slot] = set()
+    embeds_data_package = False
     if "datapackage" in decompressed_multidata:
-        # strip datapackage from multidata, leaving only the checksums
+        # move the datapackage into the database, the multidata itself only needs the checksums
         game_data_packages: typing.List[GameDataPackage] = []
         for game, game_data in decompressed_multidata["datapackage"].items():
             if game_data.get("checksum"):
-                original_checksum = game_data.pop("checksum")
-                game_data = games_package_schema.validate(game_data)
+                original_checksum = game_data["checksum"]
+                game_data = games_package_schema.validate(
+                    {key: value for key, value in game_data.items() if key != "checksum"})
                 game_data = {key: value for key, value in sorted(game_data.items())}
                 game_data["checksum"] = data_package_checksum(game_data)
                 if original_checksum != game_data["checksum"]:
@@ -68,12 +75,12 @@ def process_multidata(compressed_multidata, files={}):
                                     f"calculated checksum {game_data['checksum']} "
                                     f"for game {game}.")
 
+                embeds_data_package = True
+                if GameDataPackage.exists(checksum=game_data["checksum"]):
+                    continue  # most uploads use known data packages, skip pickling and a failing commit
+
                 game_data_package = GameDataPackage(checksum=game_data["checksum"],
                                                     data=pickle.dumps(game_data))
-                decompressed_multidata["datapackage"][game] = {
-                    "version": game_data.get("version", 0),
-                    "checksum": game_data["checksum"],
-                }
                 try:
                     commit()  # commit game data package
                     game_data_packages.append(game_data_package)
@@ -92,8 +99,56 @@ def process_multidata(compressed_multidata, files={}):
                            game=slot_info.game))
         flush()  # commit slots
 
-    compressed_multidata = compressed_multidata[0:1] + zlib.compress(pickle.dumps(decompressed_multidata), 9)
-    return slots, compressed_multidata
+    return slots, compressed_multidata, embeds_data_package
+
+
+def strip_data_package(decompressed_multidata: typing.Dict[str, typing.Any]) -> bool:
+    """Replaces embedded data packages with their version and checksum. Returns if anything was stripped."""
+    stripped = False
+    for game, game_data in decompressed_multidata.get("datapackage", {}).items():
+        if game_data.get("checksum") and game_data.keys() - {"version", "checksum"}:
+            decompressed_multidata["datapackage"][game] = {
+                "version": game_data.get("version", 0),
+                "checksum": game_data["checksum"],
+            }
+            stripped = True
+    return stripped
+
+
+def strip_seed_data_package(seed_id: uuid.UUID) -> None:
+    """Re-encodes a seed's multidata without its embedded data packages, which process_multidata stored already.
+    Rooms and trackers look data packages up by checksum, so the seed is usable before and after this ran."""
+    with db_session:
+        seed = Seed.get(id=seed_id)
+        if not seed:
+            return  # deleted in the meantime
+        compressed_multidata = seed.multidata
+
+    decompressed_multidata = MultiServer.Context.decompress(compressed_multidata)
+    if not strip_data_package(decompressed_multidata):
+        return
+    stripped_multidata = compressed_multidata[0:1] + zlib.compress(pickle.dumps(decompressed_multidata), 9)
+
+    with db_session:
+        seed = Seed.get(id=seed_id)
+        if seed and seed.multidata == compressed_multidata:
+            seed.multidata = stripped_multidata
+
+
+def _strip_seed_data_package_logged(seed_id: uuid.UUID) -> None:
+    try:
+        strip_seed_data_package(seed_id)
+    except Exception:
+        logging.exception(f"Could not strip data package of seed {seed_id}, keeping it embedded.")
+
+
+# re-encoding 100MB of multidata takes a while, so it is done in the background instead of the request
+_data_package_stripper = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="StripDataPackage")
+
+
+def queue_strip_data_package(seed_id: uuid.UUID) -> concurrent.futures.Future:
+    """Strips the seed's embedded data packages in the background. The seed has to be committed already."""
+    return _data_package_stripper.submit(_strip_seed_data_package_logged, seed_id)
 
 
 def upload_zip_to_db(zfile: zipfile.ZipFile, owner=None, meta={"race": False}, sid=None):
@@ -163,13 +218,16 @@ def upload_zip_to_db(zfile: zipfile.ZipFile, owner=None, meta={"race": False}, s
 
     # Load multi data.
     if multidata:
-        slots, multidata = process_multidata(multidata, files)
+        slots, multidata, embeds_data_package = process_multidata(multidata, files)
 
         seed = Seed(multidata=multidata, spoiler=spoiler, slots=slots, owner=owner, meta=json.dumps(meta),
                     id=sid if sid else uuid.uuid4())
         flush()  # create seed
         for slot in slots:
             slot.seed = seed
+        if embeds_data_package:
+            commit()  # the background task can only find committed seeds
+            queue_strip_data_package(seed.id)
         return seed
     else:
         flash("No multidata was found in the zip file, which is required.")
@@ -205,12 +263,15 @@ def uploads():
                     # noinspection PyBroadException
                     try:
                         multidata = uploaded_file.read()
-                        slots, multidata = process_multidata(multidata)
+                        slots, multidata, embeds_data_package = process_multidata(multidata)
                     except Exception as e:
                         flash(f"Could not load multidata. File may be corrupted or incompatible. ({e})")
                     else:
                         seed = Seed(multidata=multidata, slots=slots, owner=session["_id"])
                         flush()  # place into DB and generate ids
+                        if embeds_data_package:
+                            commit()  # the background task can only find committed seeds
+                            queue_strip_data_package(seed.id)
                         return redirect(url_for("view_seed", seed=seed.id))
             else:
                 flash("Not recognized file format. Awaiting a .archipelago file or .zip containing one.")
@@ -99,7 +99,7 @@ class ZeldaContext(CommonContext):
 
     def on_print_json(self, args: dict):
         if self.ui:
-            self.ui.print_json(copy.deepcopy(args["data"]))
+            self.ui.print_json(copy.deepcopy(args["data"]), args.get("type", ""))
         else:
             text = self.jsontotextparser(copy.deepcopy(args["data"]))
             logger.info(text)
@@ -11,6 +11,8 @@ This is deliberately .pyx because using a non-compiled "pure python" may be slow
 import cython
 import warnings
 from cpython cimport PyObject
+from cpython.dict cimport PyDict_GetItem
+from cpython.list cimport PyList_GET_ITEM, PyList_GET_SIZE
 from typing import Any, Dict, Iterable, Iterator, Generator, Sequence, Tuple, TypeVar, Union, Set, List, TYPE_CHECKING
 from cymem.cymem cimport Pool
 from libc.stdint cimport int64_t, uint32_t
@@ -102,7 +104,6 @@ cdef class LocationStore:
 
     def __init__(self, locations_dict: Dict[int, Dict[int, Sequence[int]]]) -> None:
         self._mem = Pool()
-        cdef object key
         self._keys = []
         self._items = []
         self._proxies = []
@@ -136,10 +137,7 @@ cdef class LocationStore:
         if not count:
             warnings.warn("Game has no locations")
 
-        # allocate the arrays and invalidate index (0xff...)
-        self.entries = <LocationEntry*>self._mem.alloc(count, sizeof(LocationEntry))
-        self.sender_index = <IndexEntry*>self._mem.alloc(max_sender + 1, sizeof(IndexEntry))
-        self._raw_proxies = <PyObject**>self._mem.alloc(max_sender + 1, sizeof(PyObject*))
+        self._alloc(max_sender, count)
 
         # build entries and index
         cdef size_t i = 0
@@ -158,6 +156,17 @@ cdef class LocationStore:
                 self.sender_index[sender].count += 1
                 i += 1
 
+        self._build_caches(max_sender, count, sender_count)
+
+    cdef _alloc(self, size_t max_sender, size_t count):
+        # allocate the arrays and invalidate index (0xff...)
+        self.entries = <LocationEntry*>self._mem.alloc(count, sizeof(LocationEntry))
+        self.sender_index = <IndexEntry*>self._mem.alloc(max_sender + 1, sizeof(IndexEntry))
+        self._raw_proxies = <PyObject**>self._mem.alloc(max_sender + 1, sizeof(PyObject*))
+
+    cdef _build_caches(self, size_t max_sender, size_t count, size_t sender_count):
+        cdef object key
+        cdef size_t i
         # build pyobject caches
         self._proxies.append(None)  # player 0
         assert self.sender_index[0].count == 0
@@ -176,6 +185,64 @@ cdef class LocationStore:
         self.entry_count = count
         self._len = sender_count
 
+    @classmethod
+    def from_columns(cls, columns: Dict[int, Tuple[Sequence[int], Sequence[int], Sequence[int], Sequence[int]]]
+                     ) -> LocationStore:
+        """Creates the store from the columns of each slot, see NetUtils.read_location_columns."""
+        cdef LocationStore store = cls.__new__(cls)
+        store._mem = Pool()
+        store._keys = []
+        store._items = []
+        store._proxies = []
+
+        cdef const int64_t[:] locations
+        cdef const int64_t[:] items
+        cdef const uint32_t[:] receivers
+        cdef const uint32_t[:] flags
+        cdef size_t max_sender = 0
+        cdef size_t count = 0
+        cdef size_t j
+        for sender, slot_columns in columns.items():
+            if not isinstance(sender, int) or sender < 1 or sender > MAX_PLAYER_ID:
+                raise ValueError(f"Invalid player id {sender} for location")
+            max_sender = max(max_sender, sender)
+            if len(set(map(len, slot_columns))) != 1:
+                raise ValueError(f"Columns of player {sender} differ in length")
+            count += len(slot_columns[0])
+
+        if not columns:
+            raise ValueError(f"Rejecting game with 0 players")
+
+        if <size_t>len(columns) != max_sender:
+            # we assume player 0 will never have locations
+            raise ValueError("Player IDs not continuous")
+
+        if not count:
+            warnings.warn("Game has no locations")
+
+        store._alloc(max_sender, count)
+
+        # copy columns into entries and build index, requiring locations to be sorted already
+        cdef size_t i = 0
+        for sender in range(1, max_sender + 1):
+            locations, items, receivers, flags = columns[sender]
+            store.sender_index[sender].start = i
+            store.sender_index[sender].count = locations.shape[0]
+            for j in range(<size_t>locations.shape[0]):
+                if j and locations[j] <= locations[j - 1]:
+                    raise ValueError(f"Locations of player {sender} not sorted")
+                if receivers[j] < 1 or receivers[j] > MAX_PLAYER_ID:
+                    raise ValueError(f"Invalid player id {receivers[j]} for item")
+                store.entries[i].sender = sender
+                store.entries[i].location = locations[j]
+                store.entries[i].item = items[j]
+                store.entries[i].receiver = receivers[j]
+                store.entries[i].flags = flags[j]
+                i += 1
+
+        store._build_caches(max_sender, count, len(columns))
+        return store
+
     # fake dict access
     def __len__(self) -> int:
         return self._len
@@ -363,3 +430,349 @@ cdef class PlayerLocationProxy:
         count = self._store.sender_index[self._player].count
         for entry in self._store.entries[start:start+count]:
             yield entry.location, (entry.item, entry.receiver, entry.flags)
+
+
+# CollectionState core
+# Native versions of the hottest CollectionState methods, installed over the pure python ones in BaseClasses.
+# They work directly on the list behind ItemCounts and the flags behind StateSets,
+# and inline Region/Entrance/Location.can_reach for types that don't override it.
+
+cdef object _region_can_reach = None
+cdef object _entrance_can_reach = None
+cdef object _location_can_reach = None
+cdef object _item_type = None
+cdef object _item_counts_type = None
+cdef dict _inline_can_reach = {}  # type -> can_reach is the base implementation
+
+
+cdef inline Py_ssize_t _item_index(object item_index, object name):
+    cdef PyObject* index = PyDict_GetItem(item_index, name)
+    if index is NULL:
+        return 0
+    return <Py_ssize_t><object>index
+
+
+cdef inline object _get_item_counts(object state, object player):
+    item_counts = state.prog_items[player]
+    if type(item_counts) is not _item_counts_type:
+        return state.get_item_counts(player)
+    return item_counts
+
+
+cdef inline object _count_at(list counts, Py_ssize_t index):
+    # same as ItemCounts.count_index, counts can be shorter than the ItemIndex
+    if 0 <= index < PyList_GET_SIZE(counts):
+        return <object>PyList_GET_ITEM(counts, index)
+    return 0
+
+
+cdef inline bint _contains(object state_set, object obj):
+    # same as StateSet.__contains__
+    cdef bytearray flags = state_set.flags
+    cdef Py_ssize_t index = getattr(obj, "_state_index", 0)
+    if index <= 0 or index >= len(flags) or not flags[index]:
+        return False
+    return <object>PyList_GET_ITEM(state_set.state_index, index) is obj
+
+
+cdef inline void _remove(object state_set, object obj) except *:
+    # same as StateSet.remove
+    cdef bytearray flags = state_set.flags
+    if not _contains(state_set, obj):
+        raise KeyError(obj)
+    flags[<Py_ssize_t>obj._state_index] = 0
+
+
+cdef bint _is_inlined(object obj, object base_can_reach):
+    cdef object obj_type = type(obj)
+    cdef PyObject* inlined = PyDict_GetItem(_inline_can_reach, obj_type)
+    if inlined is NULL:
+        _inline_can_reach[obj_type] = getattr(obj_type, "can_reach", None) is base_can_reach
+        return _inline_can_reach[obj_type]
+    return <object>inlined
+
+
+cdef bint _region_reachable(object region, object state):
+    if not _is_inlined(region, _region_can_reach):
+        return region.can_reach(state)
+    player = region.player
+    if state.stale[player]:
+        state.update_reachable_regions(player)
+    cdef bytearray flags = state.reachable_regions[player].flags
+    cdef Py_ssize_t index = region._state_index
+    return 0 <= index < len(flags) and flags[index] == 1
+
+
+cdef bint _entrance_reachable(object entrance, object state):
+    if not _is_inlined(entrance, _entrance_can_reach):
+        return entrance.can_reach(state)
+    parent_region = entrance.parent_region
+    if _region_reachable(parent_region, state) and entrance.access_rule(state):
+        path = state.path
+        if not entrance.hide_path and entrance not in path:
+            path[entrance] = (entrance.name, path.get(parent_region, (parent_region.name, None)))
+        return True
+    return False
+
+
+cdef bint _location_reachable(object location, object state):
+    if not _is_inlined(location, _location_can_reach):
+        return location.can_reach(state)
+    parent_region = location.parent_region
+    assert parent_region, "Can't reach location without region"
+    return _region_reachable(parent_region, state) and location.access_rule(state)
+
+
+def has_all(state, items, player) -> bool:
+    item_counts = _get_item_counts(state, player)
+    cdef list counts = item_counts.counts
+    item_index = item_counts.item_index
+    for item in items:
+        if not _count_at(counts, _item_index(item_index, item)):
+            return False
+    return True
+
+
+def has_any(state, items, player) -> bool:
+    item_counts = _get_item_counts(state, player)
+    cdef list counts = item_counts.counts
+    item_index = item_counts.item_index
+    for item in items:
+        if _count_at(counts, _item_index(item_index, item)):
+            return True
+    return False
+
+
+def has_all_counts(state, item_counts, player) -> bool:
+    player_item_counts = _get_item_counts(state, player)
+    cdef list counts = player_item_counts.counts
+    item_index = player_item_counts.item_index
+    for item, count in item_counts.items():
+        if not _count_at(counts, _item_index(item_index, item)) >= count:
+            return False
+    return True
+
+
+def has_any_count(state, item_counts, player) -> bool:
+    player_item_counts = _get_item_counts(state, player)
+    cdef list counts = player_item_counts.counts
+    item_index = player_item_counts.item_index
+    for item, count in item_counts.items():
+        if _count_at(counts, _item_index(item_index, item)) >= count:
+            return True
+    return False
+
+
+def has_from_list(state, items, player, count) -> bool:
+    item_counts = _get_item_counts(state, player)
+    cdef list counts = item_counts.counts
+    item_index = item_counts.item_index
+    found = 0
+    for item_name in items:
+        found += _count_at(counts, _item_index(item_index, item_name))
+        if found >= count:
+            return True
+    return False
+
+
+def has_from_list_unique(state, items, player, count) -> bool:
+    item_counts = _get_item_counts(state, player)
+    cdef list counts = item_counts.counts
+    item_index = item_counts.item_index
+    found = 0
+    for item_name in items:
+        if _count_at(counts, _item_index(item_index, item_name)) > 0:
+            found += 1
+        if found >= count:
+            return True
+    return False
+
+
+def count_from_list(state, items, player) -> int:
+    item_counts = _get_item_counts(state, player)
+    cdef list counts = item_counts.counts
+    item_index = item_counts.item_index
+    found = 0
+    for item_name in items:
+        found += _count_at(counts, _item_index(item_index, item_name))
+    return found
+
+
+def count_from_list_unique(state, items, player) -> int:
+    item_counts = _get_item_counts(state, player)
+    cdef list counts = item_counts.counts
+    item_index = item_counts.item_index
+    cdef Py_ssize_t found = 0
+    for item_name in items:
+        if _count_at(counts, _item_index(item_index, item_name)) > 0:
+            found += 1
+    return found
+
+
+def has_all_indices(state, indices, player) -> bool:
+    cdef list counts = _get_item_counts(state, player).counts
+    cdef Py_ssize_t index
+    for index in indices:
+        if not _count_at(counts, index):
+            return False
+    return True
+
+
+def has_any_indices(state, indices, player) -> bool:
+    cdef list counts = _get_item_counts(state, player).counts
+    cdef Py_ssize_t index
+    for index in indices:
+        if _count_at(counts, index):
+            return True
+    return False
+
+
+def has_from_indices(state, indices, player, count) -> bool:
+    cdef list counts = _get_item_counts(state, player).counts
+    cdef Py_ssize_t index
+    found = 0
+    for index in indices:
+        found += _count_at(counts, index)
+        if found >= count:
+            return True
+    return False
+
+
+def has_from_indices_unique(state, indices, player, count) -> bool:
+    cdef list counts = _get_item_counts(state, player).counts
+    cdef Py_ssize_t index
+    found = 0
+    for index in indices:
+        if _count_at(counts, index) > 0:
+            found += 1
+        if found >= count:
+            return True
+    return False
+
+
+def count_indices(state, indices, player) -> int:
+    cdef list counts = _get_item_counts(state, player).counts
+    cdef Py_ssize_t index
+    found = 0
+    for index in indices:
+        found += _count_at(counts, index)
+    return found
+
+
+def count_indices_unique(state, indices, player) -> int:
+    cdef list counts = _get_item_counts(state, player).counts
+    cdef Py_ssize_t index
+    cdef Py_ssize_t found = 0
+    for index in indices:
+        if _count_at(counts, index) > 0:
+            found += 1
+    return found
+
+
+def _update_reachable_regions_explicit_indirect_conditions(state, player, queue) -> None:
+    reachable_regions = state.reachable_regions[player]
+    blocked_connections = state.blocked_connections[player]
+    indirect_connections = state.multiworld.indirect_connections
+    cdef dict path = state.path
+    # run BFS on all connections, and keep track of those blocked by missing items
+    while queue:
+        connection = queue.popleft()
+        new_region = connection.connected_region
+        if _contains(reachable_regions, new_region):
+            _remove(blocked_connections, connection)
+        elif _entrance_reachable(connection, state):
+            assert new_region, f"tried to search through an Entrance \"{connection}\" with no Region"
+            reachable_regions.add(new_region)
+            _remove(blocked_connections, connection)
+            blocked_connections.update(new_region.exits)
+            queue.extend(new_region.exits)
+            path[new_region] = (new_region.name, path.get(connection, None))
+
+            # Retry connections if the new region can unblock them
+            for new_entrance in indirect_connections.get(new_region, ()):
+                if _contains(blocked_connections, new_entrance) and new_entrance not in queue:
+                    queue.append(new_entrance)
+
+
+def _update_reachable_regions_auto_indirect_conditions(state, player, queue) -> None:
+    reachable_regions = state.reachable_regions[player]
+    blocked_connections = state.blocked_connections[player]
+    cdef dict path = state.path
+    cdef bint new_connection = True
+    # run BFS on all connections, and keep track of those blocked by missing items
+    while new_connection:
+        new_connection = False
+        while queue:
+            connection = queue.popleft()
+            new_region = connection.connected_region
+            if _contains(reachable_regions, new_region):
+                _remove(blocked_connections, connection)
+            elif _entrance_reachable(connection, state):
+                assert new_region, f"tried to search through an Entrance \"{connection}\" with no Region"
+                reachable_regions.add(new_region)
+                _remove(blocked_connections, connection)
+                blocked_connections.update(new_region.exits)
+                queue.extend(new_region.exits)
+                path[new_region] = (new_region.name, path.get(connection, None))
+                new_connection = True
+        # sweep for indirect connections, mostly Entrance.can_reach(unrelated_Region)
+        queue.extend(blocked_connections)
+
+
+def sweep_for_advancements(state, locations=None) -> None:
+    if locations is None:
+        locations = state.multiworld.get_filled_locations()
+    advancements = state.advancements
+    # since the loop has a good chance to run more than once, only filter the advancements once
+    cdef list pending = [location for location in locations
+                         if location.advancement and not _contains(advancements, location)]
+    cdef list reachable_advancements
+    cdef list unreachable
+    while pending:
+        reachable_advancements = []
+        unreachable = []
+        for location in pending:
+            if _location_reachable(location, state):
+                reachable_advancements.append(location)
+            else:
+                unreachable.append(location)
+        if not reachable_advancements:
+            break
+        pending = unreachable
+        for advancement in reachable_advancements:
+            advancements.add(advancement)
+            assert isinstance(advancement.item, _item_type), "tried to collect Event with no Item"
+            state.collect(advancement.item, True, advancement)
+
+
+def collection_state_methods(region_type: type, entrance_type: type, location_type: type, item_type: type,
+                             item_counts_type: Any) -> Dict[str, Any]:
+    """Returns the native CollectionState methods by name.
+    The pure python can_reach of the passed types is inlined for all types that don't override it."""
+    global _region_can_reach, _entrance_can_reach, _location_can_reach, _item_type, _item_counts_type
+    _region_can_reach = region_type.can_reach
+    _entrance_can_reach = entrance_type.can_reach
+    _location_can_reach = location_type.can_reach
+    _item_type = item_type
+    _item_counts_type = item_counts_type
+    _inline_can_reach.clear()
+    return {
+        "has_all": has_all,
+        "has_any": has_any,
+        "has_all_counts": has_all_counts,
+        "has_any_count": has_any_count,
+        "has_from_list": has_from_list,
+        "has_from_list_unique": has_from_list_unique,
+        "count_from_list": count_from_list,
+        "count_from_list_unique": count_from_list_unique,
+        "has_all_indices": has_all_indices,
+        "has_any_indices": has_any_indices,
+        "has_from_indices": has_from_indices,
+        "has_from_indices_unique": has_from_indices_unique,
+        "count_indices": count_indices,
+        "count_indices_unique": count_indices_unique,
+        "_update_reachable_regions_explicit_indirect_conditions":
+            _update_reachable_regions_explicit_indirect_conditions,
+        "_update_reachable_regions_auto_indirect_conditions": _update_reachable_regions_auto_indirect_conditions,
+        "sweep_for_advancements": sweep_for_advancements,
+    }
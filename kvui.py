@@ -459,6 +459,10 @@ class GameManager(App):
     ]
     base_title: str = "Archipelago Client"
     last_autofillable_command: str
+    filterable_message_types: typing.ClassVar[typing.Tuple[str, ...]] = ("ItemSend", "Hint", "Chat", "ServerChat",
+                                                                          "Join", "Part", "Goal", "Release", "Collect")
+    """ PrintJSON types that can be hidden from the log tabs with /filter """
+    hidden_message_types: typing.FrozenSet[str]
 
     main_area_container: GridLayout
     """ subclasses can add more columns beside the tabs """
@@ -470,6 +474,7 @@ class GameManager(App):
         self.icon = r"data/icon.png"
         self.json_to_kivy_parser = KivyJSONtoTextParser(ctx)
         self.log_panels: typing.Dict[str, Widget] = {}
+        self.hidden_message_types = frozenset()
 
         # keep track of last used command to autofill on click
         self.last_autofillable_command = "hint"
@@ -637,10 +642,19 @@ class GameManager(App):
         except Exception as e:
             logging.getLogger("Client").exception(e)
 
-    def print_json(self, data: typing.List[JSONMessagePart]):
+    def print_json(self, data: typing.List[JSONMessagePart], message_type: str = ""):
         text = self.json_to_kivy_parser(data)
-        self.log_panels["Archipelago"].on_message_markup(text)
-        self.log_panels["All"].on_message_markup(text)
+        self.log_panels["Archipelago"].on_message_markup(text, message_type)
+        self.log_panels["All"].on_message_markup(text, message_type)
+
+    def toggle_hidden_message_type(self, message_type: str) -> bool:
+        """Hides or shows PrintJSON messages of message_type in the log tabs. Returns whether they are now hidden."""
+        hidden = self.hidden_message_types ^ {message_type}
+        self.hidden_message_types = hidden
+        for panel in self.log_panels.values():
+            if isinstance(panel, UILog):
+                panel.set_hidden_types(hidden)
+        return message_type in hidden
 
     def focus_textinput(self):
         if hasattr(self, "textinput"):
@@ -693,24 +707,55 @@ class LogtoUI(logging.Handler):
 
 class UILog(RecycleView):
     messages: typing.ClassVar[int]  # comes from kv file
+    entries: typing.Deque[typing.Tuple[str, typing.Dict[str, str]]]
+    """(message type, view data) of the last `messages` messages, whether shown or hidden by the filter"""
+    pending: typing.Deque[typing.Tuple[str, typing.Dict[str, str]]]
+    """messages received since the last frame, moved into entries by flush"""
+    hidden_types: typing.FrozenSet[str]
 
     def __init__(self, *loggers_to_handle, **kwargs):
         super(UILog, self).__init__(**kwargs)
         self.data = []
+        self.entries = deque(maxlen=self.messages)
+        self.pending = deque(maxlen=self.messages)
+        self.hidden_types = frozenset()
+        self.flush_trigger = Clock.create_trigger(self.flush)
         for logger in loggers_to_handle:
             logger.addHandler(LogtoUI(self.on_log))
 
     def on_log(self, record: str) -> None:
-        self.data.append({"text": escape_markup(record)})
-        self.clean_old()
+        self.add_entry("", {"text": escape_markup(record)})
 
-    def on_message_markup(self, text):
-        self.data.append({"text": text})
-        self.clean_old()
+    def on_message_markup(self, text, message_type: str = ""):
+        self.add_entry(message_type, {"text": text})
 
-    def clean_old(self):
-        if len(self.data) > self.messages:
-            self.data.pop(0)
+    def add_entry(self, message_type: str, view_data: typing.Dict[str, str]) -> None:
+        """Queues a message to be shown on the next frame, so a burst of messages only updates the view once."""
+        self.pending.append((message_type, view_data))
+        self.flush_trigger()
+
+    def flush(self, dt: typing.Optional[float] = None) -> None:
+        """Moves the queued messages into the log and updates the view with them."""
+        new_entries = [self.pending.popleft() for _ in range(len(self.pending))]
+        if not new_entries:
+            return
+        full = len(self.entries) + len(new_entries) > self.messages
+        self.entries.extend(new_entries)
+        if full:
+            # old messages dropped out of entries, so rebuild instead of appending
+            self.data = self.visible_data()
+        else:
+            self.data.extend(view_data for message_type, view_data in new_entries
+                             if message_type not in self.hidden_types)
+
+    def visible_data(self) -> typing.List[typing.Dict[str, str]]:
+        return [view_data for message_type, view_data in self.entries if message_type not in self.hidden_types]
+
+    def set_hidden_types(self, hidden_types: typing.AbstractSet[str]) -> None:
+        """Hides messages of the given PrintJSON types, including ones already in the log."""
+        self.hidden_types = frozenset(hidden_types)
+        self.flush()
+        self.data = self.visible_data()
 
     def fix_heights(self):
         """Workaround fix for divergent texture and layout heights"""
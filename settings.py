@@ -14,7 +14,7 @@ from threading import Lock
 from typing import cast, Any, BinaryIO, ClassVar, Dict, Iterator, List, Optional, TextIO, Tuple, Union, TypeVar
 
 __all__ = [
-    "get_settings", "fmt_doc", "no_gui",
+    "get_settings", "fmt_doc", "no_gui", "lazy_world_loading", "profile_world_imports",
     "Group", "Bool", "Path", "UserFilePath", "UserFolderPath", "LocalFilePath", "LocalFolderPath",
     "OptionalUserFilePath", "OptionalUserFolderPath", "OptionalLocalFilePath", "OptionalLocalFolderPath",
     "GeneralOptions", "ServerOptions", "GeneratorOptions", "SNIOptions", "Settings"
@@ -22,6 +22,10 @@ __all__ = [
 
 no_gui = False
 skip_autosave = False
+lazy_world_loading = False
+"""Import worlds on first lookup instead of on worlds import, see worlds.world_manifest."""
+profile_world_imports = False
+"""Record per module import times and memory of each world, see worlds.WorldSource.import_profile."""
 _world_settings_name_cache: Dict[str, str] = {}  # TODO: cache on disk and update when worlds change
 _world_settings_name_cache_updated = False
 _lock = Lock()
@@ -662,6 +666,16 @@ class GeneratorOptions(Group):
         start_inventory -> Move remaining items to start_inventory, generate additional filler items to fill locations.
         """
 
+    class YamlCache(Bool):
+        """Cache parsed player files, so generating again with the same files doesn't have to parse them again"""
+
+    class OutputProcesses(int):
+        """
+        Amount of processes to generate output files in, for worlds that support it
+        0 -> generate all output in threads of the generator process
+        Only used on platforms that can fork processes, like Linux and macOS
+        """
+
     enemizer_path: EnemizerPath = EnemizerPath("EnemizerCLI/EnemizerCLI.Core")  # + ".exe" is implied on Windows
     player_files_path: PlayerFilesPath = PlayerFilesPath("Players")
     players: Players = Players(0)
@@ -671,6 +685,8 @@ class GeneratorOptions(Group):
     race: Race = Race(0)
     plando_options: PlandoOptions = PlandoOptions("bosses, connections, texts")
     panic_method: PanicMethod = PanicMethod("swap")
+    yaml_cache: Union[YamlCache, bool] = False
+    output_processes: OutputProcesses = OutputProcesses(0)
 
 
 class SNIOptions(Group):
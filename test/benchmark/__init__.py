@@ -5,3 +5,7 @@ if __name__ == "__main__":
     load_worlds.run_load_worlds_benchmark()
     import locations
     locations.run_locations_benchmark()
+    import memory
+    memory.run_memory_benchmark()
+    import patch
+    patch.run_patch_benchmark()
@@ -1,15 +1,20 @@
-def run_load_worlds_benchmark():
-    """List worlds and their load time.
+def run_load_worlds_benchmark(time_budget: float = 0.0, memory_budget: float = 0.0, modules_shown: int = 5) -> bool:
+    """List worlds and their load time, followed by their slowest modules to import.
     Note that any first-time imports will be attributed to that world, as it is cached afterwards.
-    Likely best used with isolated worlds to measure their time alone."""
+    Likely best used with isolated worlds to measure their time alone.
+    Memory tracing slows imports down, so the times are higher than without the benchmark.
+    Returns False if any world took longer than time_budget seconds or more than memory_budget MiB to load,
+    a budget of 0 is not checked."""
     import logging
 
+    import settings
     from Utils import init_logging
 
     # get some general imports cached, to prevent it from being attributed to one world.
     import orjson
     orjson.loads("{}")  # orjson runs initialization on first use
 
+    settings.profile_world_imports = True
     import BaseClasses, Launcher, Fill
 
     from worlds import world_sources
@@ -20,8 +25,32 @@ def run_load_worlds_benchmark():
     for module in world_sources:
         logger.info(f"{module} took {module.time_taken:.4f} seconds.")
 
+    over_budget = []
+    for module in sorted((module for module in world_sources if module.import_profile),
+                         key=lambda module: module.time_taken, reverse=True):
+        logger.info(module.import_profile.report(modules_shown))
+        memory_taken = module.import_profile.memory_delta / 1024 / 1024
+        if (time_budget and module.time_taken > time_budget) or (memory_budget and memory_taken > memory_budget):
+            over_budget.append(f"{module.path} ({module.time_taken:.4f} seconds, {memory_taken:.2f} MiB)")
+
+    if over_budget:
+        logger.error(f"Worlds over the load budget of {time_budget} seconds and {memory_budget} MiB: "
+                     f"{', '.join(over_budget)}")
+    return not over_budget
+
 
 if __name__ == "__main__":
+    import argparse
+    import sys
+
     from path_change import change_home
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--time-budget", type=float, default=0.0,
+                        help="fail if a world takes longer than this many seconds to load")
+    parser.add_argument("--memory-budget", type=float, default=0.0,
+                        help="fail if a world keeps more than this many MiB after loading")
+    parser.add_argument("--modules", type=int, default=5, help="number of slowest modules to list per world")
+    args = parser.parse_args()
     change_home()
-    run_load_worlds_benchmark()
+    if not run_load_worlds_benchmark(args.time_budget, args.memory_budget, args.modules):
+        sys.exit(1)
@@ -0,0 +1,63 @@
+import typing
+
+
+def run_memory_benchmark(players: int = 100,
+                         games: typing.Sequence[str] = ("A Link to the Past", "Hollow Knight", "Stardew Valley",
+                                                        "The Witness")) -> None:
+    """Reports memory taken per location and per item while setting up a multiworld of players,
+    cycling through games. Not all worlds can share a multiworld, so this uses a fixed set of large worlds.
+    Memory is measured across the create_regions and create_items steps respectively, so it includes what the worlds
+    create alongside, like regions, entrances and rules."""
+    import argparse
+    import gc
+    import logging
+    import tracemalloc
+
+    from time_it import TimeIt
+
+    from Utils import init_logging
+    from BaseClasses import MultiWorld, CollectionState
+    from worlds import AutoWorld
+    from worlds.AutoWorld import call_all
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    multiworld = MultiWorld(players)
+    multiworld.game = {player: games[(player - 1) % len(games)] for player in multiworld.player_ids}
+    multiworld.player_name = {player: f"Tester{player}" for player in multiworld.player_ids}
+    multiworld.set_seed(0)
+    multiworld.state = CollectionState(multiworld)
+    args = argparse.Namespace()
+    for player in multiworld.player_ids:
+        world_type = AutoWorld.AutoWorldRegister.world_types[multiworld.game[player]]
+        for key, option in world_type.options_dataclass.type_hints.items():
+            updated_options = getattr(args, key, {})
+            updated_options[player] = option.from_any(option.default)
+            setattr(args, key, updated_options)
+    multiworld.set_options(args)
+
+    step_memory = {}
+    tracemalloc.start()
+    for step in ("generate_early", "create_regions", "create_items"):
+        gc.collect()
+        start_memory = tracemalloc.get_traced_memory()[0]
+        with TimeIt(f"{players} players {step}", logger):
+            call_all(multiworld, step)
+        gc.collect()
+        step_memory[step] = tracemalloc.get_traced_memory()[0] - start_memory
+    tracemalloc.stop()
+
+    location_count = len(multiworld.get_locations())
+    item_count = len(multiworld.itempool)
+    logger.info(f"{location_count} locations in {len(multiworld.regions)} regions took "
+                f"{step_memory['create_regions'] / 1024 / 1024:.2f} MiB, "
+                f"{step_memory['create_regions'] / location_count:.0f} bytes per location.")
+    logger.info(f"{item_count} items took {step_memory['create_items'] / 1024 / 1024:.2f} MiB, "
+                f"{step_memory['create_items'] / item_count:.0f} bytes per item.")
+
+
+if __name__ == "__main__":
+    from path_change import change_home
+    change_home()
+    run_memory_benchmark()
@@ -0,0 +1,63 @@
+import random
+import typing
+
+if typing.TYPE_CHECKING:
+    from worlds.Files import APProcedurePatch
+
+
+def make_token_patch(rom_size: int = 4 * 1024 * 1024, token_count: int = 100_000, seed: int = 0
+                     ) -> typing.Tuple["APProcedurePatch", bytes]:
+    """Creates a patch with a token file of token_count random tokens of all types, named "token_data.bin", and a
+    random base file of rom_size bytes to apply it to. Tokens stay within rom_size."""
+    from worlds.Files import APProcedurePatch, APTokenMixin, APTokenTypes
+
+    class TokenPatch(APProcedurePatch, APTokenMixin):
+        procedure = [("apply_tokens", ["token_data.bin"])]
+
+    random_source = random.Random(seed)
+
+    def random_bytes(size: int) -> bytes:
+        return random_source.getrandbits(size * 8).to_bytes(size, "little")
+
+    patch = TokenPatch()
+    for _ in range(token_count):
+        token_type = random_source.choice(tuple(APTokenTypes))
+        if token_type == APTokenTypes.WRITE:
+            data = random_bytes(random_source.randint(1, 64))
+            patch.write_token(token_type, random_source.randrange(rom_size - len(data)), data)
+        elif token_type in (APTokenTypes.COPY, APTokenTypes.RLE):
+            length = random_source.randint(1, 256)
+            offset = random_source.randrange(rom_size - length)
+            if token_type == APTokenTypes.COPY:
+                patch.write_token(token_type, offset, (length, random_source.randrange(rom_size - length)))
+            else:
+                patch.write_token(token_type, offset, (length, random_source.randrange(256)))
+        else:
+            patch.write_token(token_type, random_source.randrange(rom_size), random_source.randrange(256))
+    patch.write_file("token_data.bin", patch.get_token_binary())
+    return patch, random_bytes(rom_size)
+
+
+def run_patch_benchmark(rom_size: int = 4 * 1024 * 1024, token_count: int = 100_000) -> None:
+    """Reports the time taken to apply a large random token file and to calculate a SNES CRC."""
+    import logging
+
+    from time_it import TimeIt
+
+    from Utils import init_logging
+    from worlds.Files import APPatchExtension
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    patch, rom = make_token_patch(rom_size, token_count)
+    with TimeIt(f"applying {token_count} tokens to {rom_size} bytes", logger):
+        rom = APPatchExtension.apply_tokens(patch, rom, "token_data.bin")
+    with TimeIt(f"calculating SNES CRC of {rom_size} bytes", logger):
+        APPatchExtension.calc_snes_crc(patch, rom)
+
+
+if __name__ == "__main__":
+    from path_change import change_home
+    change_home()
+    run_patch_benchmark()
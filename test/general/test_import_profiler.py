@@ -0,0 +1,38 @@
+import os
+import sys
+import tempfile
+import unittest
+
+from worlds.ImportProfiler import ImportProfiler
+
+
+class TestImportProfiler(unittest.TestCase):
+    def test_profile(self) -> None:
+        """Tests that imports are recorded per module, with large data attributed to the module defining it."""
+        with tempfile.TemporaryDirectory() as folder:
+            package = os.path.join(folder, "profiled_package")
+            os.mkdir(package)
+            with open(os.path.join(package, "__init__.py"), "w") as f:
+                f.write("from .data import table, pattern\n")
+            with open(os.path.join(package, "data.py"), "w") as f:
+                f.write("import re\ntable = {i: str(i) for i in range(2000)}\npattern = re.compile('a+b')\n")
+            sys.path.insert(0, folder)
+            try:
+                profiler = ImportProfiler()
+                with profiler.profile("profiled") as profile:
+                    import profiled_package
+                self.assertNotIn(profiler, sys.meta_path)
+                self.assertNotIn("ImportProfiler", type(profiled_package.__loader__).__name__)
+            finally:
+                sys.path.remove(folder)
+                sys.modules.pop("profiled_package", None)
+                sys.modules.pop("profiled_package.data", None)
+
+        modules = {module.name: module for module in profile.modules}
+        self.assertEqual(set(modules), {"profiled_package", "profiled_package.data"})
+        self.assertEqual(modules["profiled_package"].large_data, [])
+        self.assertEqual(modules["profiled_package.data"].large_data,
+                         [("table", "dict", 2000), ("pattern", "regex", 3)])
+        self.assertGreater(modules["profiled_package.data"].memory_delta, 0)
+        self.assertAlmostEqual(profile.time_taken, sum(module.time_taken for module in modules.values()))
+        self.assertIn("profiled_package.data", profile.report())
@@ -1,5 +1,7 @@
 import unittest
+from collections import Counter
 
+from BaseClasses import CollectionState, ItemClassification, ItemCounts
 from worlds.AutoWorld import AutoWorldRegister, call_all
 from . import setup_solo_multiworld
 
@@ -80,3 +82,68 @@ class TestBase(unittest.TestCase):
                         call_all(multiworld, step)
                         self.assertEqual(created_items, multiworld.itempool,
                                          f"{game_name} modified the itempool during {step}")
+
+    def test_item_counts(self):
+        """Test that the name and index based methods of CollectionState agree, across copies of the state"""
+        multiworld = setup_solo_multiworld(AutoWorldRegister.world_types["Archipelago"], ())
+        state = CollectionState(multiworld)
+        item_index = multiworld.get_item_index(1)
+        first, second, unknown = item_index.intern_all(("First", "Second", "Unknown"))
+
+        state.prog_items[1]["First"] += 2
+        copied_state = state.copy()
+        # interned after the copy was made, so its counts are shorter than the index
+        copied_state.prog_items[1].add("Late")
+        state.prog_items[1]["Second"] += 1
+        self.assertEqual(dict(state.prog_items[1]), {"First": 2, "Second": 1})
+        self.assertEqual(dict(copied_state.prog_items[1]), {"First": 2, "Late": 1})
+
+        self.assertTrue(state.has("First", 1, 2))
+        self.assertTrue(state.has_index(first, 1, 2))
+        self.assertFalse(state.has("Late", 1))
+        self.assertFalse(copied_state.has("Second", 1))
+        self.assertFalse(copied_state.has_index(second, 1))
+        self.assertFalse(state.has("Never Interned", 1))
+        self.assertTrue(state.has_all(("First", "Second"), 1))
+        self.assertTrue(state.has_all_indices((first, second), 1))
+        self.assertFalse(state.has_all(("First", "Unknown"), 1))
+        self.assertTrue(state.has_any(("Unknown", "Second"), 1))
+        self.assertTrue(state.has_any_indices((unknown, second), 1))
+        self.assertEqual(state.count_from_list(("First", "Second", "Late"), 1), 3)
+        self.assertEqual(state.count_indices((first, second, unknown), 1), 3)
+        self.assertEqual(state.count_from_list_unique(("First", "Second"), 1), 2)
+        self.assertTrue(state.has_from_list(("First", "Second"), 1, 3))
+        self.assertFalse(state.has_from_list_unique(("First", "Second"), 1, 3))
+
+        del state.prog_items[1]["First"]
+        self.assertEqual(state.count("First", 1), 0)
+        self.assertEqual(copied_state.count("First", 1), 2)
+        self.assertNotIn("First", state.prog_items[1])
+        self.assertEqual(len(state.prog_items[1]), 1)
+
+    def test_assign_plain_item_counts(self):
+        """Test that item counts assigned as another mapping, like a Counter, are converted to ItemCounts when used"""
+        multiworld = setup_solo_multiworld(AutoWorldRegister.world_types["Archipelago"], ())
+        state = CollectionState(multiworld)
+        first, second = multiworld.get_item_index(1).intern_all(("First", "Second"))
+
+        state.prog_items = {1: Counter({"First": 2})}
+        self.assertTrue(state.copy().has_all(("First",), 1))
+        self.assertTrue(state.has("First", 1, 2))
+        self.assertIsInstance(state.prog_items[1], ItemCounts)
+
+        state.prog_items[1] = Counter({"Second": 1})
+        self.assertEqual(state.count_indices((first, second), 1), 1)
+        state.prog_items[1] = Counter()
+        self.assertFalse(state.has_index(second, 1))
+        state.prog_items[1] = Counter()
+        self.assertEqual(state.count("First", 1), 0)
+        state.prog_items[1] = Counter()
+        item = multiworld.worlds[1].create_item("Nothing")
+        item.classification = ItemClassification.progression
+        state.collect(item, True)
+        self.assertEqual(state.count("Nothing", 1), 1)
+
+        state.prog_items[1] = None
+        with self.assertRaises(TypeError):
+            state.has("First", 1)
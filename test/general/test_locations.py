@@ -66,3 +66,39 @@ class TestBase(unittest.TestCase):
                         for location in locations:
                             self.assertIn(location, world_type.location_name_to_id)
                         self.assertNotIn(group_name, world_type.location_name_to_id)
+
+    def test_slot_defaults(self):
+        """Tests that Location and Entrance subclasses can still override defaults and add their own attributes."""
+        from BaseClasses import Entrance, Location, LocationProgressType, default_access_rule
+
+        class TestLocation(Location):
+            game = "Test Game"
+            show_in_spoiler = False
+
+            def access_rule(self, state) -> bool:
+                return False
+
+        class TestEntrance(Entrance):
+            hide_path = True
+
+        location = Location(1, "Base Location")
+        self.assertTrue(location.show_in_spoiler)
+        self.assertIs(location.access_rule, default_access_rule)
+        self.assertTrue(location.access_rule(None))
+        self.assertEqual(location.progress_type, LocationProgressType.DEFAULT)
+        with self.assertRaises(AttributeError, msg="Location should not have a __dict__ for unknown attributes"):
+            location.custom_data = 1
+
+        test_location = TestLocation(1, "Test Location")
+        self.assertFalse(test_location.show_in_spoiler)
+        self.assertFalse(test_location.access_rule(None))
+        self.assertIsNone(test_location.item)
+        test_location.show_in_spoiler = True
+        self.assertTrue(test_location.show_in_spoiler)
+        test_location.custom_data = 1  # subclasses without __slots__ of their own get a __dict__
+        self.assertEqual(test_location.custom_data, 1)
+        self.assertFalse(TestLocation(1, "Other Location").show_in_spoiler)
+
+        self.assertTrue(TestEntrance(1, "Test Entrance").hide_path)
+        self.assertFalse(Entrance(1, "Base Entrance").hide_path)
+        self.assertIs(Entrance(1, "Base Entrance").access_rule, default_access_rule)
@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+
+from worlds.Files import APPatchExtension, APTokenTypes
+from ..benchmark.patch import make_token_patch
+
+
+def apply_tokens_reference(rom: bytes, tokens) -> bytes:
+    rom_data = bytearray(rom)
+    for token_type, offset, args in tokens:
+        if token_type == APTokenTypes.AND_8:
+            rom_data[offset] &= args
+        elif token_type == APTokenTypes.OR_8:
+            rom_data[offset] |= args
+        elif token_type == APTokenTypes.XOR_8:
+            rom_data[offset] ^= args
+        elif token_type == APTokenTypes.COPY:
+            length, source = args
+            rom_data[offset:offset + length] = rom_data[source:source + length]
+        elif token_type == APTokenTypes.RLE:
+            length, value = args
+            rom_data[offset:offset + length] = bytes([value] * length)
+        else:
+            rom_data[offset:offset + len(args)] = args
+    return bytes(rom_data)
+
+
+class TestPatchTokens(unittest.TestCase):
+    def test_apply_tokens(self) -> None:
+        """Tests that applying a token file gives the same result as applying its tokens one by one."""
+        patch, rom = make_token_patch(0x10000, 5000)
+        self.assertEqual(APPatchExtension.apply_tokens(patch, rom, "token_data.bin"),
+                         apply_tokens_reference(rom, patch._tokens))
+
+    def test_calc_snes_crc(self) -> None:
+        patch, rom = make_token_patch(0x10000, 0)
+        patched = APPatchExtension.calc_snes_crc(patch, rom)
+        crc = int.from_bytes(patched[0x7FDE:0x7FE0], "little")
+        inverse = int.from_bytes(patched[0x7FDC:0x7FDE], "little")
+        self.assertEqual(crc ^ inverse, 0xFFFF)
+        self.assertEqual(crc, (sum(rom[:0x7FDC]) + sum(rom[0x7FE0:]) + 0x01FE) & 0xFFFF)
+        self.assertEqual(patched[:0x7FDC], rom[:0x7FDC])
+        self.assertEqual(patched[0x7FE0:], rom[0x7FE0:])
+
+    def test_patch(self) -> None:
+        """Tests that a procedure of several steps sharing one buffer gives the same result as its steps one by one,
+        without changing the cached source data."""
+        patch, rom = make_token_patch(0x10000, 5000)
+        source_data = type(patch).source_data = bytes(rom)
+        patch.hash = None
+        patch.procedure = [("apply_tokens", ["token_data.bin"]), ("calc_snes_crc", []),
+                           ("apply_tokens", ["token_data.bin"])]
+        expected = APPatchExtension.calc_snes_crc(patch, apply_tokens_reference(rom, patch._tokens))
+        expected = apply_tokens_reference(expected, patch._tokens)
+        with tempfile.TemporaryDirectory() as directory:
+            patch.write(os.path.join(directory, "test.aptoken"))
+            patch.patch(os.path.join(directory, "test.sfc"))
+            with open(os.path.join(directory, "test.sfc"), "rb") as f:
+                self.assertEqual(f.read(), expected)
+        self.assertIs(patch.get_source_data_with_cache(), source_data)
+        self.assertEqual(source_data, rom)
@@ -1,6 +1,6 @@
 import unittest
 
-from BaseClasses import CollectionState
+from BaseClasses import CollectionState, MultiWorld, Region
 from worlds.AutoWorld import AutoWorldRegister
 from . import setup_solo_multiworld
 
@@ -79,3 +79,37 @@ class TestBase(unittest.TestCase):
                             locations.add(location)
                     self.assertGreater(len(locations), 0,
                                        msg="Need to be able to reach at least one location to get started.")
+
+
+class TestStateSet(unittest.TestCase):
+    def test_state_set(self):
+        """Tests that StateSets of a CollectionState behave like sets, independently of their copies."""
+        multiworld = MultiWorld(2)
+        regions = [Region(f"Region {index}", 1, multiworld) for index in range(4)]
+        other_region = Region("Other", 2, multiworld)
+        state = CollectionState(multiworld)
+        reachable_regions = state.reachable_regions[1]
+        reachable_regions.update(regions[:2])
+        copied_state = state.copy()
+        copied_regions = copied_state.reachable_regions[1]
+        copied_regions.add(regions[3])
+        reachable_regions.discard(regions[0])
+
+        self.assertEqual(set(reachable_regions), {regions[1]})
+        self.assertEqual(set(copied_regions), {regions[0], regions[1], regions[3]})
+        self.assertEqual(len(copied_regions), 3)
+        self.assertNotIn(regions[2], copied_regions)
+        self.assertNotIn(other_region, copied_regions)
+        self.assertEqual(set(copied_regions - reachable_regions), {regions[0], regions[3]})
+        self.assertEqual(set(copied_regions.difference({regions[3]})), {regions[0], regions[1]})
+        self.assertEqual(set(reachable_regions | {regions[2]}), {regions[1], regions[2]})
+        self.assertEqual(set(copied_regions & reachable_regions), {regions[1]})
+        self.assertTrue(reachable_regions <= copied_regions)
+        self.assertEqual(copied_regions, {regions[0], regions[1], regions[3]})
+        state.stale[1] = False
+        self.assertTrue(regions[1].can_reach(state))
+        self.assertFalse(regions[3].can_reach(state))
+
+        copied_regions.clear()
+        self.assertFalse(copied_regions)
+        self.assertEqual(set(reachable_regions), {regions[1]})
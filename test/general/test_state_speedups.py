@@ -0,0 +1,102 @@
+import os
+import unittest
+
+from BaseClasses import CollectionState, MultiWorld, _python_state_methods
+from worlds.AutoWorld import AutoWorldRegister
+from . import setup_solo_multiworld
+
+ci = bool(os.environ.get("CI"))  # always set in GitHub actions
+
+
+class PythonCollectionState(CollectionState):
+    """CollectionState using the pure python methods that _speedups replaces."""
+
+
+for _name, _method in _python_state_methods.items():
+    setattr(PythonCollectionState, _name, _method)
+
+
+@unittest.skipIf(not _python_state_methods and not ci, "_speedups not available")
+class TestSpeedupsCollectionState(unittest.TestCase):
+    games = ("A Link to the Past", "Hollow Knight", "The Witness")
+
+    def setUp(self) -> None:
+        self.assertTrue(_python_state_methods, "_speedups did not replace any CollectionState methods")
+
+    def assert_same_state(self, native: CollectionState, python: CollectionState, multiworld: MultiWorld) -> None:
+        for player in multiworld.player_ids:
+            native.update_reachable_regions(player)
+            python.update_reachable_regions(player)
+            self.assertEqual(dict(native.prog_items[player]), dict(python.prog_items[player]))
+            self.assertEqual(set(native.reachable_regions[player]), set(python.reachable_regions[player]))
+            self.assertEqual(set(native.blocked_connections[player]), set(python.blocked_connections[player]))
+        self.assertEqual(set(native.advancements), set(python.advancements))
+        self.assertEqual(set(native.locations_checked), set(python.locations_checked))
+        self.assertEqual(native.path, python.path)
+
+    def test_item_counting(self) -> None:
+        """Tests that the native item counting methods give the same results as the pure python ones."""
+        for game in self.games:
+            with self.subTest(game=game):
+                multiworld = setup_solo_multiworld(AutoWorldRegister.world_types[game])
+                native = CollectionState(multiworld)
+                python = PythonCollectionState(multiworld)
+                for item in multiworld.itempool[::2]:
+                    native.collect(item, True)
+                    python.collect(item, True)
+                item_index = multiworld.get_item_index(1)
+                names = ["Not an Item"] + sorted({item.name for item in multiworld.itempool})
+                indices = item_index.intern_all(names)
+                missing = ["Not an Item", "Not an Item either"]
+                missing_indices = item_index.intern_all(missing)
+                counts = {name: 2 for name in names[::3]}
+                # interned after collecting, so the missing indices are past the end of the counts lists
+                lengths = len(native.prog_items[1].counts), len(python.prog_items[1].counts)
+                self.assertLess(max(lengths), len(item_index.names))
+                for count in (0, 1, 2, 5):
+                    for method, args in (
+                        ("has_all", (names[count::4], 1)),
+                        ("has_any", (names[count::4], 1)),
+                        ("has_all_counts", (counts, 1)),
+                        ("has_any_count", (counts, 1)),
+                        ("has_from_list", (names, 1, count)),
+                        ("has_from_list_unique", (names, 1, count)),
+                        ("count_from_list", (names[count:], 1)),
+                        ("count_from_list_unique", (names[count:], 1)),
+                        ("has_all_indices", (indices[count::4], 1)),
+                        ("has_any_indices", (indices[count::4], 1)),
+                        ("has_from_indices", (indices, 1, count)),
+                        ("has_from_indices_unique", (indices, 1, count)),
+                        ("count_indices", (indices[count:], 1)),
+                        ("count_indices_unique", (indices[count:], 1)),
+                        ("has_from_list", (missing, 1, count)),
+                        ("has_from_list_unique", (missing, 1, count)),
+                        ("has_from_indices", (missing_indices, 1, count)),
+                        ("has_from_indices_unique", (missing_indices, 1, count)),
+                    ):
+                        self.assertEqual(getattr(native, method)(*args), getattr(python, method)(*args),
+                                         f"{method} differs for {args}")
+                self.assertEqual((len(native.prog_items[1].counts), len(python.prog_items[1].counts)), lengths,
+                                 "queries should not change the item counts of a state")
+
+    def test_reachability_and_sweep(self) -> None:
+        """Tests that the native region search and sweep reach the same state as the pure python ones."""
+        for game in self.games:
+            for explicit_indirect_conditions in (True, False):
+                with self.subTest(game=game, explicit_indirect_conditions=explicit_indirect_conditions):
+                    multiworld = setup_solo_multiworld(AutoWorldRegister.world_types[game])
+                    multiworld.worlds[1].explicit_indirect_conditions = explicit_indirect_conditions
+                    native = CollectionState(multiworld)
+                    python = PythonCollectionState(multiworld)
+                    self.assert_same_state(native, python, multiworld)
+                    for item in multiworld.itempool[::2]:
+                        native.collect(item, True)
+                        python.collect(item, True)
+                    self.assert_same_state(native, python, multiworld)
+                    native.sweep_for_advancements()
+                    python.sweep_for_advancements()
+                    self.assert_same_state(native, python, multiworld)
+                    for item in multiworld.itempool[1::2]:
+                        native.collect(item)
+                        python.collect(item)
+                    self.assert_same_state(native, python, multiworld)
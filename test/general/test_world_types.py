@@ -0,0 +1,44 @@
+import unittest
+from typing import List
+
+from worlds.AutoWorld import AutoWorldRegister, WorldTypes
+
+
+class TestWorldTypes(unittest.TestCase):
+    def test_deferred_games(self) -> None:
+        """Tests that deferred games are known without importing them, and that a lookup imports all games of a source."""
+        world_types = WorldTypes()
+        loads: List[str] = []
+        world_a = AutoWorldRegister.world_types["A Link to the Past"]
+        world_b = AutoWorldRegister.world_types["Clique"]
+
+        def load() -> None:
+            loads.append("source")
+            world_types["Game A"] = world_a
+            world_types["Game B"] = world_b
+
+        world_types.defer("Game A", load)
+        world_types.defer("Game B", load)
+        world_types.defer("Game C", load)  # claimed by the manifest, but no longer registered by its source
+        self.assertIn("Game A", world_types)
+        self.assertEqual(len(world_types), 3)
+        self.assertEqual(dict(world_types.loaded), {})
+        self.assertEqual(loads, [])
+
+        self.assertIs(world_types["Game B"], world_b)
+        self.assertEqual(loads, ["source"])
+        self.assertEqual(dict(world_types.loaded), {"Game A": world_a, "Game B": world_b})
+        self.assertNotIn("Game C", world_types)
+        with self.assertRaises(KeyError):
+            world_types["Game C"]
+        self.assertEqual(loads, ["source"])
+
+    def test_iteration_loads_all(self) -> None:
+        """Tests that iterating world types imports all deferred games."""
+        world_types = WorldTypes()
+        world = AutoWorldRegister.world_types["Clique"]
+        world_types["Game A"] = world
+        world_types.defer("Game B", lambda: world_types.__setitem__("Game B", world))
+        self.assertEqual(list(world_types.loaded), ["Game A"])
+        self.assertEqual(sorted(world_types), ["Game A", "Game B"])
+        self.assertEqual(list(world_types.loaded), ["Game A", "Game B"])
@@ -3,7 +3,8 @@ import os
 import typing
 import unittest
 import warnings
-from NetUtils import LocationStore, _LocationStore
+from NetUtils import LocationStore, _LocationStore, decode_location_columns, decode_sphere_columns, \
+    encode_location_columns, encode_sphere_columns, read_location_columns
 
 State = typing.Dict[typing.Tuple[int, int], typing.Set[int]]
 RawLocations = typing.Dict[int, typing.Dict[int, typing.Tuple[int, int, int]]]
@@ -200,6 +201,33 @@ class Base:
             self.assertEqual(len(store[1]), 1)
             self.assertEqual(len(store[2]), 0)
 
+        def test_from_columns(self) -> None:
+            store = self.type.from_columns(read_location_columns(encode_location_columns(sample_data)))
+            expected = self.type(sample_data)
+            self.assertEqual(sorted(store), sorted(expected))
+            for slot in expected:
+                self.assertEqual(list(store[slot]), sorted(expected[slot]))
+                for location_id in expected[slot]:
+                    self.assertEqual(store[slot][location_id], expected[slot][location_id])
+
+        def test_from_columns_hole(self) -> None:
+            with self.assertRaises(ValueError):
+                self.type.from_columns(read_location_columns(encode_location_columns({
+                    1: {1: (1, 1, 1)},
+                    3: {1: (1, 1, 1)},
+                })))
+
+
+class TestLocationColumns(unittest.TestCase):
+    """Test the multidata encoding of locations and spheres."""
+    def test_locations(self) -> None:
+        data: RawLocations = {**sample_data, 6: {}, 7: {-1: (-2, 1, 1 << 31), 1 << 40: (1 << 50, 7, 0)}}
+        self.assertEqual(decode_location_columns(encode_location_columns(data)), data)
+
+    def test_spheres(self) -> None:
+        spheres = [{1: {13}, 2: {22, 23}}, {1: {11, 12}}, {3: {9}, 4: {9}, 5: {9}}, {2: set()}]
+        self.assertEqual(decode_sphere_columns(encode_sphere_columns(spheres)), spheres)
+
 
 class TestPurePythonLocationStore(Base.TestLocationStore):
     """Run base method tests for pure python implementation."""
@@ -252,6 +280,12 @@ class TestSpeedupsLocationStoreConstructor(Base.TestLocationStoreConstructor):
                 1 << 32: {1: (1, 1, 1)},
             })
 
+    def test_unsorted_columns(self) -> None:
+        columns = read_location_columns(encode_location_columns({1: {1: (1, 1, 1), 2: (2, 1, 1)}}))
+        columns[1] = tuple(column[::-1] for column in columns[1])
+        with self.assertRaises(ValueError):
+            self.type.from_columns(columns)
+
     def test_not_a_tuple(self) -> None:
         with self.assertRaises(Exception):
             self.type({
@@ -65,3 +65,29 @@ class TestNumericOptions(unittest.TestCase):
             self.assertTrue(toggle_string)
             self.assertTrue(toggle_int)
             self.assertTrue(toggle_alias)
+
+
+class TestVerifyKeys(unittest.TestCase):
+    def test_verify_cache(self) -> None:
+        """Tests that verifying the same value again reuses the verified value, but still rejects invalid values."""
+        from BaseClasses import PlandoOptions
+        from Options import ItemSet
+        from worlds.AutoWorld import AutoWorldRegister
+
+        class TestItemSet(ItemSet):
+            convert_name_groups = True
+
+        world = AutoWorldRegister.world_types["Clique"]
+        group_name, group_items = next(iter(world.item_name_groups.items()))
+        verified_options = []
+        for _ in range(2):
+            option = TestItemSet.from_any([group_name])
+            option.verify(world, "Tester", PlandoOptions.none)
+            verified_options.append(option)
+        self.assertEqual(verified_options[0].value, set(group_items))
+        self.assertEqual(verified_options[1].value, set(group_items))
+        self.assertIsNot(verified_options[0].value, verified_options[1].value)
+
+        for _ in range(2):
+            with self.assertRaises(Exception):
+                TestItemSet.from_any(["Not an Item"]).verify(world, "Tester", PlandoOptions.none)
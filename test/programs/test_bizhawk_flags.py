@@ -0,0 +1,34 @@
+import unittest
+
+from worlds._bizhawk.flags import LocationFlagDiff, iter_set_bits
+
+
+class TestLocationFlagDiff(unittest.TestCase):
+    def test_iter_set_bits(self) -> None:
+        self.assertEqual(list(iter_set_bits(0)), [])
+        self.assertEqual(list(iter_set_bits(0b1010_0001)), [0, 5, 7])
+        self.assertEqual(list(iter_set_bits(1 << 1000)), [1000])
+
+    def test_update(self) -> None:
+        diff = LocationFlagDiff({
+            1: ("events", 0),
+            2: ("events", 9),
+            3: ("events", 23),
+            4: ("chests", 0),
+        })
+        # the first update reports everything that is set, unmapped flags are ignored
+        self.assertEqual(diff.update("events", bytes([0b11, 0b10, 0])), [1, 2])
+        self.assertEqual(diff.update("events", bytes([0b11, 0b10, 0])), [])
+        self.assertEqual(diff.update("chests", bytes([1])), [4])
+        # only newly set flags are reported
+        self.assertEqual(diff.update("events", bytes([0b11, 0b10, 0x80])), [3])
+        # flags that are cleared and set again are reported again, like after loading an older save
+        self.assertEqual(diff.update("events", bytes([0, 0, 0])), [])
+        self.assertEqual(diff.update("events", bytes([1, 0, 0])), [1])
+        self.assertEqual(diff.update("unknown", bytes([0xFF])), [])
+
+    def test_reset(self) -> None:
+        diff = LocationFlagDiff({1: ("events", 3)})
+        self.assertEqual(diff.update("events", bytes([8])), [1])
+        diff.reset()
+        self.assertEqual(diff.update("events", bytes([8])), [1])
@@ -1,7 +1,11 @@
+import asyncio
+import os
+import tempfile
 import unittest
 
 import NetUtils
-from CommonClient import CommonContext
+import Utils
+from CommonClient import CommonContext, WatcherScheduler
 
 
 class TestCommonContext(unittest.IsolatedAsyncioTestCase):
@@ -104,3 +108,124 @@ class TestCommonContext(unittest.IsolatedAsyncioTestCase):
         assert self.ctx.item_names.lookup_in_slot(-1, 3) == "Nothing"
         assert self.ctx.item_names.lookup_in_game(-1, "__TestGame1") == "Nothing"
         assert self.ctx.item_names.lookup_in_game(-1, "__TestGame2") == "Nothing"
+
+    async def test_implicit_name_lookups_after_index_update(self):
+        assert self.ctx.item_names[2**54 + 3] == f"Unknown item (ID: {2**54+3})"
+        index = Utils.decode_data_package_index("test", Utils.encode_data_package_index({
+            "location_name_to_id": {},
+            "item_name_to_id": {"Renamed Item 3": 2**54 + 2, "Test Item 4": 2**54 + 3},
+        }))
+        self.ctx.update_game_index(index, "__TestGame2")
+        assert self.ctx.item_names[2**54 + 2] == "Renamed Item 3"
+        assert self.ctx.item_names[2**54 + 3] == "Test Item 4"
+        # replacing the index again forgets what was looked up in the previous one
+        index = Utils.decode_data_package_index("test", Utils.encode_data_package_index({
+            "location_name_to_id": {},
+            "item_name_to_id": {"Test Item 3 - Duplicate": 2**54 + 2},
+        }))
+        self.ctx.update_game_index(index, "__TestGame2")
+        assert self.ctx.item_names[2**54 + 2] == "Test Item 3 - Duplicate"
+        assert self.ctx.item_names[2**54 + 3] == f"Unknown item (ID: {2**54+3})"
+
+
+class TestCommonContextDataPackageIndex(TestCommonContext):
+    """Runs the lookup tests with __TestGame2 loaded from a data package index."""
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        index = Utils.decode_data_package_index("test", Utils.encode_data_package_index({
+            "location_name_to_id": {"Test Location 3 - Duplicate": 2**54 + 2},
+            "item_name_to_id": {"Test Item 3 - Duplicate": 2**54 + 2},
+        }))
+        self.ctx.item_names["__TestGame2"][2**54 + 1]  # cache an unknown name, which the index has to replace
+        self.ctx.update_game_index(index, "__TestGame2")
+
+
+class TestDataPackageIndex(unittest.IsolatedAsyncioTestCase):
+    game_package = {
+        "item_name_to_id": {"Ünïcödé Item": 5, "Item": -3, "Other Item": 2**40},
+        "location_name_to_id": {},
+        "checksum": "0123456789abcdef",
+    }
+
+    def setUp(self):
+        self.original_cache_path = getattr(Utils.cache_path, "cached_path", None)
+        self.cache_dir = tempfile.TemporaryDirectory()
+        Utils.cache_path.cached_path = self.cache_dir.name
+
+    def tearDown(self):
+        Utils.cache_path.cached_path = self.original_cache_path
+        self.cache_dir.cleanup()
+
+    def test_lookups(self):
+        index = Utils.decode_data_package_index("test", Utils.encode_data_package_index(self.game_package))
+        self.assertEqual(dict(index.item_id_to_name),
+                         {code: name for name, code in self.game_package["item_name_to_id"].items()})
+        self.assertEqual(list(index.item_id_to_name), [-3, 5, 2**40])
+        self.assertNotIn(4, index.item_id_to_name)
+        self.assertNotIn("Item", index.item_id_to_name)
+        self.assertEqual(len(index.location_id_to_name), 0)
+
+    def test_cache(self):
+        self.assertIsNone(Utils.load_data_package_index("__TestGame", self.game_package["checksum"]))
+        Utils.store_data_package_for_checksum("__TestGame", self.game_package)
+        index = Utils.load_data_package_index("__TestGame", self.game_package["checksum"])
+        self.assertEqual(index.checksum, self.game_package["checksum"])
+        self.assertEqual(index.item_id_to_name[5], "Ünïcödé Item")
+
+        # an index is created for data packages cached before indexes existed
+        os.unlink(Utils.cache_path("datapackage", "__TestGame", f"{self.game_package['checksum']}.index"))
+        self.assertEqual(Utils.load_data_package_index("__TestGame", self.game_package["checksum"]), index)
+
+    async def test_prepare_data_package(self):
+        Utils.store_data_package_for_checksum("__TestGame", self.game_package)
+        ctx = CommonContext()
+        await ctx.prepare_data_package({"__TestGame"}, {}, {"__TestGame": self.game_package["checksum"]})
+        self.assertEqual(ctx.item_names.lookup_in_game(2**40, "__TestGame"), "Other Item")
+        self.assertEqual(ctx.item_names.lookup_in_game(-1, "__TestGame"), "Nothing")
+        self.assertEqual(ctx.item_names.lookup_in_game(4, "__TestGame"), "Unknown item (ID: 4)")
+
+
+class TestWatcherScheduler(unittest.IsolatedAsyncioTestCase):
+    async def test_backoff(self):
+        scheduler = WatcherScheduler(0.01, 0.04, backoff=2)
+        event = asyncio.Event()
+        for expected in (0.01, 0.02, 0.04, 0.04):
+            await scheduler.wait(event)
+            scheduler.report(b"same")
+            assert scheduler.interval == expected, (scheduler.interval, expected)
+        # changed memory
+        await scheduler.wait(event)
+        scheduler.report(b"changed")
+        assert scheduler.interval == 0.01
+        scheduler.report(b"changed")
+        assert scheduler.interval == 0.02
+        # a failed read
+        scheduler.report(None)
+        assert scheduler.interval == 0.01
+        assert scheduler.polls == 7
+        assert "7 polls, 0 wakeups" in scheduler.get_stats()
+
+    async def test_wakeup(self):
+        scheduler = WatcherScheduler(0.01, 10, backoff=100)
+        event = asyncio.Event()
+        for _ in range(3):
+            scheduler.report(b"same")
+        assert scheduler.interval == 10
+        event.set()
+        await asyncio.wait_for(scheduler.wait(event), 1)
+        assert not event.is_set()
+        assert scheduler.interval == 0.01
+        assert scheduler.wakeups == 1
+
+    async def test_activity_during_poll(self):
+        scheduler = WatcherScheduler(0.01, 0.04, backoff=2)
+        event = asyncio.Event()
+        scheduler.report(b"same")
+        await scheduler.wait(event)
+        # a write to the game during the poll, with the memory read before it unchanged
+        scheduler.activity()
+        scheduler.report(b"same")
+        assert scheduler.interval == 0.01
+        await scheduler.wait(event)
+        scheduler.report(b"same")
+        assert scheduler.interval == 0.02
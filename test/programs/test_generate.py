@@ -1,15 +1,20 @@
 # Tests for Generate.py (ArchipelagoGenerate.exe)
 
-import unittest
+import multiprocessing
 import os
 import os.path
 import sys
+import threading
+import unittest
+import unittest.mock
+import zipfile
 
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
 import Generate
 import Main
+from BaseClasses import get_memory_use
 
 
 class TestGenerateMain(unittest.TestCase):
@@ -92,3 +97,172 @@ class TestGenerateMain(unittest.TestCase):
             user_path.cached_path = user_path_backup
 
         self.assertOutput(self.output_tempdir.name)
+
+    def test_generate_timings(self):
+        from BaseClasses import GenerationTimings, get_memory_use
+
+        finished_stages = []
+        timings = GenerationTimings(lambda generation_timings: finished_stages.append(len(generation_timings.stages)))
+        sys.argv = [sys.argv[0], '--seed', '0',
+                    '--player_files_path', str(self.abs_input_dir),
+                    '--outputpath', self.output_tempdir.name]
+        multiworld = Main.main(*Generate.main(), timings=timings)
+
+        self.assertIs(multiworld.timings, timings)
+        self.assertIsNone(timings.current_stage)
+        for stage in ("generate_early", "create_regions", "fill", "output"):
+            self.assertIn(stage, timings.stages)
+        self.assertEqual(finished_stages, list(range(1, len(timings.stages) + 1)))
+        self.assertEqual(set(timings.worlds["create_regions"]), {f"{name} ({multiworld.game[player]})"
+                                                                for player, name in multiworld.player_name.items()})
+        report = timings.to_dict()
+        self.assertEqual(report["stages"], timings.stages)
+        self.assertLessEqual(len(report["slowest_worlds"]), 5)
+        self.assertLessEqual(len(report["largest_world_memory"]), 5)
+        if get_memory_use() is not None:
+            self.assertEqual(set(timings.memory), set(timings.stages))
+            self.assertEqual(set(timings.world_memory["create_regions"]), set(timings.worlds["create_regions"]))
+
+    def test_timings_callback_error(self):
+        """Errors storing intermediate timings should be logged instead of failing the generation."""
+        from BaseClasses import GenerationTimings
+
+        def fail(generation_timings: GenerationTimings) -> None:
+            raise ValueError("could not store timings")
+
+        timings = GenerationTimings(fail)
+        timings.start_stage("setup")
+        with self.assertLogs(level="ERROR"):
+            timings.start_stage("fill")
+        timings.finish()
+        self.assertEqual(set(timings.stages), {"setup", "fill"})
+
+    def test_generate_rolls_unchanged(self):
+        """Tests that a single process rolls options from the random module in order, as it did before workers."""
+        import random
+
+        with TemporaryDirectory() as player_files_path:
+            with open(os.path.join(player_files_path, "random.yaml"), "w", encoding="utf-8") as f:
+                f.write("name: Player\n"
+                        "game: Timespinner\n"
+                        "Timespinner:\n"
+                        "  progression_balancing: random\n"
+                        "  accessibility: random\n"
+                        "  StartWithJewelryBox: random\n")
+            sys.argv = [sys.argv[0], '--seed', '0',
+                        '--player_files_path', player_files_path,
+                        '--outputpath', self.output_tempdir.name]
+            erargs, seed = Generate.main()
+            yaml = Generate.read_weights_yamls(os.path.join(player_files_path, "random.yaml"))[0]
+
+        random.seed(seed)
+        Generate.get_seed_name(random)
+        expected = Generate.roll_settings(yaml, erargs.plando_options)
+        for key, value in vars(expected).items():
+            if value is not None and key != "name":
+                self.assertEqual(repr(getattr(erargs, key)[1]), repr(value), key)
+
+    def test_generate_workers(self):
+        """Tests that rolling player files in worker processes gives the same options for any number of workers."""
+        rolled_options = []
+        for workers in ("2", "3"):
+            sys.argv = [sys.argv[0], '--seed', '0', '--workers', workers,
+                        '--player_files_path', str(self.abs_input_dir),
+                        '--outputpath', self.output_tempdir.name]
+            erargs, seed = Generate.main()
+            self.assertEqual(seed, 0)
+            rolled_options.append({key: repr(value) for key, value in vars(erargs).items()})
+        self.assertEqual(rolled_options[0], rolled_options[1])
+
+    @unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), "output processes need fork")
+    def test_generate_output_processes(self):
+        """Tests that output of worlds that support it is generated in an output process and its attributes copied back."""
+        from worlds.timespinner import TimespinnerWorld
+
+        def generate_output(world, output_directory: str) -> None:
+            with open(os.path.join(output_directory, f"P{world.player}_output.txt"), "w") as f:
+                f.write(str(os.getpid()))
+            world.output_pid = os.getpid()
+            world.output_event.set()
+
+        def modify_multidata(world, multidata) -> None:
+            self.assertTrue(world.output_event.wait(10))
+
+        original_generate_early = TimespinnerWorld.generate_early
+
+        def generate_early(world) -> None:
+            original_generate_early(world)
+            world.output_event = threading.Event()
+
+        sys.argv = [sys.argv[0], '--seed', '0', '--output_processes', '2',
+                    '--player_files_path', str(self.abs_input_dir),
+                    '--outputpath', self.output_tempdir.name]
+        with unittest.mock.patch.multiple(TimespinnerWorld, generate_output=generate_output,
+                                          modify_multidata=modify_multidata, generate_early=generate_early,
+                                          output_process_attributes=("output_pid", "output_event"), create=True):
+            multiworld = Main.main(*Generate.main())
+
+        self.assertOutput(self.output_tempdir.name)
+        world = multiworld.worlds[1]
+        self.assertTrue(world.output_event.is_set())
+        self.assertNotEqual(world.output_pid, os.getpid())
+        with zipfile.ZipFile(next(Path(self.output_tempdir.name).glob("*.zip"))) as zf:
+            self.assertEqual(zf.read("P1_output.txt").decode(), str(world.output_pid))
+        # the time taken in the output process is reported to the generator's timings
+        label = f"{multiworld.player_name[1]} ({multiworld.game[1]})"
+        self.assertIn(label, multiworld.timings.worlds["generate_output"])
+        if get_memory_use() is not None:
+            self.assertIn(label, multiworld.timings.world_memory["generate_output"])
+
+    def test_generate_output_archive(self):
+        """Tests that output files are moved into the archive, only compressing what isn't compressed already."""
+        from worlds.timespinner import TimespinnerWorld
+
+        def generate_output(world, output_directory: str) -> None:
+            for name in ("P1_text.txt", "P1_data.bin"):
+                with open(os.path.join(output_directory, name), "w") as f:
+                    f.write("output " * 100)
+            with zipfile.ZipFile(os.path.join(output_directory, "P1_container.zip"), "w") as zf:
+                zf.writestr("data.txt", "container " * 100)
+
+        sys.argv = [sys.argv[0], '--seed', '0',
+                    '--player_files_path', str(self.abs_input_dir),
+                    '--outputpath', self.output_tempdir.name]
+        with unittest.mock.patch.multiple(TimespinnerWorld, generate_output=generate_output,
+                                          output_compression={".bin": 0}):
+            multiworld = Main.main(*Generate.main())
+
+        self.assertOutput(self.output_tempdir.name)
+        self.assertEqual(list(Path(self.output_tempdir.name).glob("*.part")), [])
+        with zipfile.ZipFile(Path(self.output_tempdir.name) / f"AP_{multiworld.seed_name}.zip") as zf:
+            compress_types = {info.filename: info.compress_type for info in zf.infolist()}
+            self.assertEqual(zf.read("P1_text.txt").decode(), "output " * 100)
+        self.assertEqual(compress_types["P1_text.txt"], zipfile.ZIP_DEFLATED)
+        self.assertEqual(compress_types["P1_data.bin"], zipfile.ZIP_STORED)
+        self.assertEqual(compress_types["P1_container.zip"], zipfile.ZIP_STORED)
+        self.assertEqual(compress_types[f"AP_{multiworld.seed_name}.archipelago"], zipfile.ZIP_STORED)
+        self.assertIn(f"AP_{multiworld.seed_name}_Spoiler.txt", compress_types)
+
+    def test_generate_multidata(self):
+        """Tests that the server loads the locations and spheres of generated multidata."""
+        from MultiServer import Context
+
+        sys.argv = [sys.argv[0], '--seed', '0',
+                    '--player_files_path', str(self.abs_input_dir),
+                    '--outputpath', self.output_tempdir.name]
+        multiworld = Main.main(*Generate.main())
+
+        ctx = Context("", 0, "", "", 0, 0, False)
+        ctx.load(str(Path(self.output_tempdir.name) / f"AP_{multiworld.seed_name}.zip"))
+        for location in multiworld.get_filled_locations():
+            if type(location.address) is int:
+                self.assertEqual(ctx.locations[location.player][location.address],
+                                 (location.item.code, location.item.player, location.item.flags))
+        self.assertEqual(sum(len(locations) for _, locations in ctx.locations.items()), len(
+            [location for location in multiworld.get_filled_locations() if type(location.address) is int]))
+        sphere_locations = [location for sphere in multiworld.get_spheres() for location in sphere
+                            if type(location.address) is int]
+        for location in sphere_locations:
+            self.assertGreaterEqual(ctx.get_sphere(location.player, location.address), 0)
+        self.assertEqual(sum(len(location_ids) for sphere in ctx.spheres for location_ids in sphere.values()),
+                         len(sphere_locations))
@@ -0,0 +1,67 @@
+import unittest
+from collections import deque
+
+try:
+    from kvui import UILog
+except Exception:  # kivy not installed, or it can't open a window here
+    UILog = None
+
+
+class LogStandIn:
+    """Runs UILog's message handling on plain attributes, so no widget or window has to be created."""
+    if UILog is not None:
+        add_entry = UILog.add_entry
+        flush = UILog.flush
+        visible_data = UILog.visible_data
+        set_hidden_types = UILog.set_hidden_types
+
+    def __init__(self, messages: int) -> None:
+        self.messages = messages
+        self.data = []
+        self.entries = deque(maxlen=messages)
+        self.pending = deque(maxlen=messages)
+        self.hidden_types = frozenset()
+
+    def flush_trigger(self) -> None:
+        pass
+
+
+@unittest.skipIf(UILog is None, "kvui could not be imported")
+class TestUILog(unittest.TestCase):
+    def test_flush_batches_messages(self) -> None:
+        log = LogStandIn(10)
+        log.add_entry("", {"text": "a"})
+        log.add_entry("Chat", {"text": "b"})
+        self.assertEqual(log.data, [], "messages should only be shown once flushed")
+        log.flush()
+        self.assertEqual([view["text"] for view in log.data], ["a", "b"])
+        self.assertFalse(log.pending)
+        log.flush()  # nothing pending
+        self.assertEqual(len(log.data), 2)
+
+    def test_flush_retention(self) -> None:
+        log = LogStandIn(3)
+        for i in range(5):
+            log.add_entry("", {"text": str(i)})
+        log.flush()
+        self.assertEqual([view["text"] for view in log.data], ["2", "3", "4"])
+        log.add_entry("", {"text": "5"})
+        log.flush()
+        self.assertEqual([view["text"] for view in log.data], ["3", "4", "5"])
+
+    def test_set_hidden_types(self) -> None:
+        log = LogStandIn(10)
+        log.add_entry("", {"text": "log"})
+        log.add_entry("Chat", {"text": "chat"})
+        log.add_entry("ItemSend", {"text": "item"})
+        log.flush()
+        log.add_entry("Chat", {"text": "pending chat"})
+        log.set_hidden_types({"Chat"})
+        self.assertEqual([view["text"] for view in log.data], ["log", "item"])
+        log.add_entry("Chat", {"text": "hidden"})
+        log.add_entry("Join", {"text": "join"})
+        log.flush()
+        self.assertEqual([view["text"] for view in log.data], ["log", "item", "join"])
+        log.set_hidden_types(set())
+        self.assertEqual([view["text"] for view in log.data],
+                         ["log", "chat", "item", "pending chat", "hidden", "join"])
@@ -38,3 +38,19 @@ class TestResolvePlayerName(unittest.TestCase):
         assert p.resolve_player("ABC") == (1, 2, "abc"), "case insensitive resolves when 1 match"
         assert p.resolve_player("abcd") == (1, 3, "abCD"), "case insensitive resolves when 1 match"
         assert not p.resolve_player("aB"), "partial name shouldn't resolve to player"
+
+
+class TestGameData(unittest.TestCase):
+    def test_groups_and_hint_blacklist(self) -> None:
+        """Tests that the server's game data, which is read from the data package, matches the worlds."""
+        from worlds import network_data_package
+        from worlds.AutoWorld import AutoWorldRegister
+
+        ctx = Context("", 0, "", "", 0, 0, False)
+        for game_name, world_type in AutoWorldRegister.world_types.items():
+            with self.subTest(game_name):
+                self.assertEqual(ctx.item_name_groups[game_name], world_type.item_name_groups)
+                self.assertEqual(ctx.location_name_groups[game_name], world_type.location_name_groups)
+                self.assertEqual(ctx.non_hintable_names[game_name], world_type.hint_blacklist)
+                self.assertNotIn("item_name_groups", ctx.gamespackage[game_name])
+                self.assertIn("item_name_groups", network_data_package["games"][game_name])
@@ -0,0 +1,66 @@
+import json
+import typing
+import unittest
+
+from SNIClient import SNESState, SNIContext, coalesce_snes_reads, snes_read, snes_read_batch, snes_read_multiple
+
+
+class MemorySocket:
+    """Answers GetAddress requests from a fake SNES memory, like SNI would."""
+    open = True
+    closed = False
+
+    def __init__(self, ctx: SNIContext, memory: bytes) -> None:
+        self.ctx = ctx
+        self.memory = memory
+        self.requests: typing.List[typing.Tuple[int, int]] = []
+
+    async def send(self, message: str) -> None:
+        request = json.loads(message)
+        assert request["Opcode"] == "GetAddress"
+        address, size = (int(operand, 16) for operand in request["Operands"])
+        self.requests.append((address, size))
+        # SNI may split replies into multiple messages
+        data = self.memory[address:address + size]
+        self.ctx.snes_recv_queue.put_nowait(data[:1])
+        self.ctx.snes_recv_queue.put_nowait(data[1:])
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class TestSNIReads(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.ctx = SNIContext("", None, None)
+        self.ctx.snes_state = SNESState.SNES_ATTACHED
+        self.memory = bytes(range(256))
+        self.socket = MemorySocket(self.ctx, self.memory)
+        self.ctx.snes_socket = typing.cast(typing.Any, self.socket)
+
+    def test_coalesce(self) -> None:
+        self.assertEqual(coalesce_snes_reads([]), [])
+        self.assertEqual(coalesce_snes_reads([(0x20, 4), (0x10, 4), (0x14, 2)]), [(0x10, 6), (0x20, 4)])
+        self.assertEqual(coalesce_snes_reads([(0x10, 8), (0x12, 2)]), [(0x10, 8)])
+        self.assertEqual(coalesce_snes_reads([(0x10, 4), (0x18, 4)]), [(0x10, 4), (0x18, 4)])
+        self.assertEqual(coalesce_snes_reads([(0x10, 4), (0x18, 4)], max_gap=4), [(0x10, 12)])
+
+    async def test_read(self) -> None:
+        self.assertEqual(await snes_read(self.ctx, 0x10, 4), self.memory[0x10:0x14])
+
+    async def test_read_batch(self) -> None:
+        reads = [(0x40, 2), (0x10, 4), (0x40, 2)]
+        self.assertEqual(await snes_read_batch(self.ctx, reads),
+                         [self.memory[address:address + size] for address, size in reads])
+        self.assertEqual(self.socket.requests, reads)
+
+    async def test_read_multiple(self) -> None:
+        reads = [(0x20, 4), (0x10, 4), (0x14, 2), (0x11, 1), (0x80, 16)]
+        self.assertEqual(await snes_read_multiple(self.ctx, reads),
+                         [self.memory[address:address + size] for address, size in reads])
+        self.assertEqual(self.socket.requests, [(0x10, 6), (0x20, 4), (0x80, 16)])
+
+    async def test_read_failure(self) -> None:
+        self.socket.memory = b""
+        with self.assertLogs("SNES", "ERROR"):
+            self.assertIsNone(await snes_read_multiple(self.ctx, [(0x10, 1)]))
+        self.assertTrue(self.socket.closed)
@@ -1,10 +1,15 @@
 # Tests that yaml wrappers in Utils.py do what they should
 
+import os
+import time
 import unittest
+from datetime import date
+from tempfile import TemporaryDirectory
+from unittest import mock
 from typing import cast, Any, ClassVar, Dict
 
 from Utils import dump, Dumper  # type: ignore[attr-defined]
-from Utils import parse_yaml, parse_yamls, unsafe_parse_yaml
+from Utils import parse_yaml, parse_yamls, parse_yamls_cached, unsafe_parse_yaml
 
 
 class AClass:
@@ -66,3 +71,41 @@ class TestYaml(unittest.TestCase):
             parse_yaml(s)
         with self.assertRaises(Exception):
             next(parse_yamls(s))
+
+    def test_cached_parse(self) -> None:
+        import Utils
+
+        cache_path_backup = getattr(Utils.cache_path, "cached_path", None)
+        with TemporaryDirectory() as cache_folder:
+            Utils.cache_path.cached_path = cache_folder
+            try:
+                documents = parse_yamls_cached(f"{self.safe_str}---\n2\n")
+                self.assertEqual((self.safe_data, 2), documents)
+                self.assertEqual(1, len(os.listdir(os.path.join(cache_folder, "yaml"))))
+                documents[0]["a"].append(4)  # results are not shared between calls
+                self.assertEqual((self.safe_data, 2), parse_yamls_cached(f"{self.safe_str}---\n2\n".encode()))
+                self.assertEqual(1, len(os.listdir(os.path.join(cache_folder, "yaml"))))
+                with self.assertRaises(Exception):
+                    parse_yamls_cached(self.unsafe_str)
+                with self.assertRaises(Exception):
+                    parse_yamls_cached("a: 1\na: 2\n")
+                # dates can't be loaded back by restricted_loads, so they are parsed every time instead
+                self.assertEqual(({"day": date(2024, 1, 1)},), parse_yamls_cached("day: 2024-01-01\n"))
+                self.assertEqual(1, len(os.listdir(os.path.join(cache_folder, "yaml"))))
+            finally:
+                if cache_path_backup is None:
+                    del Utils.cache_path.cached_path
+                else:
+                    Utils.cache_path.cached_path = cache_path_backup
+
+    def test_cache_pruning(self) -> None:
+        import Utils
+
+        with TemporaryDirectory() as cache_folder, mock.patch.object(Utils, "_yaml_cache_max_size", 10):
+            for name, size, age in (("old", 1, Utils._yaml_cache_max_age + 60), ("large", 10, 60), ("recent", 1, 0)):
+                path = os.path.join(cache_folder, f"{name}.pickle")
+                with open(path, "wb") as f:
+                    f.write(b"\0" * size)
+                os.utime(path, (time.time() - age, time.time() - age))
+            Utils._prune_yaml_cache(cache_folder)
+            self.assertEqual(["recent.pickle"], os.listdir(cache_folder))
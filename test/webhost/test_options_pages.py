@@ -0,0 +1,69 @@
+import os
+
+from . import TestBase
+
+
+class TestPrerenderedOptionsPages(TestBase):
+    def test_prerendered_option_groups_served(self) -> None:
+        """Verify that option groups rendered ahead of time are used, while the page around them is rendered per
+        request."""
+        from flask import flash
+        from Utils import local_path
+        from worlds.AutoWorld import AutoWorldRegister
+        from WebHostLib.options import get_options_page_file_name, options_pages, render_options_page
+
+        game = next(game for game, world in AutoWorldRegister.world_types.items()
+                    if not world.hidden and world.web.options_page is not False)
+        folder = local_path("WebHostLib", "static", "generated", "options")
+        os.makedirs(folder, exist_ok=True)
+        for template in options_pages:
+            with self.subTest(template=template):
+                full_path = os.path.join(folder, get_options_page_file_name(template, game))
+                existed = os.path.exists(full_path)
+                if not existed:
+                    with open(full_path, "w", encoding="utf-8") as f:
+                        f.write("<div>prerendered</div>")
+                try:
+                    with self.app.test_request_context("/", base_url="http://localhost/root/"):
+                        flash("Test flashed message")
+                        page = render_options_page(template, game)
+                    with open(full_path, encoding="utf-8") as f:
+                        self.assertIn(f.read(), page)
+                    self.assertIn("Test flashed message", page)
+                    self.assertIn("/root/static/", page)
+                finally:
+                    if not existed:
+                        os.unlink(full_path)
+
+    def test_option_groups_render(self) -> None:
+        """Verify that the option groups rendered ahead of time are the ones the page would render itself."""
+        from flask import render_template
+        from WebHostLib.options import get_option_groups_context, options_pages
+
+        with self.app.test_request_context():
+            for template, (option_groups_template, is_complex) in options_pages.items():
+                with self.subTest(template=template):
+                    option_groups = render_template(option_groups_template,
+                                                    **get_option_groups_context("Archipelago", is_complex))
+                    self.assertIn("</details>", option_groups)
+                    self.assertNotIn("<html", option_groups)
+
+    def test_file_name_depends_on_template(self) -> None:
+        from WebHostLib.options import get_options_page_file_name, options_pages
+
+        file_names = {get_options_page_file_name(template, "Archipelago") for template in options_pages}
+        self.assertEqual(len(file_names), len(options_pages))
+
+    def test_file_name_depends_on_renderer(self) -> None:
+        """Verify that changes to the templates or core options give every page a new file name."""
+        from unittest import mock
+        from WebHostLib import options
+
+        file_name = options.get_options_page_file_name("playerOptions/playerOptions.html", "Archipelago")
+        options.get_options_page_file_name.cache_clear()
+        try:
+            with mock.patch.object(options, "get_renderer_checksum", return_value="changed"):
+                self.assertNotEqual(options.get_options_page_file_name("playerOptions/playerOptions.html",
+                                                                       "Archipelago"), file_name)
+        finally:
+            options.get_options_page_file_name.cache_clear()
@@ -0,0 +1,35 @@
+from datetime import date
+from uuid import uuid4
+
+from flask import url_for
+
+from . import TestBase
+
+
+class TestGamesPlayed(TestBase):
+    def test_new_room_counts_slots(self) -> None:
+        """Verify that creating a room adds its slots to the daily aggregate read by the stats page."""
+        from pony.orm import db_session
+        from WebHostLib.models import GamesPlayed, Seed, Slot
+
+        with self.client.session_transaction() as session:
+            session["_id"] = uuid4()
+            with db_session:
+                slots = {Slot(player_id=player, player_name=f"Player{player}", game="Stats Test Game")
+                         for player in (1, 2)}
+                seed = Seed(multidata=b"", owner=session["_id"], slots=slots)
+                seed_id = seed.id
+
+        with db_session:
+            stat = GamesPlayed.get(day=date.today(), game="Stats Test Game")
+            played_before = stat.played if stat else 0
+
+        with self.app.app_context(), self.app.test_request_context():
+            for _ in range(2):  # the second room increments the existing row
+                response = self.client.get(url_for("new_room", seed=seed_id))
+                self.assertEqual(response.status_code, 302)
+            response = self.client.get(url_for("stats"))
+            self.assertEqual(response.status_code, 200)
+
+        with db_session:
+            self.assertEqual(GamesPlayed[date.today(), "Stats Test Game"].played, played_before + 4)
@@ -0,0 +1,95 @@
+import os
+import pickle
+import sys
+import zipfile
+import zlib
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from . import TestBase
+
+
+class TestProcessMultidata(TestBase):
+    game_data = {
+        "item_name_groups": {"Everything": ["Test Item"]},
+        "item_name_to_id": {"Test Item": 1},
+        "location_name_groups": {"Everywhere": ["Test Location"]},
+        "location_name_to_id": {"Test Location": 1},
+    }
+
+    @staticmethod
+    def compress(multidata: dict) -> bytes:
+        return bytes([3]) + zlib.compress(pickle.dumps(multidata), 9)
+
+    def test_no_data_package_keeps_data(self) -> None:
+        """Verify that multidata without an embedded data package is stored without being re-encoded."""
+        from pony.orm import db_session
+        from WebHostLib.upload import process_multidata
+
+        compressed = self.compress({"slot_info": {}})
+        with db_session:
+            slots, multidata, embeds_data_package = process_multidata(compressed)
+        self.assertEqual(slots, set())
+        self.assertIs(multidata, compressed)
+        self.assertFalse(embeds_data_package)
+
+    def test_data_package_stripped(self) -> None:
+        """Verify that an embedded data package is moved into the database and later stripped from the seed."""
+        from pony.orm import db_session
+        from worlds.AutoWorld import data_package_checksum
+        from WebHostLib.models import GameDataPackage, Seed
+        from WebHostLib.upload import process_multidata, strip_seed_data_package
+
+        checksum = data_package_checksum(self.game_data)
+        compressed = self.compress({"datapackage": {"Test Game": {**self.game_data, "checksum": checksum}}})
+        for _ in range(2):  # second upload finds the existing data package
+            with db_session:
+                _, multidata, embeds_data_package = process_multidata(compressed)
+                self.assertTrue(GameDataPackage.exists(checksum=checksum))
+                self.assertIs(multidata, compressed, "upload should be stored as is until stripped")
+                self.assertTrue(embeds_data_package)
+                seed_id = Seed(multidata=multidata, owner=0).id
+            strip_seed_data_package(seed_id)
+            with db_session:
+                self.assertEqual(pickle.loads(zlib.decompress(Seed[seed_id].multidata[1:]))["datapackage"],
+                                 {"Test Game": {"version": 0, "checksum": checksum}})
+
+    def test_generated_multidata(self) -> None:
+        """Verify that multidata from Main is uploaded with its data package stripped after the fact."""
+        import Generate
+        import Main
+        from pony.orm import db_session
+        from MultiServer import Context
+        from WebHostLib.models import GameDataPackage, Seed
+        from WebHostLib.upload import process_multidata, strip_seed_data_package
+
+        player_files = Path(__file__).parent.parent / "programs" / "data" / "one_player"
+        original_argv = sys.argv
+        with TemporaryDirectory() as output_dir:
+            sys.argv = [sys.argv[0], "--seed", "0", "--player_files_path", str(player_files),
+                        "--outputpath", output_dir]
+            try:
+                multiworld = Main.main(*Generate.main())
+            finally:
+                sys.argv = original_argv
+            with zipfile.ZipFile(os.path.join(output_dir, f"AP_{multiworld.seed_name}.zip")) as zfile:
+                uploaded = zfile.read(f"AP_{multiworld.seed_name}.archipelago")
+
+        games = set(Context.decompress(uploaded)["datapackage"])
+        self.assertTrue(games)
+        with db_session:
+            slots, multidata, embeds_data_package = process_multidata(uploaded)
+            self.assertIs(multidata, uploaded)
+            self.assertTrue(embeds_data_package)
+            self.assertEqual(len(slots), 1)
+            seed_id = Seed(multidata=multidata, slots=slots, owner=0).id
+        strip_seed_data_package(seed_id)
+
+        with db_session:
+            stored = Seed[seed_id].multidata
+            self.assertLess(len(stored), len(uploaded))
+            data_package = Context.decompress(stored)["datapackage"]
+            self.assertEqual(set(data_package), games)
+            for game_data in data_package.values():
+                self.assertEqual(set(game_data), {"version", "checksum"})
+                self.assertTrue(GameDataPackage.exists(checksum=game_data["checksum"]))
@@ -4,14 +4,15 @@ import hashlib
 import logging
 import pathlib
 import sys
+import threading
 import time
 from random import Random
 from dataclasses import make_dataclass
-from typing import (Any, Callable, ClassVar, Dict, FrozenSet, List, Mapping, Optional, Set, TextIO, Tuple,
-                    TYPE_CHECKING, Type, Union)
+from typing import (Any, Callable, ClassVar, Dict, FrozenSet, Iterator, KeysView, List, Mapping, MutableMapping,
+                    Optional, Set, TextIO, Tuple, TYPE_CHECKING, Type, Union)
 
 from Options import item_and_loc_options, OptionGroup, PerGameCommonOptions
-from BaseClasses import CollectionState
+from BaseClasses import CollectionState, get_memory_use
 
 if TYPE_CHECKING:
     from BaseClasses import MultiWorld, Item, Location, Tutorial, Region, Entrance
@@ -21,8 +22,78 @@ if TYPE_CHECKING:
 perf_logger = logging.getLogger("performance")
 
 
+class WorldTypes(MutableMapping[str, "AutoWorldRegister"]):
+    """Game name -> world type.
+    Games can be deferred, which means their world is known (from the world manifest), but not imported yet.
+    Looking up a deferred game imports its world, iterating imports all of them.
+    Membership tests and len() do not import anything."""
+    _types: Dict[str, AutoWorldRegister]
+    _deferred: Dict[str, Callable[[], Any]]
+
+    def __init__(self) -> None:
+        self._types = {}
+        self._deferred = {}
+        self._lock = threading.RLock()
+
+    def defer(self, game: str, load: Callable[[], Any]) -> None:
+        """Makes game known without importing it. load is called when it is needed, and should register game."""
+        if game not in self._types:
+            self._deferred[game] = load
+
+    def load(self, game: str) -> None:
+        with self._lock:
+            load = self._deferred.get(game, None)
+            if load:
+                load()
+                # whatever is still deferred to this load failed to register
+                for deferred_game, deferred_load in list(self._deferred.items()):
+                    if deferred_load is load:
+                        del self._deferred[deferred_game]
+
+    def load_all(self) -> None:
+        with self._lock:
+            while self._deferred:
+                self.load(next(iter(self._deferred)))
+
+    @property
+    def loaded(self) -> Mapping[str, AutoWorldRegister]:
+        """The world types that are imported already."""
+        return self._types
+
+    @property
+    def deferred(self) -> KeysView[str]:
+        """The games that are known, but not imported yet."""
+        return self._deferred.keys()
+
+    def __getitem__(self, game: str) -> AutoWorldRegister:
+        if game not in self._types:
+            self.load(game)
+        return self._types[game]
+
+    def __setitem__(self, game: str, world_type: AutoWorldRegister) -> None:
+        self._types[game] = world_type
+        self._deferred.pop(game, None)
+
+    def __delitem__(self, game: str) -> None:
+        self._deferred.pop(game, None)
+        del self._types[game]
+
+    def __contains__(self, game: object) -> bool:
+        return game in self._types or game in self._deferred
+
+    def __iter__(self) -> Iterator[str]:
+        self.load_all()
+        return iter(self._types)
+
+    def __len__(self) -> int:
+        return len(self._types) + len(self._deferred)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._types!r}, deferred={list(self._deferred)!r})"
+
+
 class AutoWorldRegister(type):
-    world_types: Dict[str, Type[World]] = {}
+    world_types: WorldTypes = WorldTypes()
     __file__: str
     zip_path: Optional[str]
     settings_key: str
@@ -81,7 +152,7 @@ class AutoWorldRegister(type):
         # construct class
         new_class = super().__new__(mcs, name, bases, dct)
         if "game" in dct:
-            if dct["game"] in AutoWorldRegister.world_types:
+            if dct["game"] in AutoWorldRegister.world_types.loaded:
                 raise RuntimeError(f"""Game {dct["game"]} already registered.""")
             AutoWorldRegister.world_types[dct["game"]] = new_class
         new_class.__file__ = sys.modules[new_class.__module__].__file__
@@ -146,9 +217,19 @@ class WebWorldRegister(type):
 
 def _timed_call(method: Callable[..., Any], *args: Any,
                 multiworld: Optional["MultiWorld"] = None, player: Optional[int] = None) -> Any:
+    memory_before = get_memory_use() if multiworld else None
     start = time.perf_counter()
     ret = method(*args)
     taken = time.perf_counter() - start
+    if multiworld:
+        memory_growth = None if memory_before is None else max(0, get_memory_use() - memory_before)
+        if player:
+            multiworld.timings.add_world_time(method.__name__, f"{multiworld.player_name[player]} "
+                                                               f"({multiworld.game[player]})", taken, memory_growth)
+        else:  # stage_ method, usually a classmethod
+            multiworld.timings.add_world_time(method.__name__[len("stage_"):],
+                                              getattr(getattr(method, "__self__", None), "game", method.__qualname__),
+                                              taken, memory_growth)
     if taken > 1.0:
         if player and multiworld:
             perf_logger.info(f"Took {taken:.4f} seconds in {method.__qualname__} for player {player}, "
@@ -195,7 +276,7 @@ def call_stage(multiworld: "MultiWorld", method_name: str, *args: Any) -> None:
     for world_type in sorted(world_types, key=lambda world: world.__name__):
         stage_callable = getattr(world_type, f"stage_{method_name}", None)
         if stage_callable:
-            _timed_call(stage_callable, multiworld, *args)
+            _timed_call(stage_callable, multiworld, *args, multiworld=multiworld)
 
 
 class WebWorld(metaclass=WebWorldRegister):
@@ -295,6 +376,16 @@ class World(metaclass=AutoWorldRegister):
     origin_region_name: str = "Menu"
     """Name of the Region from which accessibility is tested."""
 
+    output_process_attributes: ClassVar[Optional[Tuple[str, ...]]] = None
+    """If not None, generate_output may run in a forked process when the generator uses output processes.
+    Names the attributes generate_output sets that are used afterwards, like a rom name for modify_multidata.
+    Their values are copied back once the process is done, `threading.Event` attributes are set instead."""
+
+    output_compression: ClassVar[Dict[str, int]] = {}
+    """Compression levels of the files written by generate_output in the output archive, by file extension.
+    Files of other extensions use level 9. Level 0 and files that are compressed already, like an APContainer, are
+    stored uncompressed."""
+
     explicit_indirect_conditions: bool = True
     """If True, the world implementation is supposed to use MultiWorld.register_indirect_condition() correctly.
     If False, everything is rechecked at every step, which is slower computationally, 
@@ -508,7 +599,7 @@ class World(metaclass=AutoWorldRegister):
         """Called when an item is collected in to state. Useful for things such as progressive items or currency."""
         name = self.collect_item(state, item)
         if name:
-            state.prog_items[self.player][name] += 1
+            state.get_item_counts(self.player).add(name)
             return True
         return False
 
@@ -516,9 +607,10 @@ class World(metaclass=AutoWorldRegister):
         """Called when an item is removed from to state. Useful for things such as progressive items or currency."""
         name = self.collect_item(state, item, True)
         if name:
-            state.prog_items[self.player][name] -= 1
-            if state.prog_items[self.player][name] < 1:
-                del (state.prog_items[self.player][name])
+            item_counts = state.get_item_counts(self.player)
+            item_counts.add(name, -1)
+            if item_counts[name] < 1:
+                del (item_counts[name])
             return True
         return False
 
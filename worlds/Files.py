@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import abc
 import json
+import struct
 import zipfile
 from enum import IntEnum
 import os
@@ -203,7 +204,8 @@ class APProcedurePatch(APAutoPatchInterface):
     @classmethod
     def get_source_data_with_cache(cls) -> bytes:
         if not hasattr(cls, "source_data"):
-            cls.source_data = cls.get_source_data()
+            # immutable, as procedure steps may modify a bytearray in place
+            cls.source_data = bytes(cls.get_source_data())
         return cls.source_data
 
     def __init__(self, *args: Any, **kwargs: Any):
@@ -251,7 +253,9 @@ class APProcedurePatch(APAutoPatchInterface):
 
     def patch(self, target: str) -> None:
         self.read()
-        base_data = self.get_source_data_with_cache()
+        # the steps pass a single bytearray along once the first step copied the source data into one,
+        # see APPatchExtension
+        base_data: Union[bytes, bytearray] = self.get_source_data_with_cache()
         patch_extender = AutoPatchExtensionRegister.get_handler(self.game)
         assert not isinstance(self.procedure, str), f"{type(self)} must define procedures"
         for step, args in self.procedure:
@@ -295,6 +299,12 @@ class APTokenTypes(IntEnum):
     XOR_8 = 5
 
 
+_token_header = struct.Struct("<BII")  # token type, offset, size
+_token_copy_args = struct.Struct("<II")  # length, source offset or value
+_AND_8, _OR_8, _XOR_8 = APTokenTypes.AND_8.value, APTokenTypes.OR_8.value, APTokenTypes.XOR_8.value
+_COPY, _RLE = APTokenTypes.COPY.value, APTokenTypes.RLE.value
+
+
 class APTokenMixin:
     """
     A class that defines functions for generating a token binary, for use in patches.
@@ -375,6 +385,8 @@ class APPatchExtension(metaclass=AutoPatchExtensionRegister):
     Further arguments are passed in from the procedure as defined.
 
     Patch extension functions must return the changed bytes.
+    rom may also be a bytearray, in which case it may be changed in place and returned, which avoids copying the whole
+    file for every step. A bytes rom must not be changed in place, as it may be the cached source data.
     """
     game: str
     required_extensions: ClassVar[Tuple[str, ...]] = ()
@@ -382,47 +394,48 @@ class APPatchExtension(metaclass=AutoPatchExtensionRegister):
     @staticmethod
     def apply_bsdiff4(caller: APProcedurePatch, rom: bytes, patch: str) -> bytes:
         """Applies the given bsdiff4 from the patch onto the current file."""
-        return bsdiff4.patch(rom, caller.get_file(patch))
+        # bsdiff4 only takes immutable bytes, bytes(rom) doesn't copy if rom already is bytes
+        return bsdiff4.patch(bytes(rom), caller.get_file(patch))
 
     @staticmethod
     def apply_tokens(caller: APProcedurePatch, rom: bytes, token_file: str) -> bytes:
         """Applies the given token file from the patch onto the current file."""
-        token_data = caller.get_file(token_file)
-        rom_data = bytearray(rom)
+        token_data = memoryview(caller.get_file(token_file))
+        rom_data = rom if isinstance(rom, bytearray) else bytearray(rom)
         token_count = int.from_bytes(token_data[0:4], "little")
+        unpack_header = _token_header.unpack_from
+        unpack_copy_args = _token_copy_args.unpack_from
         bpr = 4
+        # tokens are applied in order, as later tokens may overwrite or COPY from earlier ones
         for _ in range(token_count):
-            token_type = token_data[bpr:bpr + 1][0]
-            offset = int.from_bytes(token_data[bpr + 1:bpr + 5], "little")
-            size = int.from_bytes(token_data[bpr + 5:bpr + 9], "little")
-            data = token_data[bpr + 9:bpr + 9 + size]
-            if token_type in [APTokenTypes.AND_8, APTokenTypes.OR_8, APTokenTypes.XOR_8]:
-                arg = data[0]
-                if token_type == APTokenTypes.AND_8:
-                    rom_data[offset] = rom_data[offset] & arg
-                elif token_type == APTokenTypes.OR_8:
-                    rom_data[offset] = rom_data[offset] | arg
-                else:
-                    rom_data[offset] = rom_data[offset] ^ arg
-            elif token_type in [APTokenTypes.COPY, APTokenTypes.RLE]:
-                length = int.from_bytes(data[:4], "little")
-                value = int.from_bytes(data[4:], "little")
-                if token_type == APTokenTypes.COPY:
-                    rom_data[offset: offset + length] = rom_data[value: value + length]
-                else:
-                    rom_data[offset: offset + length] = bytes([value] * length)
+            token_type, offset, size = unpack_header(token_data, bpr)
+            bpr += 9
+            if token_type == _AND_8:
+                rom_data[offset] &= token_data[bpr]
+            elif token_type == _OR_8:
+                rom_data[offset] |= token_data[bpr]
+            elif token_type == _XOR_8:
+                rom_data[offset] ^= token_data[bpr]
+            elif token_type == _COPY:
+                length, value = unpack_copy_args(token_data, bpr)
+                rom_data[offset: offset + length] = rom_data[value: value + length]
+            elif token_type == _RLE:
+                length, value = unpack_copy_args(token_data, bpr)
+                rom_data[offset: offset + length] = bytes((value,)) * length
             else:
-                rom_data[offset:offset + len(data)] = data
-            bpr += 9 + size
-        return bytes(rom_data)
+                # slicing the memoryview doesn't copy the data
+                rom_data[offset:offset + size] = token_data[bpr:bpr + size]
+            bpr += size
+        return rom_data
 
     @staticmethod
     def calc_snes_crc(caller: APProcedurePatch, rom: bytes) -> bytes:
         """Calculates and applies a valid CRC for the SNES rom header."""
-        rom_data = bytearray(rom)
+        rom_data = rom if isinstance(rom, bytearray) else bytearray(rom)
         if len(rom) < 0x8000:
             raise Exception("Tried to calculate SNES CRC on file too small to be a SNES ROM.")
-        crc = (sum(rom_data[:0x7FDC] + rom_data[0x7FE0:]) + 0x01FE) & 0xFFFF
+        # sum the whole file and take the checksum bytes back out, instead of concatenating copies of both sides
+        crc = (sum(rom) - sum(rom[0x7FDC:0x7FE0]) + 0x01FE) & 0xFFFF
         inv = crc ^ 0xFFFF
         rom_data[0x7FDC:0x7FE0] = [inv & 0xFF, (inv >> 8) & 0xFF, crc & 0xFF, (crc >> 8) & 0xFF]
-        return bytes(rom_data)
+        return rom_data
@@ -0,0 +1,145 @@
+"""Instrumentation for world imports, used when settings.profile_world_imports is set.
+Records per module how long its import took, how much memory it kept and which large data it built at its top level.
+Submodules are recorded on their own and are not counted towards the module that imported them."""
+import dataclasses
+import re
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from importlib.abc import Loader, MetaPathFinder
+from importlib.machinery import ModuleSpec
+from types import ModuleType
+from typing import Any, Iterator, List, Optional, Sequence, Set, Tuple
+
+__all__ = ["ModuleImport", "ImportProfile", "ImportProfiler", "import_profiler"]
+
+
+@dataclasses.dataclass
+class ModuleImport:
+    name: str
+    time_taken: float
+    memory_delta: int
+    """bytes allocated by the module's top level that are still alive after it was imported"""
+    large_data: List[Tuple[str, str, int]]
+    """(global name, type name, size) of large containers and all regular expressions defined by the module"""
+
+
+@dataclasses.dataclass
+class ImportProfile:
+    name: str
+    modules: List[ModuleImport] = dataclasses.field(default_factory=list)
+
+    @property
+    def time_taken(self) -> float:
+        return sum(module.time_taken for module in self.modules)
+
+    @property
+    def memory_delta(self) -> int:
+        return sum(module.memory_delta for module in self.modules)
+
+    def report(self, count: Optional[int] = None) -> str:
+        """Lists the modules from slowest to fastest import, with their large top level data."""
+        lines = [f"{self.name}: {self.time_taken:.4f} seconds, {self.memory_delta / 1024 / 1024:.2f} MiB"]
+        for module in sorted(self.modules, key=lambda module: module.time_taken, reverse=True)[:count]:
+            lines.append(f"  {module.time_taken:.4f} seconds, {module.memory_delta / 1024:9.1f} KiB in {module.name}")
+            for global_name, type_name, size in module.large_data:
+                lines.append(f"    {global_name}: {type_name} of size {size}")
+        return "\n".join(lines)
+
+
+class _ProfilingLoader(Loader):
+    def __init__(self, loader: Loader, profiler: "ImportProfiler") -> None:
+        self.loader = loader
+        self.profiler = profiler
+
+    def create_module(self, spec: ModuleSpec) -> Optional[ModuleType]:
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        # don't leave this wrapper in the module, some worlds read their own loader
+        module.__loader__ = self.loader
+        if module.__spec__:
+            module.__spec__.loader = self.loader
+        self.profiler.exec_module(self.loader, module)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.loader, name)
+
+
+class ImportProfiler(MetaPathFinder):
+    large_data_size: int = 1000
+    """containers with at least this many entries are reported as large data"""
+
+    _profile: Optional[ImportProfile] = None
+    _children: List[List[Any]]
+    _seen_data: Set[int]
+
+    def __init__(self) -> None:
+        self._children = []
+        self._seen_data = set()
+
+    @contextmanager
+    def profile(self, name: str) -> Iterator[ImportProfile]:
+        """Records all modules imported within the context into the yielded ImportProfile."""
+        profile = ImportProfile(name)
+        previous_profile, self._profile = self._profile, profile
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        sys.meta_path.insert(0, self)
+        try:
+            yield profile
+        finally:
+            sys.meta_path.remove(self)
+            if started_tracing:
+                tracemalloc.stop()
+            self._profile = previous_profile
+
+    def find_spec(self, fullname: str, path: Optional[Sequence[str]],
+                  target: Optional[ModuleType] = None) -> Optional[ModuleSpec]:
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec:
+                if spec.loader and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _ProfilingLoader(spec.loader, self)
+                return spec
+        return None
+
+    def exec_module(self, loader: Loader, module: ModuleType) -> None:
+        """Executes module with loader, recording it into the active profile."""
+        start_time = time.perf_counter()
+        start_memory = tracemalloc.get_traced_memory()[0]
+        self._children.append([0.0, 0])
+        try:
+            loader.exec_module(module)
+        finally:
+            child_time, child_memory = self._children.pop()
+            time_taken = time.perf_counter() - start_time
+            memory_delta = tracemalloc.get_traced_memory()[0] - start_memory
+            if self._children:
+                self._children[-1][0] += time_taken
+                self._children[-1][1] += memory_delta
+            if self._profile:
+                self._profile.modules.append(ModuleImport(module.__name__, time_taken - child_time,
+                                                          memory_delta - child_memory, self._find_large_data(module)))
+
+    def _find_large_data(self, module: ModuleType) -> List[Tuple[str, str, int]]:
+        large_data: List[Tuple[str, str, int]] = []
+        for global_name, value in vars(module).items():
+            # data imported from a submodule was already attributed to that submodule
+            if id(value) in self._seen_data:
+                continue
+            if isinstance(value, re.Pattern):
+                large_data.append((global_name, "regex", len(value.pattern)))
+            elif isinstance(value, (dict, list, tuple, set, frozenset)) and len(value) >= self.large_data_size:
+                large_data.append((global_name, type(value).__name__, len(value)))
+            else:
+                continue
+            self._seen_data.add(id(value))
+        return large_data
+
+
+import_profiler = ImportProfiler()
@@ -1,5 +1,7 @@
+import hashlib
 import importlib
 import importlib.util
+import json
 import logging
 import os
 import sys
@@ -7,9 +9,14 @@ import warnings
 import zipimport
 import time
 import dataclasses
-from typing import Dict, List, TypedDict
+from typing import Any, Dict, FrozenSet, List, Optional, TypedDict, TYPE_CHECKING
 
-from Utils import local_path, user_path
+import settings
+from Utils import cache_path, load_data_package_for_checksum, local_path, store_data_package_for_checksum, user_path, \
+    __version__
+
+if TYPE_CHECKING:
+    from .ImportProfiler import ImportProfile
 
 local_folder = os.path.dirname(__file__)
 user_folder = user_path("worlds") if user_path() != local_path() else user_path("custom_worlds")
@@ -27,6 +34,9 @@ __all__ = {
     "GamesPackage",
     "DataPackage",
     "failed_world_loads",
+    "get_source_checksum",
+    "get_hint_blacklist",
+    "world_manifest",
 }
 
 
@@ -45,12 +55,32 @@ class DataPackage(TypedDict):
     games: Dict[str, GamesPackage]
 
 
+def get_source_checksum(path: str) -> str:
+    """Returns a checksum that changes whenever the world source at path changes.
+    .apworld files are hashed by content, world folders by the names, sizes and modification times of their files."""
+    checksum = hashlib.sha1()
+    if os.path.isfile(path):
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                checksum.update(chunk)
+    else:
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(folder for folder in dirs if folder != "__pycache__")
+            for file in sorted(files):
+                stat = os.stat(os.path.join(root, file))
+                checksum.update(f"{os.path.relpath(os.path.join(root, file), path)}|"
+                                f"{stat.st_size}|{stat.st_mtime_ns}\n".encode())
+    return checksum.hexdigest()
+
+
 @dataclasses.dataclass(order=True)
 class WorldSource:
     path: str  # typically relative path from this module
     is_zip: bool = False
     relative: bool = True  # relative to regular world import folder
     time_taken: float = -1.0
+    import_profile: Optional["ImportProfile"] = dataclasses.field(default=None, compare=False)
+    """per module import times and memory, only recorded with settings.profile_world_imports"""
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.path}, is_zip={self.is_zip}, relative={self.relative})"
@@ -61,7 +91,18 @@ class WorldSource:
             return os.path.join(local_folder, self.path)
         return self.path
 
+    @property
+    def module_name(self) -> str:
+        return os.path.basename(self.path).rsplit(".", 1)[0]
+
     def load(self) -> bool:
+        if settings.profile_world_imports:
+            from .ImportProfiler import import_profiler
+            with import_profiler.profile(self.path) as self.import_profile:
+                return self._load()
+        return self._load()
+
+    def _load(self) -> bool:
         try:
             start = time.perf_counter()
             if self.is_zip:
@@ -85,7 +126,11 @@ class WorldSource:
                     warnings.filterwarnings("ignore", message="__package__ != __spec__.parent")
                     # Found no equivalent for < 3.10
                     if hasattr(importer, "exec_module"):
-                        importer.exec_module(mod)
+                        if self.import_profile:
+                            from .ImportProfiler import import_profiler
+                            import_profiler.exec_module(importer, mod)
+                        else:
+                            importer.exec_module(mod)
             else:
                 importlib.import_module(f".{self.path}", "worlds")
             self.time_taken = time.perf_counter()-start
@@ -122,15 +167,105 @@ for folder in (folder for folder in (user_folder, local_folder) if folder):
             elif entry.is_file() and entry.name.endswith(".apworld"):
                 world_sources.append(WorldSource(file_name, is_zip=True, relative=relative))
 
+
+def _load_world_manifest() -> Dict[str, Any]:
+    try:
+        with open(cache_path("world_manifest.json"), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("version") != __version__:
+        return {}
+    return manifest["sources"]
+
+
+def _store_world_manifest(sources: Dict[str, Any]) -> None:
+    try:
+        os.makedirs(cache_path(), exist_ok=True)
+        with open(cache_path("world_manifest.json"), "w", encoding="utf-8") as f:
+            json.dump({"version": __version__, "sources": sources}, f, indent=1)
+    except OSError as e:
+        logging.debug(f"Could not store world manifest: {e}")
+
+
+world_manifest: Dict[str, Any] = {}
+"""Only used with settings.lazy_world_loading.
+resolved world source path -> {"checksum": source checksum,
+                               "games": {game: {"checksum": data package checksum, "hint_blacklist": [names]}}}"""
+_deferred_games: Dict[str, Dict[str, Any]] = {}
+"""game -> its manifest entry, for games that were deferred instead of imported"""
+
+from .AutoWorld import AutoWorldRegister
+
 # import all submodules to trigger AutoWorldRegister
 world_sources.sort()
-for world_source in world_sources:
-    world_source.load()
+if settings.lazy_world_loading:
+    # only import worlds the manifest doesn't know (yet), defer the rest until they are first looked up
+    world_manifest = _load_world_manifest()
+    loaded_sources: Dict[str, WorldSource] = {}
+    for world_source in world_sources:
+        source_path = os.path.abspath(world_source.resolved_path)
+        checksum = get_source_checksum(source_path)
+        manifest_entry = world_manifest.get(source_path, {})
+        if manifest_entry.get("checksum") == checksum:
+            load = world_source.load  # one bound method per source, so a load imports all its games at once
+            for game, game_entry in manifest_entry["games"].items():
+                AutoWorldRegister.world_types.defer(game, load)
+                _deferred_games[game] = game_entry
+        else:
+            world_manifest.pop(source_path, None)
+            if world_source.load():
+                world_manifest[source_path] = {"checksum": checksum, "games": {}}
+                loaded_sources[world_source.module_name] = world_source
+    if loaded_sources:
+        for world_name, world in AutoWorldRegister.world_types.loaded.items():
+            world_source = loaded_sources.get(world.__module__.split(".")[1], None)
+            if world_source:
+                game_package = world.get_data_package_data()
+                store_data_package_for_checksum(world_name, game_package)
+                world_manifest[os.path.abspath(world_source.resolved_path)]["games"][world_name] = {
+                    "checksum": game_package["checksum"],
+                    "hint_blacklist": sorted(world.hint_blacklist),
+                }
+        _store_world_manifest(world_manifest)
+else:
+    for world_source in world_sources:
+        world_source.load()
 
-# Build the data package for each game.
-from .AutoWorld import AutoWorldRegister
 
-network_data_package: DataPackage = {
-    "games": {world_name: world.get_data_package_data() for world_name, world in AutoWorldRegister.world_types.items()},
-}
+def _get_game_package(game: str) -> GamesPackage:
+    if game in _deferred_games and game not in AutoWorldRegister.world_types.loaded:
+        game_package = load_data_package_for_checksum(game, _deferred_games[game]["checksum"])
+        # clients cache data packages without the groups under the same name, those can't be used here
+        if "item_name_groups" in game_package and "location_name_groups" in game_package:
+            return game_package
+        game_package = AutoWorldRegister.world_types[game].get_data_package_data()
+        store_data_package_for_checksum(game, game_package)
+        return game_package
+    return AutoWorldRegister.world_types[game].get_data_package_data()
+
+
+def get_hint_blacklist(game: str) -> FrozenSet[str]:
+    """Returns the names that can't be hinted for in game, without importing its world if it is deferred."""
+    if game in _deferred_games and game not in AutoWorldRegister.world_types.loaded:
+        return frozenset(_deferred_games[game]["hint_blacklist"])
+    return AutoWorldRegister.world_types[game].hint_blacklist
+
 
+if settings.lazy_world_loading:
+    def __getattr__(name: str) -> Any:
+        # with a current manifest, this reads the data packages from cache instead of importing the worlds
+        if name == "network_data_package":
+            global network_data_package
+            network_data_package = {
+                "games": {world_name: _get_game_package(world_name)
+                          for world_name in [*AutoWorldRegister.world_types.loaded,
+                                             *AutoWorldRegister.world_types.deferred]},
+            }
+            return network_data_package
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+else:
+    network_data_package: DataPackage = {
+        "games": {world_name: world.get_data_package_data()
+                  for world_name, world in AutoWorldRegister.world_types.items()},
+    }
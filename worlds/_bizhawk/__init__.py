@@ -46,12 +46,15 @@ class SyncError(Exception):
 class BizHawkContext:
     streams: typing.Optional[typing.Tuple[asyncio.StreamReader, asyncio.StreamWriter]]
     connection_status: ConnectionStatus
+    snapshot: int
+    """Hash of all data read and written since it was last reset, used by the client to notice when nothing changes"""
     _lock: asyncio.Lock
     _port: typing.Optional[int]
 
     def __init__(self) -> None:
         self.streams = None
         self.connection_status = ConnectionStatus.NOT_CONNECTED
+        self.snapshot = 0
         self._lock = asyncio.Lock()
         self._port = None
 
@@ -256,6 +259,7 @@ async def guarded_read(ctx: BizHawkContext, read_list: typing.List[typing.Tuple[
     for item in res:
         if item["type"] == "GUARD_RESPONSE":
             if not item["value"]:
+                ctx.snapshot = hash((ctx.snapshot, None))
                 return None
         else:
             if item["type"] != "READ_RESPONSE":
@@ -263,6 +267,7 @@ async def guarded_read(ctx: BizHawkContext, read_list: typing.List[typing.Tuple[
 
             ret.append(base64.b64decode(item["value"]))
 
+    ctx.snapshot = hash((ctx.snapshot, *ret))
     return ret
 
 
@@ -313,6 +318,7 @@ async def guarded_write(ctx: BizHawkContext, write_list: typing.List[typing.Tupl
             if item["type"] != "WRITE_RESPONSE":
                 raise SyncError(f"Expected response of type WRITE_RESPONSE or GUARD_RESPONSE but got {item['type']}")
 
+    ctx.snapshot = hash((ctx.snapshot, *(bytes(value) for _, value, _ in write_list)))
     return True
 
 
@@ -8,7 +8,8 @@ import enum
 import subprocess
 from typing import Any, Dict, Optional
 
-from CommonClient import CommonContext, ClientCommandProcessor, get_base_parser, server_loop, logger, gui_enabled
+from CommonClient import CommonContext, ClientCommandProcessor, WatcherScheduler, get_base_parser, server_loop, \
+    logger, gui_enabled
 import Patch
 import Utils
 
@@ -38,6 +39,11 @@ class BizHawkClientCommandProcessor(ClientCommandProcessor):
             elif self.ctx.bizhawk_ctx.connection_status == ConnectionStatus.CONNECTED:
                 logger.info("BizHawk Connection Status: Connected")
 
+    def _cmd_polling(self):
+        """Shows how often BizHawk is polled and how long each poll takes"""
+        if isinstance(self.ctx, BizHawkClientContext):
+            logger.info(self.ctx.watcher_scheduler.get_stats())
+
 
 class BizHawkClientContext(CommonContext):
     command_processor = BizHawkClientCommandProcessor
@@ -49,7 +55,9 @@ class BizHawkClientContext(CommonContext):
     bizhawk_ctx: BizHawkContext
 
     watcher_timeout: float
-    """The maximum amount of time the game watcher loop will wait for an update from the server before executing"""
+    """The maximum amount of time the game watcher loop will wait for an update from the server before executing.
+    While nothing the handler reads or writes changes, the wait backs off up to `watcher_scheduler.max_interval`."""
+    watcher_scheduler: WatcherScheduler
 
     def __init__(self, server_address: Optional[str], password: Optional[str]):
         super().__init__(server_address, password)
@@ -58,6 +66,7 @@ class BizHawkClientContext(CommonContext):
         self.client_handler = None
         self.bizhawk_ctx = BizHawkContext()
         self.watcher_timeout = 0.5
+        self.watcher_scheduler = WatcherScheduler(self.watcher_timeout, 1.0)
 
     def make_gui(self):
         ui = super().make_gui()
@@ -109,12 +118,9 @@ async def _game_watcher(ctx: BizHawkClientContext):
     showed_no_handler_message = False
 
     while not ctx.exit_event.is_set():
-        try:
-            await asyncio.wait_for(ctx.watcher_event.wait(), ctx.watcher_timeout)
-        except asyncio.TimeoutError:
-            pass
-
-        ctx.watcher_event.clear()
+        # handlers may change watcher_timeout at any time
+        ctx.watcher_scheduler.min_interval = ctx.watcher_timeout
+        await ctx.watcher_scheduler.wait(ctx.watcher_event)
 
         try:
             if ctx.bizhawk_ctx.connection_status == ConnectionStatus.NOT_CONNECTED:
@@ -196,7 +202,9 @@ async def _game_watcher(ctx: BizHawkClientContext):
             ctx.auth_status = AuthStatus.NOT_AUTHENTICATED
 
         # Call the handler's game watcher
+        ctx.bizhawk_ctx.snapshot = 0
         await ctx.client_handler.game_watcher(ctx)
+        ctx.watcher_scheduler.report(ctx.bizhawk_ctx.snapshot)
 
 
 async def _run_game(rom: str):
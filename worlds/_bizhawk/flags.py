@@ -0,0 +1,47 @@
+"""
+A module for finding newly set location flags in memory read from the game, doing work proportional to the flags that
+changed instead of to all flags.
+"""
+
+import typing
+
+
+def iter_set_bits(value: int) -> typing.Iterator[int]:
+    """Yields the positions of the bits set in value, lowest first."""
+    while value:
+        lowest = value & -value
+        yield lowest.bit_length() - 1
+        value ^= lowest
+
+
+class LocationFlagDiff:
+    """Remembers the last data read for each region of memory and maps the flags that got set since to location ids.
+
+    Regions are any name the client chooses for a block of memory it reads every tick, like a save file's event flags.
+    Flags are numbered by bit within the region's data, so bit `b` (`1 << b`) of byte `i` is flag `i * 8 + b`.
+
+    The first update of a region reports every flag that is set, as does the first update after `reset`. Reset when
+    connecting to a slot, so flags that were already set get sent to the new slot."""
+    _region_flags: typing.Dict[str, typing.Dict[int, int]]
+    _snapshots: typing.Dict[str, int]
+
+    def __init__(self, location_flags: typing.Mapping[int, typing.Tuple[str, int]]) -> None:
+        """location_flags maps location ids to the (region, flag) that is set when the location is checked"""
+        self._region_flags = {}
+        for location_id, (region, flag) in location_flags.items():
+            self._region_flags.setdefault(region, {})[flag] = location_id
+        self._snapshots = {}
+
+    def update(self, region: str, data: bytes) -> typing.List[int]:
+        """Stores data as the region's new snapshot and returns the location ids of the flags set since the last one."""
+        new = int.from_bytes(data, "little")
+        old = self._snapshots.get(region, 0)
+        self._snapshots[region] = new
+        if new == old:
+            return []
+        flags = self._region_flags.get(region, {})
+        return [flags[flag] for flag in iter_set_bits(new & ~old) if flag in flags]
+
+    def reset(self) -> None:
+        """Forgets all snapshots, so the next update of each region reports all set flags again."""
+        self._snapshots.clear()
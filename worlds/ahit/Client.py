@@ -87,7 +87,7 @@ class AHITContext(CommonContext):
         self.server_msgs.append(encode([msg]))
 
         if self.ui:
-            self.ui.print_json(args["data"])
+            self.ui.print_json(args["data"], args.get("type", ""))
         else:
             text = self.jsontotextparser(args["data"])
             logger.info(text)
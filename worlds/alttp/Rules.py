@@ -1126,7 +1126,7 @@ def set_trock_key_rules(world, player):
         set_rule(world.get_entrance(entrance, player), lambda state: False)
 
     all_state = world.get_all_state(use_cache=False)
-    all_state.reachable_regions[player] = set()  # wipe reachable regions so that the locked doors actually work
+    all_state.reachable_regions[player].clear()  # wipe reachable regions so that the locked doors actually work
     all_state.stale[player] = True
 
     # Check if each of the four main regions of the dungoen can be reached. The previous code section prevents key-costing moves within the dungeon.
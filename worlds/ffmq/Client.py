@@ -65,12 +65,13 @@ class FFMQClient(SNIClient):
         return True
 
     async def game_watcher(self, ctx):
-        from SNIClient import snes_buffered_write, snes_flush_writes, snes_read
+        from SNIClient import snes_buffered_write, snes_flush_writes, snes_read_batch
 
-        check_1 = await snes_read(ctx, 0xF53749, 1)
-        received = await snes_read(ctx, RECEIVED_DATA[0], RECEIVED_DATA[1])
-        data = await snes_read(ctx, READ_DATA_START, READ_DATA_END - READ_DATA_START)
-        check_2 = await snes_read(ctx, 0xF53749, 1)
+        reads = await snes_read_batch(ctx, ((0xF53749, 1), RECEIVED_DATA,
+                                            (READ_DATA_START, READ_DATA_END - READ_DATA_START), (0xF53749, 1)))
+        if reads is None:
+            return
+        check_1, received, data, check_2 = reads
         if check_1 != b'\x01' or check_2 != b'\x01':
             return
 
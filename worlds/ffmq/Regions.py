@@ -33,10 +33,14 @@ def process_rules(spot, access):
     add_rule(spot, lambda state: state.has_all(access, spot.player))
 
 
+class FFMQRegion(Region):
+    __slots__ = ("links", "id")
+
+
 def create_region(world: MultiWorld, player: int, name: str, room_id=None, locations=None, links=None):
     if links is None:
         links = []
-    ret = Region(name, player, world)
+    ret = FFMQRegion(name, player, world)
     if locations:
         for location in locations:
             location.parent_region = ret
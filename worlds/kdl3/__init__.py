@@ -69,6 +69,7 @@ class KDL3World(World):
     item_name_groups = item_names
     web = KDL3WebWorld()
     settings: ClassVar[KDL3Settings]
+    output_process_attributes = ("rom_name", "rom_name_available_event")
 
     def __init__(self, multiworld: MultiWorld, player: int):
         self.rom_name: bytes = bytes()
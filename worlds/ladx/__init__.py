@@ -78,6 +78,7 @@ class LinksAwakeningWorld(World):
     options_dataclass = LinksAwakeningOptions
     options: LinksAwakeningOptions
     settings: typing.ClassVar[LinksAwakeningSettings]
+    output_process_attributes = ()
     topology_present = True  # show path to required location checks in spoiler
 
     # ID of first item and location, could be hard-coded but code may be easier
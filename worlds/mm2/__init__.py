@@ -88,6 +88,7 @@ class MM2World(World):
 
     game = "Mega Man 2"
     settings: ClassVar[MM2Settings]
+    output_process_attributes = ("rom_name", "rom_name_available_event")
     options_dataclass = MM2Options
     options: MM2Options
     item_name_to_id = lookup_item_to_id
@@ -5,6 +5,7 @@ from base64 import b64encode
 from typing import TYPE_CHECKING, Dict, Tuple, List, Optional, Any
 from NetUtils import ClientStatus, color, NetworkItem
 from worlds._bizhawk.client import BizHawkClient
+from worlds._bizhawk.flags import LocationFlagDiff
 
 if TYPE_CHECKING:
     from worlds._bizhawk.context import BizHawkClientContext, BizHawkClientCommandProcessor
@@ -212,6 +213,8 @@ class MegaMan2Client(BizHawkClient):
     auto_heal: bool = False
     refill_queue: List[Tuple[MM2EnergyLinkType, int]] = []
     last_wily: Optional[int] = None  # default to wily 1
+    consumable_flags = LocationFlagDiff({location: ("consumables", offset * 8 + mask.bit_length() - 1)
+                                         for location, (offset, mask) in MM2_CONSUMABLE_TABLE.items()})
 
     async def validate_rom(self, ctx: "BizHawkClientContext") -> bool:
         from worlds._bizhawk import RequestFailedError, read
@@ -274,6 +277,7 @@ class MegaMan2Client(BizHawkClient):
             if f"MM2_LAST_WILY_{ctx.team}_{ctx.slot}" in args["keys"]:
                 self.last_wily = args["keys"][f"MM2_LAST_WILY_{ctx.team}_{ctx.slot}"]
         elif cmd == "Connected":
+            self.consumable_flags.reset()
             if self.energy_link:
                 ctx.set_notify(f"EnergyLink{ctx.team}")
                 if ctx.ui:
@@ -546,12 +550,9 @@ class MegaMan2Client(BizHawkClient):
                 if rbm_id not in ctx.checked_locations:
                     new_checks.append(rbm_id)
 
-        for consumable in MM2_CONSUMABLE_TABLE:
+        for consumable in self.consumable_flags.update("consumables", consumable_checks):
             if consumable not in ctx.checked_locations:
-                is_checked = consumable_checks[MM2_CONSUMABLE_TABLE[consumable][0]] \
-                             & MM2_CONSUMABLE_TABLE[consumable][1]
-                if is_checked:
-                    new_checks.append(consumable)
+                new_checks.append(consumable)
 
         for new_check_id in new_checks:
             ctx.locations_checked.add(new_check_id)
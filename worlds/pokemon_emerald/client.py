@@ -578,7 +578,7 @@ class PokemonEmeraldClient(BizHawkClient):
 
                 else:
                     # Very approximate "time since last loop", but extra delay is fine for this
-                    self.wonder_trade_cooldown_timer -= int(ctx.watcher_timeout * 1000)
+                    self.wonder_trade_cooldown_timer -= int(ctx.watcher_scheduler.interval * 1000)
 
     async def wonder_trade_acquire(self, ctx: "BizHawkClientContext", keep_trying: bool = False) -> Optional[dict]:
         """
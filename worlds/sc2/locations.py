@@ -7,7 +7,7 @@ from .options import (get_option_value, RequiredTactics,
 from .rules import SC2Logic
 from .mission_tables import SC2Mission
 
-from BaseClasses import Location
+from BaseClasses import Location, default_access_rule
 from worlds.AutoWorld import World
 
 if TYPE_CHECKING:
@@ -54,7 +54,7 @@ class LocationData(NamedTuple):
     name: str
     code: int
     type: LocationType
-    rule: Callable[['CollectionState'], bool] = Location.access_rule
+    rule: Callable[['CollectionState'], bool] = default_access_rule
     flags: LocationFlag = LocationFlag.NONE
 
 
@@ -63,7 +63,7 @@ def make_location_data(
     name: str,
     code: int,
     type: LocationType,
-    rule: Callable[['CollectionState'], bool] = Location.access_rule,
+    rule: Callable[['CollectionState'], bool] = default_access_rule,
     flags: LocationFlag = LocationFlag.NONE,
 ) -> LocationData:
     return LocationData(region, f'{region}: {name}', code, type, rule, flags)
@@ -40,7 +40,7 @@ class SMSNIClient(SNIClient):
     patch_suffix = [".apsm", ".apm3"]
 
     async def deathlink_kill_player(self, ctx):
-        from SNIClient import DeathState, snes_buffered_write, snes_flush_writes, snes_read
+        from SNIClient import DeathState, snes_buffered_write, snes_flush_writes, snes_read_multiple
         snes_buffered_write(ctx, WRAM_START + 0x09C2, bytes([1, 0]))  # set current health to 1 (to prevent saving with 0 energy)
         snes_buffered_write(ctx, WRAM_START + 0x0A50, bytes([255])) # deal 255 of damage at next opportunity
         if not ctx.death_link_allow_survive:
@@ -49,8 +49,8 @@ class SMSNIClient(SNIClient):
         await snes_flush_writes(ctx)
         await asyncio.sleep(1)
 
-        gamemode = await snes_read(ctx, WRAM_START + 0x0998, 1)
-        health = await snes_read(ctx, WRAM_START + 0x09C2, 2)
+        reads = await snes_read_multiple(ctx, ((WRAM_START + 0x0998, 1), (WRAM_START + 0x09C2, 2)))
+        gamemode, health = reads if reads is not None else (None, None)
         if health is not None:
             health = health[0] | (health[1] << 8)
         if not gamemode or gamemode[0] in SM_DEATH_MODES or (
@@ -88,12 +88,17 @@ class SMSNIClient(SNIClient):
 
 
     async def game_watcher(self, ctx):
-        from SNIClient import snes_buffered_write, snes_flush_writes, snes_read
+        from SNIClient import snes_buffered_write, snes_flush_writes, snes_read, snes_read_multiple
         if ctx.server is None or ctx.slot is None:
             # not successfully connected to a multiworld server, cannot process the game sending items
             return
 
-        gamemode = await snes_read(ctx, WRAM_START + 0x0998, 1)
+        # the receive queue write count is only ever written by the client, so it can be read with the rest up front
+        reads = await snes_read_multiple(ctx, ((WRAM_START + 0x0998, 1), (SM_SEND_QUEUE_RCOUNT, 4),
+                                               (SM_RECV_QUEUE_WCOUNT, 2)), max_gap=0x80)
+        if reads is None:
+            return
+        gamemode, data, recv_data = reads
         if "DeathLink" in ctx.tags and gamemode and ctx.last_death_link + 1 < time.time():
             currently_dead = gamemode[0] in SM_DEATH_MODES
             await ctx.handle_deathlink_state(currently_dead)
@@ -103,16 +108,18 @@ class SMSNIClient(SNIClient):
                 ctx.finished_game = True
             return
 
-        data = await snes_read(ctx, SM_SEND_QUEUE_RCOUNT, 4)
-        if data is None:
-            return
-
         recv_index = data[0] | (data[1] << 8)
         recv_item = data[2] | (data[3] << 8) # this is actually SM_SEND_QUEUE_WCOUNT
 
+        if recv_index < recv_item:
+            messages = await snes_read(ctx, SM_SEND_QUEUE_START + recv_index * 8, (recv_item - recv_index) * 8)
+            if messages is None:
+                return
+            first_index = recv_index
+
         while (recv_index < recv_item):
-            item_address = recv_index * 8
-            message = await snes_read(ctx, SM_SEND_QUEUE_START + item_address, 8)
+            item_address = (recv_index - first_index) * 8
+            message = messages[item_address:item_address + 8]
             item_index = (message[4] | (message[5] << 8)) >> 3
 
             recv_index += 1
@@ -128,11 +135,7 @@ class SMSNIClient(SNIClient):
                 f'New Check: {location} ({len(ctx.locations_checked)}/{len(ctx.missing_locations) + len(ctx.checked_locations)})')
             await ctx.send_msgs([{"cmd": 'LocationChecks', "locations": [location_id]}])
 
-        data = await snes_read(ctx, SM_RECV_QUEUE_WCOUNT, 2)
-        if data is None:
-            return
-
-        item_out_ptr = data[0] | (data[1] << 8)
+        item_out_ptr = recv_data[0] | (recv_data[1] << 8)
 
         from . import items_start_id
         from . import locations_start_id
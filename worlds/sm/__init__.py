@@ -102,6 +102,7 @@ class SMWorld(World):
     options: SMOptions
       
     settings: typing.ClassVar[SMSettings]
+    output_process_attributes = ("rom_name", "rom_name_available_event")
 
     item_name_to_id = {value.Name: items_start_id + value.Id for key, value in ItemManager.Items.items() if value.Id != None}
     location_name_to_id = {key: locations_start_id + value.Id for key, value in locationsDict.items() if value.Id != None}
@@ -58,6 +58,7 @@ class SMWWorld(World):
     game: str = "Super Mario World"
 
     settings: typing.ClassVar[SMWSettings]
+    output_process_attributes = ("rom_name", "rom_name_available_event")
 
     options_dataclass = SMWOptions
     options: SMWOptions
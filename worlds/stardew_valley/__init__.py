@@ -37,6 +37,7 @@ client_version = 0
 
 
 class StardewLocation(Location):
+    __slots__ = ()
     game: str = STARDEW_VALLEY
 
 
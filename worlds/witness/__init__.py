@@ -396,8 +396,9 @@ class WitnessLocation(Location):
     """
     Archipelago Location for The Witness
     """
+    __slots__ = ("entity_hex",)
     game: str = "The Witness"
-    entity_hex: int = -1
+    entity_hex: int
 
     def __init__(self, player: int, name: str, address: Optional[int], parent: Region, ch_hex: int = -1) -> None:
         super().__init__(player, name, address, parent)
@@ -58,6 +58,7 @@ class YoshisIslandWorld(World):
 
     web = YoshisIslandWeb()
     settings: typing.ClassVar[YoshisIslandSettings]
+    output_process_attributes = ("rom_name", "rom_name_available_event")
     # topology_present = True
 
     options_dataclass = YoshisIslandOptions
@@ -2,7 +2,7 @@ from typing import Set
 
 from .RulesData import location_rules
 from worlds.generic.Rules import set_rule
-from BaseClasses import Location, CollectionState
+from BaseClasses import Location, CollectionState, default_access_rule
 
 
 # TODO: implement Mapstone counting, Open, OpenWorld, connection rules
@@ -29,7 +29,7 @@ def add_or_rule_check_first(world, location: str, player: int, conditionsets):
             return
     rule = lambda state, conditionsets=conditionsets: any(
         oribf_has_all(state, conditionset, player) for conditionset in conditionsets)
-    if location.access_rule is Location.access_rule:
+    if location.access_rule is default_access_rule:
         location.access_rule = rule
     else:
         old_rule = location.access_rule